@@ -1,4 +1,6 @@
 #!/usr/bin/env python
+from __future__ import annotations
+
 
 __copyright__ = """
    pySART - Simplified AUTOSAR-Toolkit for Python.
@@ -41,35 +43,62 @@ __all__ = [
     "DB",
 ]
 
+import importlib
+import importlib.util
 import re
 import sys
 import typing
 import warnings
-from io import TextIOWrapper
+from functools import cache
+from io import StringIO, TextIOWrapper
 from pathlib import Path
 
+from pya2l.exceptions import MathError, RangeError, StructuralError
 
-try:
-    from rich.traceback import install
 
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+if typing.TYPE_CHECKING:
+    from pya2l import model
+    from pya2l.a2lparser import ProgressCallback
+    from pya2l.imex import (  # noqa: F401
+        export_a2l_db,
+        export_json,
+        export_json_dict,
+        open_a2l_database,
+        open_json_database,
+    )
+    from pya2l.import_cache import ImportCache
+    from pya2l.logger import Logger  # noqa: F401
+    from pya2l.templates import doTemplateFromText  # noqa: F401
+
+# Heavy parts (SQLAlchemy models, exporters, Mako, rich) are imported on first attribute access.
+_LAZY_ATTRIBUTES = {
+    "model": ("pya2l.model", None),
+    "ProgressCallback": ("pya2l.a2lparser", "ProgressCallback"),
+    "export_a2l_db": ("pya2l.imex", "export_a2l_db"),
+    "export_json": ("pya2l.imex", "export_json"),
+    "export_json_dict": ("pya2l.imex", "export_json_dict"),
+    "open_a2l_database": ("pya2l.imex", "open_a2l_database"),
+    "open_json_database": ("pya2l.imex", "open_json_database"),
+    "Logger": ("pya2l.logger", "Logger"),
+    "ImportCache": ("pya2l.import_cache", "ImportCache"),
+    "doTemplateFromText": ("pya2l.templates", "doTemplateFromText"),
+}
+
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
+pyver = sys.version_info
 
-import pya2l.model as model
-from pya2l.a2lparser import ProgressCallback
-from pya2l.exceptions import MathError, RangeError, StructuralError
-from pya2l.imex import export_a2l_db  # noqa: F401
-from pya2l.imex import export_json_dict  # noqa: F401
-from pya2l.imex import open_a2l_database  # noqa: F401
-from pya2l.imex import open_json_database  # noqa: F401
-from pya2l.logger import Logger
-from pya2l.templates import doTemplateFromText
 
+def _rich_excepthook(exc_type, exc_value, traceback) -> None:
+    """Install rich's exception handler when the first uncaught exception arrives, and let it handle that one."""
+    if sys.excepthook is _rich_excepthook:
+        from rich.traceback import install
+
+        install(show_locals=True, max_frames=3)
+    sys.excepthook(exc_type, exc_value, traceback)
 
-if RICH_AVAILABLE:
-    install(show_locals=True, max_frames=3)  # Install custom exception handler.
-pyver = sys.version_info
+
+if RICH_AVAILABLE and sys.excepthook is sys.__excepthook__:
+    sys.excepthook = _rich_excepthook  # Install custom exception handler.
 
 
 class InvalidA2LDatabase(Exception):
@@ -78,20 +107,90 @@ class InvalidA2LDatabase(Exception):
     pass
 
 
-a2l_logger = Logger("A2LDB", "INFO")
+@cache
+def _a2l_logger():
+    from pya2l.logger import Logger
+
+    return Logger("A2LDB", "INFO")
 
-if pyver.major == 3 and pyver.minor <= 9:
-    import pkg_resources
 
-    A2L_TEMPLATE = str(pkg_resources.resource_string("pya2l.cgen.templates", "a2l.tmpl"), encoding="utf8")
-else:
+@cache
+def _a2l_template() -> str:
     import importlib.resources
 
     with (importlib.resources.files("pya2l.cgen.templates") / "a2l.tmpl").open(encoding="utf8") as data:
-        A2L_TEMPLATE = data.read()
+        return data.read()
+
+
+@cache
+def _a2l_compiled_template(encoding: str) -> typing.Any:
+    from mako.template import Template
+
+    return Template(
+        text=_a2l_template(), output_encoding=encoding, format_exceptions=False
+    )  # nosec B702 — generates A2L plain-text, not HTML
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name == "a2l_logger":
+        value = _a2l_logger()
+    elif name == "A2L_TEMPLATE":
+        value = _a2l_template()
+    elif name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        module = importlib.import_module(module_name)
+        value = module if attribute is None else getattr(module, attribute)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {"a2l_logger", "A2L_TEMPLATE"})
 
 
 _BLANK_BLOCKS = re.compile(r"(\r?\n)[ \t]*(\r?\n){2,}")
+_LINE_BREAKS = re.compile("\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")  # Line boundaries of `str.splitlines()`.
+_BLANKS = " \t\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"  # Characters of `_BLANK_BLOCKS` and `_LINE_BREAKS` matches.
+EXPORT_CHUNK_SIZE = 1 << 16  # Characters `export_a2l()` collects before writing to the output.
+
+
+class _A2LWriter:
+    """Sink of the A2L template; text is written to `output` in chunks of about `chunk_size` characters.
+
+    The chunks are processed like ``_BLANK_BLOCKS.sub(r"\\1\\1", indentText(text))`` would process the
+    whole text: line breaks become ``\\n`` (the last one is dropped) and runs of blank lines are
+    collapsed to one. Neither a run nor a ``\\r\\n`` contains a non-blank character, so the text is
+    split after the last non-blank character of a chunk; the blank rest is held back for the next one.
+    """
+
+    def __init__(self, output: typing.Any, chunk_size: int = EXPORT_CHUNK_SIZE) -> None:
+        self.output = output
+        self.chunk_size = chunk_size
+        self._parts: list[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.chunk_size:
+            text = "".join(self._parts)
+            head = text.rstrip(_BLANKS)
+            rest = text[len(head) :]
+            self._parts = [rest]
+            self._size = len(rest)
+            self._write(head)
+
+    def close(self) -> None:
+        text = _LINE_BREAKS.sub("\n", "".join(self._parts))
+        self._parts = []
+        self._size = 0
+        self._write(text.removesuffix("\n"))
+
+    def _write(self, text: str) -> None:
+        if text:
+            self.output.write(_BLANK_BLOCKS.sub(r"\1\1", _LINE_BREAKS.sub("\n", text)))
 
 
 def _get_a2lparser_symbols():
@@ -102,11 +201,20 @@ def _get_a2lparser_symbols():
 
 def _render_a2l(session: model.SessionProxy, encoding: str) -> str:
     """Render the in-memory session as A2L text with minimal blank blocks."""
+    out = StringIO()
+    _write_a2l(session, out, encoding)
+    return out.getvalue()
 
-    namespace = dict(session=session, model=model)
-    rendered = doTemplateFromText(A2L_TEMPLATE, namespace, formatExceptions=False, encoding=encoding)
-    # Collapse runs of >=2 empty lines (with optional whitespace) to a single blank line.
-    return _BLANK_BLOCKS.sub(r"\1\1", rendered)
+
+def _write_a2l(session: model.SessionProxy, output: typing.Any, encoding: str, chunk_size: int = EXPORT_CHUNK_SIZE) -> None:
+    """Render the session as A2L text to `output` while the template is running, see `_A2LWriter`."""
+    from mako.runtime import Context
+
+    from pya2l import model
+
+    writer = _A2LWriter(output, chunk_size)
+    _a2l_compiled_template(encoding).render_context(Context(writer, session=session, model=model))
+    writer.close()
 
 
 def import_a2l(
@@ -121,6 +229,13 @@ def import_a2l(
     force_overwrite: bool = False,
     output_dir: str | Path | None = None,
     progress_callback: ProgressCallback | None = None,
+    engine: str = "orm",
+    token_buffer: str = "file",
+    workers: int = 1,
+    parse_ifdata: bool = False,
+    staging: str = "file",
+    vacuum: bool = False,
+    cache: ImportCache | str | Path | None = None,
 ) -> model.SessionProxy:
     """Import `.a2l` file to `.a2ldb` database.
 
@@ -158,6 +273,47 @@ def import_a2l(
         If provided, the database file will be created in this directory.
         Takes precedence over `local`. The directory must exist.
 
+    engine: str
+        "orm" (default): build one ORM instance per keyword and let the session flush them.
+        "bulk": write per-table row batches with Core ``executemany`` inserts -- considerably
+        faster on large files.
+        "stream": like "bulk", but MODULE children are written while the file is still being
+        parsed, so peak memory stays roughly constant as the file size grows.
+
+    token_buffer: str
+        Where the preprocessor keeps its intermediate token streams.
+        "file" (default): temporary files in the system temp directory.
+        "memory": in-memory buffers -- no temp file I/O at all.
+        "mmap": temporary files, read back through a memory mapping (very large files).
+
+    workers: int
+        Number of worker processes; values > 1 convert the MODULEs of the file in parallel
+        (one process per MODULE, rows are written by a single writer).
+        Requires `engine` "bulk" or "stream".
+        Every worker preprocesses and tokenizes the whole file again (the writer too, for the
+        PROJECT / MODULE skeleton), it only skips building the other MODULEs; so this pays off for
+        files with several large MODULEs, not for single-MODULE files.
+
+    parse_ifdata: bool
+        Parse every ``IF_DATA`` section once against the ``AML`` and store the result
+        (``IfData.parsed``); inspecting objects then reads the stored values instead of re-parsing.
+
+    staging: str
+        "file" (default): build the database directly in the ``.a2ldb`` file.
+        "memory": build it in RAM and write the file in one pass at the end
+        (SQLite online backup API); needs memory for the whole database. The gain depends on the storage:
+        little on fast local disks, more where many small writes are expensive (e.g. network drives).
+
+    vacuum: bool
+        Leave the ``.a2ldb`` with a compact, defragmented page layout (``VACUUM``; with
+        `staging` "memory" the file is written by ``VACUUM INTO`` instead of the backup API).
+
+    cache: ImportCache | str | Path | None
+        Import cache (:class:`pya2l.import_cache.ImportCache` or its directory); defaults to the
+        directory in the ``PYA2L_IMPORT_CACHE`` environment variable, if set.
+        If the A2L file, its ``/include`` files, `encoding` and the schema version match a cached
+        import, the cached database is copied instead of parsing the file.
+
     Returns
     -------
     SQLAlchemy session object.
@@ -184,6 +340,13 @@ def import_a2l(
         loglevel=loglevel,
         progress_bar=progress_bar,
         output_dir=output_dir,
+        engine=engine,
+        token_buffer=token_buffer,
+        workers=workers,
+        parse_ifdata=parse_ifdata,
+        staging=staging,
+        vacuum=vacuum,
+        cache=cache,
     )
     session = db.session
     session.commit()
@@ -210,7 +373,7 @@ def open_existing(file_name: str, loglevel: str = "INFO") -> model.SessionProxy:
     OSError
         If database already exists.
     """
-    from pathlib import Path
+    from pya2l import model
 
     _, path_components = _get_a2lparser_symbols()
     _, db_fn = path_components(in_memory=False, file_name=file_name)
@@ -255,14 +418,18 @@ def open_existing(file_name: str, loglevel: str = "INFO") -> model.SessionProxy:
                 ) from e
 
 
-def open_create(file_name: str, local: bool = False, encoding: str = "latin-1", loglevel: str = "INFO") -> model.SessionProxy:
-    """Open or create an A2LDB."""
-    from pathlib import Path
-
+def open_create(
+    file_name: str,
+    local: bool = False,
+    encoding: str = "latin-1",
+    loglevel: str = "INFO",
+    cache: ImportCache | str | Path | None = None,
+) -> model.SessionProxy:
+    """Open or create an A2LDB (`cache`: see :func:`import_a2l`)."""
     _, path_components = _get_a2lparser_symbols()
     a2l_fn, db_fn = path_components(in_memory=False, file_name=file_name)
     if not db_fn.exists():
-        return import_a2l(a2l_fn, local=local, encoding=encoding, loglevel=loglevel)
+        return import_a2l(a2l_fn, local=local, encoding=encoding, loglevel=loglevel, cache=cache)
     else:
         return open_existing(db_fn, loglevel)
 
@@ -271,21 +438,25 @@ def export_a2l(
     db_name: str, output: TextIOWrapper | str | typing.Any = sys.stdout, encoding: str = "latin1"
 ) -> None:  # noqa: UP007
     """
+    The text is written while it is rendered, in chunks of `EXPORT_CHUNK_SIZE` characters.
+
     Parameters
     ----------
     file_name: str
         Name of the A2L exported.
 
+    output: TextIO | str
+        Text stream (e.g. ``sys.stdout``) or name of the file to write.
+
     encoding: str
         File encoding like "latin-1" or "utf-8".
     """
     session = open_existing(db_name)
-    data = _render_a2l(session, encoding)
-    if isinstance(output, TextIOWrapper):
-        output.write(data)
+    if hasattr(output, "write"):
+        _write_a2l(session, output, encoding)
     else:
         with open(file=output, mode="w", encoding=encoding, newline="\n") as outf:
-            outf.write(data)
+            _write_a2l(session, outf, encoding)
 
 
 class DB:
@@ -305,7 +476,7 @@ class DB:
             stacklevel=2,
         )
         if loglevel:
-            a2l_logger.setLevel(loglevel)
+            _a2l_logger().setLevel(loglevel)
 
     @staticmethod
     def import_a2l(
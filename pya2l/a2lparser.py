@@ -19,6 +19,7 @@ from rich.progress import (
 )
 
 from pya2l import classes, model
+from pya2l.import_cache import ImportCache, resolve_cache
 from pya2l.logger import Logger
 from pya2l.utils import detect_encoding
 
@@ -328,6 +329,28 @@ ASSOC_MAP["root"]["Asap2Version"] = ("asap2version", False)
 ASSOC_MAP["root"]["Project"] = ("project", False)
 
 
+# Keywords without parameters, stored as boolean columns on their parent.
+FLAG_KEYWORDS = frozenset(
+    {
+        "ReadOnly",
+        "GuardRails",
+        "Discrete",
+        "ReadWrite",
+        "ConsistentExchange",
+        "StaticRecordLayout",
+        "StaticAddressOffsets",
+    }
+)
+
+IMPORT_ENGINES = ("orm", "bulk", "stream")
+
+# Backing store of the preprocessor's intermediate token streams.
+TOKEN_BUFFERS = ("file", "memory", "mmap")
+
+# Where the database is built: in the target file, or in RAM and then written to the file in one pass.
+IMPORT_STAGING = ("file", "memory")
+
+
 class FakeRoot:
     asap2version = None
     project = None
@@ -343,28 +366,30 @@ def update_tuple_table(tuple_table, rows: list, columns: list) -> list:
     return result
 
 
+VALUE_TABLE_MAP = {
+    "CompuTab": (model.CompuTab, model.CompuTabPair, "pairs", "numberValuePairs", ("inVal", "outVal")),
+    "CompuVtab": (model.CompuVtab, model.CompuVtabPair, "pairs", "numberValuePairs", ("inVal", "outVal")),
+    "CompuVtabRange": (
+        model.CompuVtabRange,
+        model.CompuVtabRangeTriple,
+        "triples",
+        "numberValueTriples",
+        ("inValMin", "inValMax", "outVal"),
+    ),
+    "VarForbiddenComb": (
+        model.VarForbiddenComb,
+        model.VarForbiddedCombPair,
+        "pairs",
+        "numberValuePairs",
+        ("criterionName", "criterionValue"),
+    ),
+}
+
+
 def update_tables(session, tables):
-    MAP = {
-        "CompuTab": (model.CompuTab, model.CompuTabPair, "pairs", "numberValuePairs", ("inVal", "outVal")),
-        "CompuVtab": (model.CompuVtab, model.CompuVtabPair, "pairs", "numberValuePairs", ("inVal", "outVal")),
-        "CompuVtabRange": (
-            model.CompuVtabRange,
-            model.CompuVtabRangeTriple,
-            "triples",
-            "numberValueTriples",
-            ("inValMin", "inValMax", "outVal"),
-        ),
-        "VarForbiddenComb": (
-            model.VarForbiddenComb,
-            model.VarForbiddedCombPair,
-            "pairs",
-            "numberValuePairs",
-            ("criterionName", "criterionValue"),
-        ),
-    }
     combinations = session.query(model.VarForbiddenComb).all()
     for table_type, name, values in tables:
-        master_table, tuple_table, assoc, counter, columns = MAP[table_type]
+        master_table, tuple_table, assoc, counter, columns = VALUE_TABLE_MAP[table_type]
         if table_type == "VarForbiddenComb":
             combi = combinations.pop(0)
             result = update_tuple_table(tuple_table, values, columns)
@@ -381,6 +406,38 @@ def update_tables(session, tables):
             session.add(inst)
 
 
+def store_parsed_ifdata(session, loglevel: str = "INFO", batch_size: int = 1000) -> int:
+    """Parse every IF_DATA section against the file's AML and store the result in ``IfData.parsed``.
+
+    Values are stored with :mod:`pya2l.aml.ifdata_codec`; sections that fail to parse are stored as
+    encoded ``None``, so they are not parsed again on access.
+    Returns the number of parsed sections.
+    """
+    from sqlalchemy import bindparam, select, update
+
+    from pya2l.aml import ifdata_codec
+    from pya2l.aml.ifdata_parser import NativeIfDataParser
+
+    parser = NativeIfDataParser(session, loglevel)
+    if not parser.root:
+        return 0
+    table = model.IfData.__table__
+    statement = update(table).where(table.c.rid == bindparam("_rid")).values(parsed=bindparam("_parsed"))
+    count = 0
+    # Keyset pages: only `batch_size` raw sections are held at a time, and no cursor on the table
+    # stays open while it is updated.
+    last_rid = 0
+    while chunk := session.execute(
+        select(table.c.rid, table.c.raw).where(table.c.rid > last_rid).order_by(table.c.rid).limit(batch_size)
+    ).all():
+        values = parser.parse_many([raw for _, raw in chunk])
+        count += sum(value is not None for value in values)
+        batch = [{"_rid": rid, "_parsed": ifdata_codec.encode(value)} for (rid, _), value in zip(chunk, values)]
+        session.execute(statement, batch)
+        last_rid = chunk[-1][0]
+    return count
+
+
 class A2LParser:
     def __init__(self, progress_callback: ProgressCallback | None = None) -> None:
         self.debug: bool = False
@@ -404,7 +461,23 @@ class A2LParser:
         loglevel: str = "INFO",
         progress_bar: bool = True,
         output_dir: str | Path | None = None,
+        engine: str = "orm",
+        token_buffer: str = "file",
+        workers: int = 1,
+        parse_ifdata: bool = False,
+        staging: str = "file",
+        vacuum: bool = False,
+        cache: ImportCache | str | Path | None = None,
     ) -> model.A2LDatabase:
+        if engine not in IMPORT_ENGINES:
+            raise ValueError(f"engine must be one of {IMPORT_ENGINES!r}, got {engine!r}.")
+        if workers > 1 and engine == "orm":
+            raise ValueError("workers > 1 requires engine 'bulk' or 'stream'.")
+        parallel = workers > 1
+        if token_buffer not in TOKEN_BUFFERS:
+            raise ValueError(f"token_buffer must be one of {TOKEN_BUFFERS!r}, got {token_buffer!r}.")
+        if staging not in IMPORT_STAGING:
+            raise ValueError(f"staging must be one of {IMPORT_STAGING!r}, got {staging!r}.")
         loglevel = loglevel.upper()
         effective_progress = progress_bar and sys.stderr.isatty() and loglevel not in ("ERROR", "CRITICAL")
         self.silent: bool = not effective_progress
@@ -418,22 +491,55 @@ class A2LParser:
                     pass  # nosec
             elif db_fn.exists():
                 raise OSError(f"file {db_fn!r} already exists.")
+        cache = resolve_cache(cache)
+        if cache is not None:
+            start_time = perf_counter()
+            cache_key = cache.key(a2l_fn, encoding, parse_ifdata=parse_ifdata)
+            db = cache.restore(cache_key, str(db_fn))
+            if db is not None:
+                self.db = db
+                self.encoding = encoding
+                self.logger.info(
+                    f'Restored "{a2l_fn!s}" ==> DB "{db_fn!s}" from cache "{cache.directory!s}" [{perf_counter() - start_time:.2f}s].'
+                )
+                return self.db
         if not encoding:
             self.logger.info("Detecting encoding...")
             encoding = detect_encoding(file_name=a2l_fn)
         self.encoding = encoding
         start_time = perf_counter()
-        self.db: model.A2LDatabase = model.A2LDatabase(str(db_fn), debug=self.debug)
+        staged = staging == "memory" and not in_memory
+        self.db: model.A2LDatabase = model.A2LDatabase(":memory:" if staged else str(db_fn), debug=self.debug)
         # self.db.session.commit()
-        self.logger.info(f'Importing "{a2l_fn!s}" [{encoding}] ==> DB "{db_fn!s}".')
+        self.logger.info(f'Importing "{a2l_fn!s}" [{encoding}] ==> DB "{db_fn!s}"{" (staged in memory)" if staged else ""}.')
+        importer = None
+        if engine != "orm":
+            from pya2l.bulk_import import BulkImporter
+
+            importer = BulkImporter(self.db.session, encoding=self.encoding, progress=self._count_keyword)
+        self.counter = 0
         try:
 
             gc.collect()  # Free accumulated cyclic garbage before C++ memory allocation
             ext = _get_parser_ext()
-            keyword_counter, values, tables, aml_data = ext.parse(str(a2l_fn), encoding, loglevel)
+            if parallel:
+                # Skeleton only (PROJECT / HEADER / MODULE shells); MODULE children are parsed by the workers.
+                keyword_counter, values, tables, aml_data = ext.parse_stream(str(a2l_fn), encoding, loglevel, None, token_buffer)
+            elif engine == "stream":
+                # Keyword total is unknown up-front; MODULE children are written while parsing.
+                self._setup_progress(None)
+                with self.progress_bar:
+                    keyword_counter, values, tables, aml_data = ext.parse_stream(
+                        str(a2l_fn), encoding, loglevel, importer.add_chunk, token_buffer
+                    )
+                    importer.run(values, tables)
+            else:
+                keyword_counter, values, tables, aml_data = ext.parse(str(a2l_fn), encoding, loglevel, token_buffer)
         except Exception as e:
             self.logger.error(f"Failed to parse {a2l_fn!r}: {e}")
             self.logger.error(traceback.format_exc())
+            if engine == "stream" and not parallel:
+                self.db.close()
             try:
                 unlink(str(db_fn))
             except Exception:  # nosec B110 — best-effort cleanup of incomplete .a2ldb on error
@@ -444,7 +550,36 @@ class A2LParser:
             aml_section.text = aml_data.text
             aml_section.parsed = aml_data.parsed
         self.db.session.add(aml_section)
-        self.counter = 0
+        if parallel or engine != "stream":
+            self._setup_progress(keyword_counter)
+            with self.progress_bar:
+                if parallel:
+                    importer.run_parallel(str(a2l_fn), values, tables, workers, token_buffer)
+                elif engine == "bulk":
+                    importer.run(values, tables)
+                else:
+                    self.traverse(values, FakeRoot(), None, False)
+        self.db.session.commit()
+        if engine == "orm":
+            update_tables(self.db.session, tables)
+            self.db.session.commit()
+        if parse_ifdata:
+            count = store_parsed_ifdata(self.db.session, loglevel)
+            self.db.session.commit()
+            self.logger.info(f"Parsed {count} IF_DATA sections.")
+        if staged:
+            self.db.save_as(str(db_fn), vacuum=vacuum)
+            self.db.close()
+            self.db = model.A2LDatabase(str(db_fn), debug=self.debug)
+        elif vacuum and not in_memory:
+            self.db.vacuum()
+        if cache is not None:
+            cache.store(cache_key, self.db)
+        self.logger.info(f"Done. Elapsed time [{perf_counter() - start_time:.2f}s].")
+        return self.db
+
+    def _setup_progress(self, keyword_counter: int | None) -> None:
+        """Create the progress bar and choose the flush interval (`advance`)."""
         progress_columns = (
             SpinnerColumn(style="white"),
             "[progress.description]{task.description}",
@@ -459,7 +594,9 @@ class A2LParser:
         if not self.silent:
             self.task = self.progress_bar.add_task("[blue]writing to DB...", total=keyword_counter)
         # Adaptive flush strategy: balance memory usage and performance across file sizes
-        if keyword_counter < 10000:
+        if keyword_counter is None:
+            self.advance = 1000  # Streaming: total not known in advance
+        elif keyword_counter < 10000:
             self.advance = 100  # Small files: flush often to limit session overhead
         elif keyword_counter < 100000:
             # Medium files: scale from 200 to 500 based on size
@@ -468,29 +605,26 @@ class A2LParser:
             # Large files: use max of 1000 or 1% to avoid over-flushing
             self.advance = max(1000, keyword_counter // 100)
         if self.progress_callback is not None:
-            self.progress_callback.set_total(keyword_counter)
+            self.progress_callback.set_total(keyword_counter or 0)
             self.progress_callback.set_advance(self.advance)
-        fr = FakeRoot()
-        with self.progress_bar:
-            self.traverse(values, fr, None, False)
-        self.db.session.commit()
-        update_tables(self.db.session, tables)
-        self.db.session.commit()
-        self.logger.info(f"Done. Elapsed time [{perf_counter() - start_time:.2f}s].")
-        return self.db
 
-    def traverse(self, tree: typing.Any, parent: typing.Any, attr: str | None, multiple: bool, level: int = 0) -> None:
+    def _count_keyword(self) -> bool:
+        """Count a visited keyword; returns True every `advance` keywords (after updating progress)."""
         self.counter += 1
+        if not self.silent and self.counter % self.advance == 0:
+            self.progress_bar.update(self.task, advance=self.advance)
+            if self.progress_callback is not None:
+                self.progress_callback.step()
+            return True
+        return False
+
+    def traverse(self, tree: typing.Any, parent: typing.Any, attr: str | None, multiple: bool, level: int = 0) -> None:
         inst = None
         mult: list = []
         name = tree.get_name()
 
-        if not self.silent and self.counter % self.advance == 0:
+        if self._count_keyword():
             self.db.session.flush()
-            self.progress_bar.update(self.task, advance=self.advance)
-            if self.progress_callback is not None:
-                self.progress_callback.step()
-            # db.session.commit()
         if name != "root":
             table = KW_MAP[name]
             zipper = ZIPPER_MAP[name]
@@ -508,15 +642,7 @@ class A2LParser:
             if_data = self._decode_if_data_sections(raw_if_data)
 
             values = zipper(params, mult)
-            if name not in {
-                "ReadOnly",
-                "GuardRails",
-                "Discrete",
-                "ReadWrite",
-                "ConsistentExchange",
-                "StaticRecordLayout",
-                "StaticAddressOffsets",
-            }:
+            if name not in FLAG_KEYWORDS:
                 inst = table(**values)
                 if if_data:
                     # print(parent, table, params, if_data)
@@ -548,21 +674,24 @@ class A2LParser:
             self.db.session.add(inst)
 
     def _decode_if_data_sections(self, sections: typing.Any) -> list[str]:
-        if not sections:
-            return []
-        encoding = getattr(self, "encoding", "latin-1")
-        decoded = []
-        for section in sections:
-            if section is None:
-                continue
-            if isinstance(section, bytes):
-                try:
-                    decoded.append(section.decode(encoding))
-                except UnicodeDecodeError:
-                    decoded.append(section.decode(encoding, errors="replace"))
-            else:
-                decoded.append(section)
-        return decoded
+        return decode_if_data_sections(sections, getattr(self, "encoding", "latin-1"))
+
+
+def decode_if_data_sections(sections: typing.Any, encoding: str) -> list[str]:
+    if not sections:
+        return []
+    decoded = []
+    for section in sections:
+        if section is None:
+            continue
+        if isinstance(section, bytes):
+            try:
+                decoded.append(section.decode(encoding))
+            except UnicodeDecodeError:
+                decoded.append(section.decode(encoding, errors="replace"))
+        else:
+            decoded.append(section)
+    return decoded
 
 
 def enforce_suffix(pth: Path, suffix: str):
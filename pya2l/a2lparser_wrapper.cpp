@@ -6,6 +6,7 @@
 #include <sstream>
 
 #include "a2lparser.hpp"
+#include "ifdata_decoder.hpp"
 #include "parser.hpp"
 #include "preprocessor.hpp"
 #include "sysconsts.hpp"
@@ -46,28 +47,10 @@ inline auto unicode_decode(std::string_view value, const char * encoding) -> py:
     return py::reinterpret_steal<py::str>(py_s);
 }
 
-auto parse(const std::string& file_name, const std::string& encoding, const std::string& log_level) -> std::tuple<std::size_t, ValueContainer, std::vector<A2LParser::value_table_t>, AmlData> {
-	auto logger = create_logger("a2l", convert_loglevel(log_level));
-	Preprocessor p{ convert_loglevel(log_level) };
+/// Decode the string cells of COMPU_TAB / COMPU_VTAB / ... value tables.
+auto convert_tables(const std::vector<A2LParser::value_table_t>& raw_tables, const std::string& encoding) -> std::vector<A2LParser::value_table_t> {
 	std::vector<A2LParser::value_table_t> converted_tables{};
 
-    std::chrono::steady_clock::time_point start1 = std::chrono::steady_clock::now();
-    const auto res                   = p.process(file_name, encoding);
-    const auto [fns, linemap, ifdr] = res;
-    p.finalize();
-    std::chrono::steady_clock::time_point stop1 = std::chrono::steady_clock::now();
-    logger->info("Elapsed Time: {}[s]", (std::chrono::duration_cast<std::chrono::milliseconds>(stop1 - start1).count()) / 1000.0);
-
-    std::chrono::steady_clock::time_point start2 = std::chrono::steady_clock::now();
-	logger->info("Start parsing...");
-    auto parser = A2LParser(res, fns.a2l, encoding, convert_loglevel(log_level));
-    auto counter = parser.get_keyword_counter();
-    // Move out values and tables to avoid deep-copying the entire tree.
-    auto values = parser.take_values();
-    auto raw_tables = parser.take_tables();
-    std::chrono::steady_clock::time_point stop2 = std::chrono::steady_clock::now();
-    logger->info("Elapsed Time: {}[s]", (std::chrono::duration_cast<std::chrono::milliseconds>(stop2 - start2).count()) / 1000.0);
-    logger->info("Number of keywords: {}", counter);
 	for (const auto&[tp, name, rows]: raw_tables) {
 		const auto& tpt = unicode_decode(tp, encoding.c_str());
 		const auto& namet = unicode_decode(name, encoding.c_str());
@@ -85,7 +68,32 @@ auto parse(const std::string& file_name, const std::string& encoding, const std:
 		}
 		converted_tables.emplace_back(std::move(tpt), std::move(namet), std::move(result));
 	}
-	auto aml_data = parse_aml(fns.aml);
+	return converted_tables;
+}
+
+auto parse(const std::string& file_name, const std::string& encoding, const std::string& log_level, const std::string& token_buffer) -> std::tuple<std::size_t, ValueContainer, std::vector<A2LParser::value_table_t>, AmlData> {
+	auto logger = create_logger("a2l", convert_loglevel(log_level));
+	Preprocessor p{ convert_loglevel(log_level), buffer_mode_from_string(token_buffer) };
+
+    std::chrono::steady_clock::time_point start1 = std::chrono::steady_clock::now();
+    const auto res                   = p.process(file_name, encoding);
+    const auto [fns, linemap, ifdr] = res;
+    p.finalize();
+    std::chrono::steady_clock::time_point stop1 = std::chrono::steady_clock::now();
+    logger->info("Elapsed Time: {}[s]", (std::chrono::duration_cast<std::chrono::milliseconds>(stop1 - start1).count()) / 1000.0);
+
+    std::chrono::steady_clock::time_point start2 = std::chrono::steady_clock::now();
+	logger->info("Start parsing...");
+    auto parser = A2LParser(res, p.a2l_source(), encoding, convert_loglevel(log_level));
+    auto counter = parser.get_keyword_counter();
+    // Move out values and tables to avoid deep-copying the entire tree.
+    auto values = parser.take_values();
+    auto raw_tables = parser.take_tables();
+    std::chrono::steady_clock::time_point stop2 = std::chrono::steady_clock::now();
+    logger->info("Elapsed Time: {}[s]", (std::chrono::duration_cast<std::chrono::milliseconds>(stop2 - start2).count()) / 1000.0);
+    logger->info("Number of keywords: {}", counter);
+	auto converted_tables = convert_tables(raw_tables, encoding);
+	auto aml_data = parse_aml_text(p.aml_text(), fns.aml);
 
     return {counter, std::move(values), std::move(converted_tables), std::move(aml_data)};
 }
@@ -94,20 +102,55 @@ auto parse(const std::string& file_name, const std::string& encoding, const std:
 /// Accumulated SQLAlchemy session cycles (held by Python's GC) can exhaust the
 /// process heap on memory-constrained CI runners.  A single PyGC_Collect() call
 /// usually reclaims enough memory for the retry to succeed.
-auto parse_with_gc_retry(const std::string& file_name, const std::string& encoding, const std::string& log_level)
+auto parse_with_gc_retry(const std::string& file_name, const std::string& encoding, const std::string& log_level, const std::string& token_buffer)
     -> std::tuple<std::size_t, ValueContainer, std::vector<A2LParser::value_table_t>, AmlData>
 {
     try {
-        return parse(file_name, encoding, log_level);
+        return parse(file_name, encoding, log_level, token_buffer);
     } catch (const std::bad_alloc&) {
         // Trigger Python's cyclic garbage collector to reclaim SQLAlchemy session
         // cycles that CPython's reference counter alone cannot free.  This releases
         // the heap pressure so the subsequent retry can allocate successfully.
         PyGC_Collect();
-        return parse(file_name, encoding, log_level);
+        return parse(file_name, encoding, log_level, token_buffer);
     }
 }
 
+/// Streaming variant of `parse`: every completed MODULE child (CHARACTERISTIC, MEASUREMENT, ...) is passed
+/// to `callback(module_index, chunk, tables)` as soon as it is parsed and then dropped from the tree, so the
+/// returned tree only holds the PROJECT / HEADER / MODULE skeleton.
+/// `callback` may be None (children are discarded); `module` restricts the callback to one MODULE, the children
+/// of the other MODULEs are skipped at token level without being built.
+auto parse_stream(
+    const std::string& file_name, const std::string& encoding, const std::string& log_level, const py::object& callback,
+    const std::string& token_buffer, std::optional<std::size_t> module
+) -> std::tuple<std::size_t, ValueContainer, std::vector<A2LParser::value_table_t>, AmlData> {
+	auto logger = create_logger("a2l", convert_loglevel(log_level));
+	Preprocessor p{ convert_loglevel(log_level), buffer_mode_from_string(token_buffer) };
+
+    const auto res                   = p.process(file_name, encoding);
+    const auto [fns, linemap, ifdr] = res;
+    p.finalize();
+
+	logger->info("Start parsing (streaming)...");
+    auto sink = [&callback, &encoding, module](std::size_t module_index, ValueContainer&& chunk, std::vector<A2LParser::value_table_t>&& tables) {
+        if (callback.is_none() || (module && (*module != module_index))) {
+            return;
+        }
+        auto converted = convert_tables(tables, encoding);
+        tables.clear();
+        callback(module_index, py::cast(std::move(chunk)), std::move(converted));
+    };
+    auto parser = A2LParser(res, p.a2l_source(), encoding, convert_loglevel(log_level), sink, module);
+    auto counter = parser.get_keyword_counter();
+    auto values = parser.take_values();
+    auto converted_tables = convert_tables(parser.take_tables(), encoding);
+    logger->info("Number of keywords: {}", counter);
+	auto aml_data = parse_aml_text(p.aml_text(), fns.aml);
+
+    return {counter, std::move(values), std::move(converted_tables), std::move(aml_data)};
+}
+
 template<typename... Ts>
 struct Overload : Ts... {
     using Ts::operator()...;
@@ -121,9 +164,53 @@ Node unmarshal(const py::bytes& data) {
     return unm.run();
 }
 
+py::object ifdata_to_python(const IfDataValue& value) {
+    switch (value.kind) {
+        case IfDataValue::Kind::DICT:
+            {
+                py::dict result;
+                for (std::size_t idx = 0; idx < std::size(value.keys); ++idx) {
+                    result[py::str(value.keys[idx])] = ifdata_to_python(value.items[idx]);
+                }
+                return std::move(result);
+            }
+        case IfDataValue::Kind::LIST:
+            {
+                py::list result(std::size(value.items));
+                for (std::size_t idx = 0; idx < std::size(value.items); ++idx) {
+                    result[idx] = ifdata_to_python(value.items[idx]);
+                }
+                return std::move(result);
+            }
+        case IfDataValue::Kind::STRING:
+            return py::str(value.text);
+        case IfDataValue::Kind::INT:
+            return py::int_(value.integer);
+        case IfDataValue::Kind::BIG_INT:
+            {
+                auto result = PyLong_FromString(value.text.c_str(), nullptr, static_cast<int>(value.integer));
+                if (result == nullptr) {
+                    throw py::error_already_set();
+                }
+                return py::reinterpret_steal<py::object>(result);
+            }
+        case IfDataValue::Kind::FLOAT:
+            return py::float_(value.real);
+        case IfDataValue::Kind::BOOL:
+            return py::bool_(value.integer != 0);
+    }
+    return py::none();
+}
 
 PYBIND11_MODULE(a2lparser_ext, m) {
-    m.def("parse", &parse_with_gc_retry, py::return_value_policy::move);
+    m.def(
+        "parse", &parse_with_gc_retry, py::arg("file_name"), py::arg("encoding"), py::arg("log_level"),
+        py::arg("token_buffer") = "file", py::return_value_policy::move
+    );
+    m.def(
+        "parse_stream", &parse_stream, py::arg("file_name"), py::arg("encoding"), py::arg("log_level"), py::arg("callback"),
+        py::arg("token_buffer") = "file", py::arg("module") = py::none(), py::return_value_policy::move
+    );
     m.def("process_sys_consts", &process_sys_consts, py::return_value_policy::move);
 	m.def("unmarshal", &unmarshal, py::return_value_policy::move);
 	// m.def("ifdata_lexer", &ifdata_lexer, py::return_value_policy::move);
@@ -206,6 +293,45 @@ PYBIND11_MODULE(a2lparser_ext, m) {
             return result;
         });
 
+    py::class_<IfDataDecoder>(m, "IfDataDecoder")
+        .def(py::init([](const py::bytes& aml_parsed) { return std::make_unique<IfDataDecoder>(unmarshal(aml_parsed)); }),
+             py::arg("aml_parsed"))
+        .def_property_readonly("valid", &IfDataDecoder::valid)
+        .def(
+            "parse",
+            [](const IfDataDecoder& self, const std::string& section) {
+                IfDataValue result;
+                {
+                    py::gil_scoped_release release;
+                    result = self.parse(section);
+                }
+                return ifdata_to_python(result);
+            },
+            py::arg("section")
+        )
+        .def(
+            "parse_many",
+            [](const IfDataDecoder& self, const std::vector<std::string>& sections) {
+                // Decode the whole batch without the GIL; sections that don't parse come back as None.
+                std::vector<std::optional<IfDataValue>> values(std::size(sections));
+                {
+                    py::gil_scoped_release release;
+                    for (std::size_t idx = 0; idx < std::size(sections); ++idx) {
+                        try {
+                            values[idx] = self.parse(sections[idx]);
+                        } catch (const std::exception&) {
+                        }
+                    }
+                }
+                py::list result(std::size(values));
+                for (std::size_t idx = 0; idx < std::size(values); ++idx) {
+                    result[idx] = values[idx] ? ifdata_to_python(*values[idx]) : py::none();
+                }
+                return result;
+            },
+            py::arg("sections")
+        );
+
 	py::class_<Node>(m, "Node")
 		.def(py::init<>())
 		.def_property_readonly("value", &Node::value)
@@ -0,0 +1,154 @@
+"""
+IF_DATA Codec Module
+
+Compact binary encoding of parsed IF_DATA sections, as produced by
+:class:`pya2l.aml.ifdata_parser.IfDataParser` (nested dicts / lists of
+strings, numbers, booleans and None).
+
+Encoded values are stored in the ``IfData.parsed`` column at import time, so
+parsed IF_DATA can be read back without re-lexing the raw section text.
+
+Layout: ``MAGIC`` followed by one tagged value::
+
+    N / T / F           None / True / False
+    i <varint>          int (zig-zag encoded)
+    f <8 bytes>         float (IEEE-754, little endian)
+    s <varint> <utf-8>  str
+    b <varint> <bytes>  bytes
+    l <varint> values   list (tuples are encoded as lists)
+    m <varint> pairs    dict (key, value, key, value, ...)
+"""
+
+import struct
+from typing import Any
+
+
+MAGIC = b"IFD\x01"
+
+_DOUBLE = struct.Struct("<d")
+
+
+class IfDataCodecError(ValueError):
+    """Raised on malformed encoded data."""
+
+
+def is_encoded(data: bytes | None) -> bool:
+    """Check whether `data` was produced by :func:`encode` (and not e.g. legacy pickle data)."""
+    return bool(data) and bytes(data[: len(MAGIC)]) == MAGIC
+
+
+def encode(value: Any) -> bytes:
+    """Encode `value` (result of ``IfDataParser.parse``)."""
+    out = bytearray(MAGIC)
+    _encode(value, out)
+    return bytes(out)
+
+
+def decode(data: bytes) -> Any:
+    """Inverse of :func:`encode`."""
+    if not is_encoded(data):
+        raise IfDataCodecError("not an encoded IF_DATA value.")
+    data = bytes(data)
+    try:
+        value, pos = _decode(data, len(MAGIC))
+    except (IndexError, KeyError, struct.error, UnicodeDecodeError) as e:
+        raise IfDataCodecError(f"malformed IF_DATA value: {e!r}") from e
+    if pos != len(data):
+        raise IfDataCodecError("trailing bytes after IF_DATA value.")
+    return value
+
+
+def _write_varint(value: int, out: bytearray) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _encode(value: Any, out: bytearray) -> None:
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, int):
+        out += b"i"
+        _write_varint((value << 1) if value >= 0 else ((-value << 1) - 1), out)
+    elif isinstance(value, float):
+        out += b"f"
+        out += _DOUBLE.pack(value)
+    elif isinstance(value, str):
+        raw = value.encode("utf-8", "surrogatepass")
+        out += b"s"
+        _write_varint(len(raw), out)
+        out += raw
+    elif isinstance(value, (bytes, bytearray)):
+        out += b"b"
+        _write_varint(len(value), out)
+        out += value
+    elif isinstance(value, (list, tuple)):
+        out += b"l"
+        _write_varint(len(value), out)
+        for item in value:
+            _encode(item, out)
+    elif isinstance(value, dict):
+        out += b"m"
+        _write_varint(len(value), out)
+        for key, item in value.items():
+            _encode(key, out)
+            _encode(item, out)
+    else:
+        raise TypeError(f"cannot encode IF_DATA value of type {type(value).__name__!r}.")
+
+
+_CONSTANTS = {ord("N"): None, ord("T"): True, ord("F"): False}
+
+
+def _decode(data: bytes, pos: int) -> tuple[Any, int]:
+    tag = data[pos]
+    pos += 1
+    if tag == 0x73:  # s
+        length, pos = _read_varint(data, pos)
+        end = pos + length
+        if end > len(data):
+            raise IndexError("string exceeds data")
+        return data[pos:end].decode("utf-8", "surrogatepass"), end
+    elif tag == 0x69:  # i
+        value, pos = _read_varint(data, pos)
+        return (value >> 1) if not value & 1 else -((value + 1) >> 1), pos
+    elif tag == 0x6D:  # m
+        count, pos = _read_varint(data, pos)
+        result = {}
+        for _ in range(count):
+            key, pos = _decode(data, pos)
+            result[key], pos = _decode(data, pos)
+        return result, pos
+    elif tag == 0x6C:  # l
+        count, pos = _read_varint(data, pos)
+        items = []
+        for _ in range(count):
+            item, pos = _decode(data, pos)
+            items.append(item)
+        return items, pos
+    elif tag == 0x66:  # f
+        return _DOUBLE.unpack_from(data, pos)[0], pos + _DOUBLE.size
+    elif tag == 0x62:  # b
+        length, pos = _read_varint(data, pos)
+        end = pos + length
+        if end > len(data):
+            raise IndexError("bytes exceed data")
+        return data[pos:end], end
+    return _CONSTANTS[tag], pos
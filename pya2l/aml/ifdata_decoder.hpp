@@ -0,0 +1,870 @@
+/*
+    pySART - Simplified AUTOSAR-Toolkit for Python.
+
+    (C) 2026 by Christoph Schueler <cpu12.gems.googlemail.com>
+
+    All Rights Reserved
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to the Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+    s. FLOSS-EXCEPTION.txt
+*/
+
+#if !defined(__IFDATA_DECODER_HPP)
+    #define __IFDATA_DECODER_HPP
+
+    #include <algorithm>
+    #include <charconv>
+    #include <climits>
+    #include <deque>
+    #include <stdexcept>
+    #include <string>
+    #include <string_view>
+    #include <type_traits>
+    #include <unordered_map>
+    #include <vector>
+
+    #include "unmarshal.hpp"
+
+/*
+ * Native counterpart of `pya2l.aml.ifdata_lexer` / `pya2l.aml.ifdata_parser.IfDataParser`.
+ *
+ * The AML tree (`Node`) is compiled once into `IfDataDecoder::Element`s (references resolved);
+ * `parse()` decodes a raw IF_DATA section into the same dict / list structure as the Python parser,
+ * including its error recovery. Nothing in here touches Python objects, so sections can be decoded
+ * without holding the GIL.
+ */
+
+/*
+ * Decoded value; `DICT` with no items is the "no value" result of the Python parser (`{}`).
+ */
+struct IfDataValue {
+    enum class Kind : std::uint8_t {
+        DICT,
+        LIST,
+        STRING,
+        INT,
+        BIG_INT,  // Doesn't fit into `long long`: `text` holds the literal, `integer` the base.
+        FLOAT,
+        BOOL,
+    };
+
+    Kind                     kind{ Kind::DICT };
+    long long                integer{ 0 };
+    double                   real{ 0.0 };
+    std::string              text{};
+    std::vector<std::string> keys{};   // DICT
+    std::vector<IfDataValue> items{};  // DICT values, LIST
+
+    static IfDataValue make_bool(bool value) {
+        IfDataValue result;
+        result.kind    = Kind::BOOL;
+        result.integer = value;
+        return result;
+    }
+
+    static IfDataValue make_list(std::vector<IfDataValue>&& items) {
+        IfDataValue result;
+        result.kind  = Kind::LIST;
+        result.items = std::move(items);
+        return result;
+    }
+
+    static IfDataValue make_dict(std::string key, IfDataValue&& value) {
+        IfDataValue result;
+        result.keys.emplace_back(std::move(key));
+        result.items.emplace_back(std::move(value));
+        return result;
+    }
+
+    bool is_empty_dict() const noexcept {
+        return (kind == Kind::DICT) && items.empty();
+    }
+
+    // Python truthiness.
+    explicit operator bool() const noexcept {
+        switch (kind) {
+            case Kind::DICT:
+            case Kind::LIST:
+                return !items.empty();
+            case Kind::STRING:
+                return !text.empty();
+            case Kind::INT:
+            case Kind::BOOL:
+                return integer != 0;
+            case Kind::FLOAT:
+                return real != 0.0;
+            default:
+                return true;
+        }
+    }
+};
+
+class IfDataDecoder {
+   public:
+
+    enum class TokenType : std::uint8_t {
+        IDENT,
+        FLOAT,
+        INT,
+        STRING,
+        BEGIN,
+        END,
+    };
+
+    struct Token {
+        TokenType   type;
+        IfDataValue value;
+
+        // IDENT, STRING, BEGIN, END carry string values.
+        bool has_text(std::string_view text) const noexcept {
+            return (value.kind == IfDataValue::Kind::STRING) && (value.text == text);
+        }
+    };
+
+    explicit IfDataDecoder(const Node& aml_root) {
+        compile(aml_root);
+    }
+
+    // `false`: AML could not be used (the Python parser's `root is None`); `parse()` must not be called.
+    bool valid() const noexcept {
+        return m_valid;
+    }
+
+    /*
+     * Decode one IF_DATA section.
+     * Throws `std::runtime_error` where the Python parser raises `ParsingError`.
+     */
+    IfDataValue parse(std::string_view section) const {
+        State state{ lex(section) };
+
+        if ((!m_has_toplevel) || (std::size(state.tokens) <= 4)) {
+            return {};
+        }
+        match(state, TokenType::BEGIN);
+        match(state, TokenType::IDENT);
+        auto result = enter(state, m_toplevel);
+        match(state, TokenType::END);
+        match(state, TokenType::IDENT);
+        return result;
+    }
+
+    static std::vector<Token> lex(std::string_view text) {
+        std::vector<Token> result;
+        const auto         length = std::size(text);
+        std::size_t        pos    = 0;
+
+        while (pos < length) {
+            const auto ch = text[pos];
+
+            if (is_space(ch)) {
+                while ((pos < length) && is_space(text[pos])) {
+                    ++pos;
+                }
+                continue;
+            }
+            if ((ch == '/') && (pos + 1 < length)) {
+                if (text[pos + 1] == '*') {
+                    // `/\*.*?\*/` -- `.` doesn't match newlines.
+                    const auto close   = text.find("*/", pos + 2);
+                    const auto newline = text.find('\n', pos + 2);
+                    if ((close != std::string_view::npos) && ((newline == std::string_view::npos) || (newline > close))) {
+                        pos = close + 2;
+                        continue;
+                    }
+                } else if (text[pos + 1] == '/') {
+                    pos += 2;  // `//.*?` -- lazy, so only the slashes.
+                    continue;
+                }
+            }
+            if (ch == '"') {
+                const auto close = text.find('"', pos + 1);
+                if (close != std::string_view::npos) {
+                    result.push_back({ TokenType::STRING, make_string(text.substr(pos + 1, close - pos - 1)) });
+                    pos = close + 1;
+                    continue;
+                }
+            }
+            if (auto end = match_int(text, pos); end != 0) {
+                result.push_back({ TokenType::INT, make_int(text.substr(pos, end - pos)) });
+                pos = end;
+                continue;
+            }
+            if (auto end = match_float(text, pos); end != 0) {
+                result.push_back({ TokenType::FLOAT, make_float(text.substr(pos, end - pos)) });
+                pos = end;
+                continue;
+            }
+            if (text.substr(pos, 6) == "/begin") {
+                result.push_back({ TokenType::BEGIN, make_string("/begin") });
+                pos += 6;
+                continue;
+            }
+            if (text.substr(pos, 4) == "/end") {
+                result.push_back({ TokenType::END, make_string("/end") });
+                pos += 4;
+                continue;
+            }
+            if (auto end = match_ident(text, pos); end != 0) {
+                result.push_back({ TokenType::IDENT, make_string(text.substr(pos, end - pos)) });
+                pos = end;
+                continue;
+            }
+            // Invalid character: skip it (a whole UTF-8 sequence).
+            ++pos;
+            while ((pos < length) && ((static_cast<unsigned char>(text[pos]) & 0xC0) == 0x80)) {
+                ++pos;
+            }
+        }
+        return result;
+    }
+
+   private:
+
+    enum class Kind : std::uint8_t {
+        BLOCK,
+        TAGGED_STRUCT,
+        TAGGED_UNION,
+        STRUCT,
+        ENUMERATION,
+        MEMBER,
+        TAGGED_STRUCT_DEFINITION,
+        TAGGED_STRUCT_MEMBER,
+        PDT,
+        NULL_OBJECT,
+        REFERRER,
+    };
+
+    // `nullptr` stands for the Python parser's `None` (element that failed to convert).
+    struct Element {
+        Kind                                              kind;
+        std::string                                       name{};  // Type name, block tag, referrer identifier.
+        bool                                              multiple{ false };
+        const Element*                                    child{ nullptr };  // BLOCK type, MEMBER node, definitions.
+        std::vector<const Element*>                       members{};         // STRUCT
+        std::unordered_map<std::string, const Element*>   tags{};            // TAGGED_STRUCT, TAGGED_UNION
+        long long                                         category{ -1 };    // REFERRER
+        mutable const Element*                            target{ nullptr }; // REFERRER, resolved
+    };
+
+    struct State {
+        std::vector<Token> tokens;
+        std::size_t        pos{ 0 };
+        std::size_t        depth{ 0 };
+    };
+
+    struct EndOfInput : std::runtime_error {
+        EndOfInput() : std::runtime_error("Unexpected end of input") {
+        }
+    };
+
+    // Python stops at its recursion limit; so do we, instead of overflowing the stack.
+    static constexpr std::size_t MAX_DEPTH = 256;
+
+    ///////////////////////////////////////////////////////////////////////////////////////////
+    // Lexer helpers.
+    ///////////////////////////////////////////////////////////////////////////////////////////
+
+    static bool is_space(char ch) noexcept {
+        const auto uch = static_cast<unsigned char>(ch);
+        return (uch == ' ') || ((uch >= '\t') && (uch <= '\r')) || ((uch >= 0x1C) && (uch <= 0x1F));
+    }
+
+    static bool is_digit(char ch) noexcept {
+        return (ch >= '0') && (ch <= '9');
+    }
+
+    static bool is_hex_digit(char ch) noexcept {
+        return is_digit(ch) || ((ch >= 'a') && (ch <= 'f')) || ((ch >= 'A') && (ch <= 'F'));
+    }
+
+    static bool is_ident_start(char ch) noexcept {
+        return ((ch >= 'a') && (ch <= 'z')) || ((ch >= 'A') && (ch <= 'Z')) || (ch == '_');
+    }
+
+    static bool is_ident_char(char ch) noexcept {
+        return is_ident_start(ch) || is_digit(ch) || (ch == '.');
+    }
+
+    // `\w` -- non-ASCII characters are taken as letters.
+    static bool is_word(std::string_view text, std::size_t pos) noexcept {
+        if (pos >= std::size(text)) {
+            return false;
+        }
+        const auto ch = text[pos];
+        return is_ident_start(ch) || is_digit(ch) || (static_cast<unsigned char>(ch) >= 0x80);
+    }
+
+    // `(0x[0-9a-fA-F]+)|([+\-]?[0-9]+)`; returns end position or 0.
+    static std::size_t match_int(std::string_view text, std::size_t pos) noexcept {
+        const auto length = std::size(text);
+        if ((text.substr(pos, 2) == "0x") && (pos + 2 < length) && is_hex_digit(text[pos + 2])) {
+            auto end = pos + 2;
+            while ((end < length) && is_hex_digit(text[end])) {
+                ++end;
+            }
+            return end;
+        }
+        auto start = pos;
+        if ((text[start] == '+') || (text[start] == '-')) {
+            ++start;
+        }
+        auto end = start;
+        while ((end < length) && is_digit(text[end])) {
+            ++end;
+        }
+        return (end > start) ? end : 0;
+    }
+
+    // FLOAT pattern, as far as it can match after INT failed: `[+\-]?[.]\d+([eE][+\-]?\d+)?`.
+    static std::size_t match_float(std::string_view text, std::size_t pos) noexcept {
+        const auto length = std::size(text);
+        auto       end    = pos;
+        if ((text[end] == '+') || (text[end] == '-')) {
+            ++end;
+        }
+        if ((end + 1 >= length) || (text[end] != '.') || !is_digit(text[end + 1])) {
+            return 0;
+        }
+        ++end;
+        while ((end < length) && is_digit(text[end])) {
+            ++end;
+        }
+        if ((end < length) && ((text[end] == 'e') || (text[end] == 'E'))) {
+            auto exp = end + 1;
+            if ((exp < length) && ((text[exp] == '+') || (text[exp] == '-'))) {
+                ++exp;
+            }
+            if ((exp < length) && is_digit(text[exp])) {
+                while ((exp < length) && is_digit(text[exp])) {
+                    ++exp;
+                }
+                end = exp;
+            }
+        }
+        return end;
+    }
+
+    // `([a-zA-Z_][a-zA-Z_0-9.]*)\b` -- backtracks to the last word boundary.
+    static std::size_t match_ident(std::string_view text, std::size_t pos) noexcept {
+        if (!is_ident_start(text[pos])) {
+            return 0;
+        }
+        auto end = pos + 1;
+        while ((end < std::size(text)) && is_ident_char(text[end])) {
+            ++end;
+        }
+        for (; end > pos; --end) {
+            if (is_word(text, end - 1) != is_word(text, end)) {
+                return end;
+            }
+        }
+        return 0;
+    }
+
+    static IfDataValue make_string(std::string_view text) {
+        IfDataValue result;
+        result.kind = IfDataValue::Kind::STRING;
+        result.text = text;
+        return result;
+    }
+
+    static IfDataValue make_int(std::string_view text) {
+        IfDataValue result;
+        result.kind = IfDataValue::Kind::INT;
+        int  base   = 10;
+        auto digits = text;
+        bool negative{ false };
+
+        if (digits.substr(0, 2) == "0x") {
+            base = 16;
+            digits.remove_prefix(2);
+        } else if ((digits[0] == '+') || (digits[0] == '-')) {
+            negative = digits[0] == '-';
+            digits.remove_prefix(1);
+        }
+        unsigned long long value{ 0 };
+        const auto [ptr, ec] = std::from_chars(digits.data(), digits.data() + std::size(digits), value, base);
+        if ((ec == std::errc()) && (value <= static_cast<unsigned long long>(LLONG_MAX))) {
+            result.integer = negative ? -static_cast<long long>(value) : static_cast<long long>(value);
+        } else {
+            result.kind    = IfDataValue::Kind::BIG_INT;
+            result.text    = text;
+            result.integer = base;
+        }
+        return result;
+    }
+
+    static IfDataValue make_float(std::string_view text) {
+        IfDataValue result;
+        result.kind = IfDataValue::Kind::FLOAT;
+        if (text[0] == '+') {
+            text.remove_prefix(1);
+        }
+        std::from_chars(text.data(), text.data() + std::size(text), result.real);
+        return result;
+    }
+
+    ///////////////////////////////////////////////////////////////////////////////////////////
+    // Grammar compilation (`IfDataParser.traverse`, `create_ref_dict`, `toplevel_ifdata`).
+    ///////////////////////////////////////////////////////////////////////////////////////////
+
+    static bool truthy(const Node& node) {
+        return std::visit(
+            [](const auto& value) -> bool {
+                using T = std::decay_t<decltype(value)>;
+                if constexpr (std::is_same_v<T, std::monostate>) {
+                    return false;
+                } else if constexpr (std::is_same_v<T, std::string>) {
+                    return !value.empty();
+                } else {
+                    return value != 0;
+                }
+            },
+            node.value()
+        );
+    }
+
+    Element* make(Kind kind) {
+        return &m_elements.emplace_back(Element{ kind });
+    }
+
+    const Element* convert(const Node& node) {
+        try {
+            return convert_node(node);
+        } catch (const std::exception&) {
+            return nullptr;
+        }
+    }
+
+    const Element* convert_node(const Node& node) {
+        using AmlType = Node::AmlType;
+
+        switch (node.aml_type()) {
+            case AmlType::STRUCT:
+                {
+                    auto element  = make(Kind::STRUCT);
+                    element->name = std::get<std::string>(node.map().at("NAME").value());
+                    for (const auto& member : node.map().at("MEMBERS").list()) {
+                        element->members.push_back(convert(member));
+                    }
+                    return element;
+                }
+            case AmlType::MEMBER:
+                {
+                    auto element      = make(Kind::MEMBER);
+                    element->multiple = truthy(node.map().at("IS_BLOCK"));  // is_block, unused.
+                    element->child    = convert(node.map().at("NODE"));
+                    return element;
+                }
+            case AmlType::STRUCT_MEMBER:
+                {
+                    const auto& member  = node.map().at("MEMBER");
+                    auto        element = make(Kind::MEMBER);
+                    element->multiple   = truthy(member.map().at("IS_BLOCK"));
+                    element->child      = convert(member.map().at("NODE"));
+                    return element;
+                }
+            case AmlType::PDT:
+                {
+                    const auto type = std::get<long long>(node.map().at("TYPE").value());
+                    if ((type < 0) || (type > static_cast<long long>(AMLPredefinedTypeEnum::FLOAT16))) {
+                        return nullptr;
+                    }
+                    return make(Kind::PDT);
+                }
+            case AmlType::ENUMERATION:
+                {
+                    auto element  = make(Kind::ENUMERATION);
+                    element->name = std::get<std::string>(node.map().at("NAME").value());
+                    return element;
+                }
+            case AmlType::TAGGED_STRUCT:
+            case AmlType::TAGGED_UNION:
+                {
+                    auto element  = make((node.aml_type() == AmlType::TAGGED_STRUCT) ? Kind::TAGGED_STRUCT : Kind::TAGGED_UNION);
+                    element->name = std::get<std::string>(node.map().at("NAME").value());
+                    for (const auto& member : node.map().at("MEMBERS").list()) {
+                        const auto  tag        = std::get<std::string>(member.map().at("TAG").value());
+                        element->tags[tag]     = convert(member.map().at("MEMBER"));
+                    }
+                    return element;
+                }
+            case AmlType::TAGGED_STRUCT_MEMBER:
+                {
+                    auto element      = make(Kind::TAGGED_STRUCT_MEMBER);
+                    element->child    = convert(node.map().at("DEFINITION"));
+                    element->multiple = truthy(node.map().at("MULTIPLE"));
+                    return element;
+                }
+            case AmlType::TAGGED_STRUCT_DEFINITION:
+                {
+                    auto element      = make(Kind::TAGGED_STRUCT_DEFINITION);
+                    element->child    = convert(node.map().at("MEMBER"));
+                    element->multiple = truthy(node.map().at("MULTIPLE"));
+                    return element;
+                }
+            case AmlType::TAGGED_UNION_MEMBER:
+                return convert(node.map().at("MEMBER"));
+            case AmlType::BLOCK:
+                {
+                    auto element   = make(Kind::BLOCK);
+                    element->name  = std::get<std::string>(node.map().at("TAG").value());
+                    element->child = convert(node.map().at("TYPE"));
+                    return element;
+                }
+            case AmlType::REFERRER:
+                {
+                    const auto category = std::get<long long>(node.map().at("CATEGORY").value());
+                    if ((category < 0) || (category > static_cast<long long>(ReferrerType::TaggedUnionType))) {
+                        return nullptr;
+                    }
+                    auto element      = make(Kind::REFERRER);
+                    element->category = category;
+                    element->name     = std::get<std::string>(node.map().at("IDENTIFIER").value());
+                    return element;
+                }
+            case AmlType::NULL_NODE:
+                return make(Kind::NULL_OBJECT);
+            default:
+                return nullptr;
+        }
+    }
+
+    void compile(const Node& aml_root) {
+        std::vector<const Element*> members;
+        for (const auto& member : aml_root.map().at("MEMBERS").list()) {
+            members.push_back(convert(member));
+        }
+
+        // `create_ref_dict()`
+        std::unordered_map<long long, std::unordered_map<std::string, const Element*>> references;
+        for (const auto* member : members) {
+            if ((member != nullptr) && ((member->kind == Kind::BLOCK) || (member->kind == Kind::NULL_OBJECT))) {
+                continue;
+            }
+            if (member == nullptr) {
+                return;
+            }
+            ReferrerType category;
+            switch (member->kind) {
+                case Kind::STRUCT:
+                    category = ReferrerType::StructType;
+                    break;
+                case Kind::TAGGED_STRUCT:
+                    category = ReferrerType::TaggedStructType;
+                    break;
+                case Kind::TAGGED_UNION:
+                    category = ReferrerType::TaggedUnionType;
+                    break;
+                case Kind::ENUMERATION:
+                    category = ReferrerType::Enumeration;
+                    break;
+                default:
+                    return;  // Unsupported member type.
+            }
+            references[static_cast<long long>(category)][member->name] = member;
+        }
+
+        // `toplevel_ifdata()`
+        std::vector<const Element*> candidates;
+        bool                        has_blocks{ false };
+        for (const auto* member : members) {
+            if ((member == nullptr) || (member->kind != Kind::NULL_OBJECT)) {
+                candidates.push_back(member);
+                has_blocks = has_blocks || ((member != nullptr) && (member->kind == Kind::BLOCK));
+            }
+        }
+        if (!members.empty()) {
+            if (has_blocks) {
+                auto found = std::find_if(std::begin(candidates), std::end(candidates), [](const Element* member) {
+                    return (member != nullptr) && (member->kind == Kind::BLOCK) && (member->name == "IF_DATA");
+                });
+                if (found == std::end(candidates)) {
+                    return;
+                }
+                m_toplevel = (*found)->child;
+            } else if (std::size(candidates) == 1) {
+                m_toplevel = candidates[0];
+            } else {
+                return;
+            }
+            m_has_toplevel = true;
+        }
+
+        for (auto& element : m_elements) {
+            if (element.kind == Kind::REFERRER) {
+                if (auto category = references.find(element.category); category != std::end(references)) {
+                    if (auto target = category->second.find(element.name); target != std::end(category->second)) {
+                        element.target = target->second;
+                    }
+                }
+            }
+        }
+        m_valid = true;
+    }
+
+    ///////////////////////////////////////////////////////////////////////////////////////////
+    // Parser (`IfDataParser.enter()` and friends).
+    ///////////////////////////////////////////////////////////////////////////////////////////
+
+    static const Token& lookahead(const State& state, std::size_t n) {
+        const auto index = state.pos + n;
+        if (index >= std::size(state.tokens)) {
+            throw EndOfInput();
+        }
+        return state.tokens[index];
+    }
+
+    static const Token& current(const State& state) {
+        return lookahead(state, 0);
+    }
+
+    static void rewind(State& state, std::size_t n) noexcept {
+        state.pos = (state.pos > n) ? state.pos - n : 0;
+    }
+
+    // Expected token values are only checked for logging by the Python parser -- the stream position is what counts.
+    static void match(State& state, TokenType type) {
+        try {
+            if (current(state).type != type) {
+                // Try to recover by finding the next token of the expected type.
+                for (auto attempt = 0; attempt < 10; ++attempt) {
+                    ++state.pos;
+                    if (current(state).type == type) {
+                        break;
+                    }
+                }
+            }
+            current(state);
+            ++state.pos;
+        } catch (const EndOfInput&) {
+        }
+    }
+
+    IfDataValue enter(State& state, const Element* element) const {
+        if ((element != nullptr) && (element->kind == Kind::REFERRER)) {
+            element = element->target;
+            if (element == nullptr) {
+                // Python: `KeyError`, caught one level up.
+                throw std::runtime_error("Unresolved AML reference");
+            }
+        }
+        const auto depth = state.depth;
+        try {
+            if ((element == nullptr) || (depth >= MAX_DEPTH)) {
+                throw std::runtime_error("Unsupported AML element");
+            }
+            ++state.depth;
+            auto result = dispatch(state, *element);
+            state.depth = depth;
+            return result;
+        } catch (const std::exception&) {
+            state.depth = depth;
+            return {};
+        }
+    }
+
+    IfDataValue dispatch(State& state, const Element& element) const {
+        switch (element.kind) {
+            case Kind::BLOCK:
+                return block(state, element);
+            case Kind::TAGGED_STRUCT:
+                return tagged_struct(state, element);
+            case Kind::TAGGED_UNION:
+                return tagged_union(state, element);
+            case Kind::STRUCT:
+                return structure(state, element);
+            case Kind::ENUMERATION:
+            case Kind::PDT:
+                {
+                    auto value = current(state).value;
+                    ++state.pos;
+                    return value;
+                }
+            case Kind::MEMBER:
+                return enter(state, element.child);
+            case Kind::TAGGED_STRUCT_DEFINITION:
+                return tagged_struct_definition(state, element);
+            case Kind::NULL_OBJECT:
+                return {};
+            default:
+                throw std::runtime_error("Unsupported AML element");
+        }
+    }
+
+    IfDataValue block(State& state, const Element& element) const {
+        match(state, TokenType::BEGIN);
+        const auto& token = current(state);
+        if (token.type != TokenType::IDENT) {
+            throw std::runtime_error("Expected IDENT");
+        }
+        ++state.pos;
+        auto result = enter(state, element.child);
+        match(state, TokenType::END);
+        match(state, TokenType::IDENT);
+        return result;
+    }
+
+    IfDataValue tagged_struct(State& state, const Element& element) const {
+        std::vector<std::string>              keys;
+        std::vector<std::vector<IfDataValue>> values;
+
+        auto append = [&keys, &values](const std::string& key, IfDataValue&& value) {
+            auto found = std::find(std::begin(keys), std::end(keys), key);
+            if (found == std::end(keys)) {
+                keys.push_back(key);
+                values.emplace_back().push_back(std::move(value));
+            } else {
+                values[std::distance(std::begin(keys), found)].push_back(std::move(value));
+            }
+        };
+
+        while (true) {
+            const auto& cur = current(state);
+            if (cur.type == TokenType::END) {
+                break;
+            }
+            const auto& token = (cur.type == TokenType::BEGIN) ? lookahead(state, 1) : cur;
+            if (token.value.kind != IfDataValue::Kind::STRING) {
+                break;
+            }
+            const auto tag   = token.value.text;
+            const auto found = element.tags.find(tag);
+            if ((found == std::end(element.tags)) || (token.type != TokenType::IDENT)) {
+                break;  // Python loops forever on non-IDENT tags.
+            }
+            const auto* member = found->second;
+            if ((member == nullptr) || (member->kind != Kind::TAGGED_STRUCT_MEMBER)) {
+                throw std::runtime_error("Invalid TAGGED_STRUCT member");
+            }
+            const auto* definition = member->child;
+            const auto  start      = state.pos;
+            const bool  is_flag    = ((definition == nullptr) || (definition->kind != Kind::BLOCK)) &&
+                                 ((definition == nullptr) || (definition->kind != Kind::TAGGED_STRUCT_DEFINITION) ||
+                                  (definition->child == nullptr) || (definition->child->kind == Kind::NULL_OBJECT));
+            if (is_flag) {
+                append(tag, IfDataValue::make_bool(true));
+                ++state.pos;
+            } else {
+                while (true) {
+                    const auto iteration = state.pos;
+                    auto       value     = enter(state, definition);
+                    if (value) {
+                        append(tag, std::move(value));
+                    }
+                    if ((!member->multiple) || (state.pos == iteration)) {
+                        break;
+                    }
+                    const auto& next = current(state);
+                    if (!next.has_text(tag) || (next.type == TokenType::END)) {
+                        break;
+                    }
+                }
+            }
+            if (state.pos == start) {
+                break;  // No progress -- Python would loop forever.
+            }
+        }
+
+        IfDataValue result;
+        for (std::size_t idx = 0; idx < std::size(keys); ++idx) {
+            const auto* member = element.tags.at(keys[idx]);
+            result.keys.push_back(keys[idx]);
+            if (member->multiple) {
+                result.items.push_back(IfDataValue::make_list(std::move(values[idx])));
+            } else {
+                result.items.push_back(std::move(values[idx][0]));
+            }
+        }
+        return result;
+    }
+
+    IfDataValue tagged_union(State& state, const Element& element) const {
+        bool        is_block{ false };
+        const auto* token = &current(state);
+
+        if (token->type == TokenType::BEGIN) {
+            token = &lookahead(state, 1);
+            ++state.pos;
+            is_block = true;
+        }
+        if (token->type != TokenType::IDENT) {
+            if (is_block) {
+                rewind(state, 1);
+            }
+            return {};
+        }
+        const auto tag = token->value.text;
+        ++state.pos;
+
+        const auto found = element.tags.find(tag);
+        if (found == std::end(element.tags)) {
+            rewind(state, is_block ? 2 : 1);
+            return {};
+        }
+        const auto* member = found->second;
+        if ((member != nullptr) && (member->kind == Kind::BLOCK)) {
+            auto result = enter(state, member->child);
+            match(state, TokenType::END);
+            match(state, TokenType::IDENT);
+            return IfDataValue::make_dict(tag, std::move(result));
+        } else if ((member != nullptr) && (member->kind == Kind::NULL_OBJECT)) {
+            return IfDataValue::make_dict(tag, IfDataValue::make_bool(true));
+        } else if ((member == nullptr) || (member->kind != Kind::MEMBER)) {
+            throw std::runtime_error("Invalid TAGGED_UNION member");
+        }
+        return IfDataValue::make_dict(tag, enter(state, member->child));
+    }
+
+    IfDataValue structure(State& state, const Element& element) const {
+        std::vector<IfDataValue> result;
+
+        for (const auto* member : element.members) {
+            if ((member == nullptr) || (member->kind != Kind::MEMBER)) {
+                throw std::runtime_error("Invalid STRUCT member");
+            }
+            auto value = enter(state, member->child);
+            if (!value.is_empty_dict()) {
+                result.push_back(std::move(value));
+            }
+        }
+        return IfDataValue::make_list(std::move(result));
+    }
+
+    IfDataValue tagged_struct_definition(State& state, const Element& element) const {
+        ++state.pos;  // Tag.
+        if (!element.multiple) {
+            return enter(state, element.child);
+        }
+        std::vector<IfDataValue> result;
+        while (true) {
+            const auto iteration = state.pos;
+            result.push_back(enter(state, element.child));
+            const auto type = current(state).type;
+            if ((type == TokenType::IDENT) || (type == TokenType::BEGIN) || (type == TokenType::END) || (state.pos == iteration)) {
+                break;
+            }
+        }
+        return IfDataValue::make_list(std::move(result));
+    }
+
+    std::deque<Element> m_elements{};
+    const Element*      m_toplevel{ nullptr };
+    bool                m_has_toplevel{ false };
+    bool                m_valid{ false };
+};
+
+#endif  // __IFDATA_DECODER_HPP
@@ -5,16 +5,19 @@ This module provides functionality for parsing IF_DATA sections in A2L files.
 It uses a token-based approach with a syntax tree to interpret the structure
 of IF_DATA sections according to AML definitions.
 
-The main class is IfDataParser which handles the parsing of IF_DATA sections.
+The main class is IfDataParser which handles the parsing of IF_DATA sections;
+NativeIfDataParser is a drop-in replacement backed by the C++ extension.
 """
 
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import IntEnum
+from functools import lru_cache
 from typing import Any
 
 import pya2l.model as model
-from pya2l.a2lparser_ext import AmlType, unmarshal
+from pya2l.a2lparser_ext import AmlType, IfDataDecoder, unmarshal
 from pya2l.aml.ifdata_lexer import IfDataLexer
 from pya2l.logger import Logger
 
@@ -332,6 +335,27 @@ class IfDataParser:
             self.logger.error(f"Error parsing IF_DATA: {str(e)}")
             raise ParsingError(f"Error parsing IF_DATA: {str(e)}")
 
+    def parse_many(self, sections, workers: int = 1, executor: str = "thread") -> list:
+        """
+        Parse a batch of IF_DATA sections.
+
+        Args:
+            sections: Iterable of IF_DATA section texts
+            workers: Ignored, the parser keeps its state in the instance and runs sequentially
+            executor: Ignored
+
+        Returns:
+            One result per section, None for sections that failed to parse
+        """
+        result = []
+        for section in sections:
+            try:
+                result.append(self.parse(section))
+            except Exception as e:
+                self.logger.debug(f"Error parsing IF_DATA section: {section!r}: {e!r}")
+                result.append(None)
+        return result
+
     def block(self) -> dict:
         """
         Parse a block in the IF_DATA section.
@@ -883,3 +907,117 @@ class IfDataParser:
             self.logger.error(f"Error traversing node of type {getattr(node, 'aml_type', 'unknown')}: {str(e)}")
 
         return result
+
+
+class NativeIfDataParser:
+    """
+    Parser for IF_DATA sections in A2L files, implemented in C++ (``a2lparser_ext.IfDataDecoder``).
+
+    Produces the same results as :class:`IfDataParser`; :meth:`parse_many` decodes
+    a whole batch of sections in one call, with the GIL released.
+    """
+
+    def __init__(self, session, loglevel: str = "INFO") -> None:
+        """
+        Initialize the IF_DATA parser.
+
+        Args:
+            session: The database session containing AML definitions
+            loglevel: The logging level
+        """
+        self.logger = Logger("IF_DATA", loglevel)
+        self.decoder = None
+        self.aml_parsed = None
+
+        aml_section = session.query(model.AMLSection).first()
+        if aml_section and aml_section.parsed:
+            try:
+                decoder = compiled_decoder(bytes(aml_section.parsed))
+            except (RuntimeError, Exception) as e:
+                self.logger.error(f"Failed to unmarshal AML section: {e}")
+                return
+            if decoder.valid:
+                self.decoder = decoder
+                self.aml_parsed = bytes(aml_section.parsed)
+            else:
+                self.logger.error("Failed to initialize parser: invalid AML tree structure")
+
+    @property
+    def root(self) -> bool:
+        """Truthy if the parser could be initialized (cf. ``IfDataParser.root``)."""
+        return self.decoder is not None
+
+    def parse(self, data) -> dict:
+        """
+        Parse an IF_DATA section.
+
+        Args:
+            data: The IF_DATA section text
+
+        Returns:
+            A dictionary representing the parsed IF_DATA section
+
+        Raises:
+            ParsingError: If parsing fails
+        """
+        if self.decoder is None:
+            self.logger.warn("Parser not initialized properly, returning empty result")
+            return {}
+        try:
+            return self.decoder.parse(data)
+        except Exception as e:
+            self.logger.error(f"Error parsing IF_DATA: {str(e)}")
+            raise ParsingError(f"Error parsing IF_DATA: {str(e)}")
+
+    def parse_many(self, sections, workers: int = 1, executor: str = "thread") -> list:
+        """
+        Parse a batch of IF_DATA sections.
+
+        Args:
+            sections: Iterable of IF_DATA section texts
+            workers: Number of threads / processes the batch is split across
+            executor: "thread" (the decoder runs without the GIL) or "process"
+
+        Returns:
+            One result per section, None for sections that failed to parse
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError(f"executor must be 'thread' or 'process', got {executor!r}.")
+        sections = list(sections)
+        if self.decoder is None:
+            self.logger.warn("Parser not initialized properly, returning empty results")
+            return [{} for _ in sections]
+        texts = [section for section in sections if isinstance(section, str)]
+        workers = max(1, min(workers, len(texts)))
+        if workers == 1:
+            values = self.decoder.parse_many(texts)
+        else:
+            size = -(-len(texts) // workers)
+            chunks = [texts[offset : offset + size] for offset in range(0, len(texts), size)]
+            if executor == "thread":
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(self.decoder.parse_many, chunks))
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(_parse_chunk, [self.aml_parsed] * len(chunks), chunks))
+            values = [value for chunk in results for value in chunk]
+        if len(texts) == len(sections):
+            return values
+        values = iter(values)
+        return [next(values) if isinstance(section, str) else None for section in sections]
+
+
+@lru_cache(maxsize=8)
+def compiled_decoder(aml_parsed: bytes) -> IfDataDecoder:
+    """
+    Compile the serialized AML tree `aml_parsed` (``AMLSection.parsed``) into a native decoder.
+
+    Decoders are cached per AML: references are resolved and tag lookup tables
+    are built once per process, not once per parser or section.
+    """
+    return IfDataDecoder(aml_parsed)
+
+
+def _parse_chunk(aml_parsed: bytes, sections: list) -> list:
+    """Process pool worker of :meth:`NativeIfDataParser.parse_many`."""
+    return compiled_decoder(aml_parsed).parse_many(sections)
@@ -9,12 +9,15 @@
 
 void marshal(std::stringstream& ss, const AmlFile& amlf);
 
-AmlData parse_aml(const std::string& aml_file_name) {
+namespace {
+
+template<typename Loader>
+AmlData do_parse_aml(const std::string& source_name, Loader&& load) {
     std::stringstream output;
     AmlData           result;
 
     try {
-        auto file_content = get_file_content(aml_file_name);
+        auto file_content = load();
         auto tokens       = aml_lexer(file_content);
         auto parser       = AMLParser{ tokens };
         auto amlf         = parser.parse();
@@ -23,11 +26,21 @@ AmlData parse_aml(const std::string& aml_file_name) {
         result.text   = file_content;
         // auto root_node = unmarshal(res);
     } catch (const std::runtime_error& re) {
-        std::cerr << "[ERROR (pya2l.AMLParser)] Runtime error while parsing AML file '" << aml_file_name << "': " << re.what() << std::endl;
+        std::cerr << "[ERROR (pya2l.AMLParser)] Runtime error while parsing AML file '" << source_name << "': " << re.what() << std::endl;
     } catch (const std::exception& ex) {
-        std::cerr << "[ERROR (pya2l.AMLParser)] Exception while parsing AML file '" << aml_file_name << "': " << ex.what() << std::endl;
+        std::cerr << "[ERROR (pya2l.AMLParser)] Exception while parsing AML file '" << source_name << "': " << ex.what() << std::endl;
     } catch (...) {
-        std::cerr << "[ERROR (pya2l.AMLParser)] Unknown error while parsing AML file '" << aml_file_name << "' - no further information available." << std::endl;
+        std::cerr << "[ERROR (pya2l.AMLParser)] Unknown error while parsing AML file '" << source_name << "' - no further information available." << std::endl;
     }
     return result;
 }
+
+}  // namespace
+
+AmlData parse_aml(const std::string& aml_file_name) {
+    return do_parse_aml(aml_file_name, [&aml_file_name]() { return get_file_content(aml_file_name); });
+}
+
+AmlData parse_aml_text(const std::string& aml_text, const std::string& source_name) {
+    return do_parse_aml(source_name, [&aml_text]() { return aml_text; });
+}
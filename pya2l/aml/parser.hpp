@@ -19,4 +19,6 @@ struct AmlData {
 
 AmlData parse_aml(const std::string& aml_file_name);
 
+AmlData parse_aml_text(const std::string& aml_text, const std::string& source_name);
+
 #endif  // __PARSER_HPP
@@ -0,0 +1,290 @@
+"""Bounded instance caches for :class:`pya2l.api.inspect.CachedBase`.
+
+Every session gets a :class:`SessionCache`, which keeps one :class:`ClassCache`
+per inspect class. Each class cache is bounded by entry count and (estimated)
+memory and evicts least recently (``"lru"``) or least frequently (``"lfu"``)
+used instances; hits, misses and evictions are counted per class.
+"""
+
+__copyright__ = """
+    pySART - Simplified AUTOSAR-Toolkit for Python.
+
+   (C) 2026 by Christoph Schueler <cpu12.gems@googlemail.com>
+
+   All Rights Reserved
+
+  This program is free software; you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation; either version 2 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License along
+  with this program; if not, write to the Free Software Foundation, Inc.,
+  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import itertools
+import sys
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from typing import Any
+
+import numpy as np
+
+
+MISSING = object()
+
+POLICIES = ("lru", "lfu")
+
+
+@dataclass(frozen=True)
+class CacheLimits:
+    """Bounds of a :class:`ClassCache`; ``None`` means unbounded.
+
+    Attributes
+    ----------
+    max_entries : Optional[int]
+        Maximum number of cached instances
+    max_bytes : Optional[int]
+        Maximum estimated size of the cached instances (see :func:`estimate_size`)
+    policy : str
+        Eviction policy, "lru" or "lfu"
+    """
+
+    max_entries: int | None = 4096
+    max_bytes: int | None = None
+    policy: str = "lru"
+
+    def __post_init__(self) -> None:
+        if self.policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}, got {self.policy!r}.")
+        for name in ("max_entries", "max_bytes"):
+            value = getattr(self, name)
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative, got {value!r}.")
+
+
+@dataclass
+class CacheStats:
+    """Counters of one or more :class:`ClassCache`\\s.
+
+    Attributes
+    ----------
+    hits : int
+        Lookups answered from the cache
+    misses : int
+        Lookups that created a new instance
+    evictions : int
+        Instances dropped to stay within the limits
+    entries : int
+        Instances currently cached
+    bytes : int
+        Estimated size of the cached instances; only tracked while ``max_bytes`` is set
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __add__(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(
+            self.hits + other.hits,
+            self.misses + other.misses,
+            self.evictions + other.evictions,
+            self.entries + other.entries,
+            self.bytes + other.bytes,
+        )
+
+
+ESTIMATE_DEPTH = 2  # Levels of attributes / container items followed by `estimate_size()`.
+ESTIMATE_SAMPLE = 64  # Items measured per container; larger containers are extrapolated.
+
+# References to state shared with the session (not owned by a cached value).
+_SHARED_ATTRIBUTES = frozenset({"session", "_sa_instance_state"})
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+
+def estimate_size(value: Any, depth: int = ESTIMATE_DEPTH) -> int:
+    """Approximate deep size of `value` in bytes.
+
+    Attributes (``__dict__`` / ``__slots__``) and container items are followed up to `depth` levels,
+    NumPy arrays count with their buffers, containers with more than `ESTIMATE_SAMPLE` items are
+    extrapolated from their first items. Objects reached twice count once; the session and the
+    ORM state of mapped instances are not counted.
+    """
+    return _estimate_size(value, depth, set())
+
+
+def _estimate_size(value: Any, depth: int, seen: set[int]) -> int:
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, np.ndarray):
+        return size if value.base is None else size + value.nbytes  # Views don't include their buffer.
+    if depth <= 0 or isinstance(value, _ATOMIC_TYPES):
+        return size
+    if isinstance(value, dict):
+        return size + _estimate_items(itertools.chain.from_iterable(value.items()), 2 * len(value), depth - 1, seen)
+    if isinstance(value, (list, tuple, set, frozenset, deque)):
+        return size + _estimate_items(value, len(value), depth - 1, seen)
+    attributes = getattr(value, "__dict__", None)
+    if attributes is not None:
+        seen.add(id(attributes))
+        size += sys.getsizeof(attributes)
+        items = [item for key, item in attributes.items() if key not in _SHARED_ATTRIBUTES]
+        size += _estimate_items(items, len(items), depth - 1, seen)
+    slots = [name for cls in type(value).__mro__ for name in getattr(cls, "__slots__", ()) if name not in _SHARED_ATTRIBUTES]
+    if slots:
+        items = [getattr(value, name) for name in slots if name != "__dict__" and hasattr(value, name)]
+        size += _estimate_items(items, len(items), depth - 1, seen)
+    return size
+
+
+def _estimate_items(items: Iterable[Any], count: int, depth: int, seen: set[int]) -> int:
+    sample = list(itertools.islice(items, ESTIMATE_SAMPLE))
+    if not sample:
+        return 0
+    size = sum(_estimate_size(item, depth, seen) for item in sample)
+    return size * count // len(sample)
+
+
+class ClassCache:
+    """Instances of one class, bounded by :class:`CacheLimits`."""
+
+    def __init__(self, limits: CacheLimits) -> None:
+        self.limits = limits
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Any, tuple[Any, int]] = OrderedDict()
+        # LFU bookkeeping: use count per key and keys per use count (in LRU order).
+        self._counts: dict[Any, int] = {}
+        self._buckets: defaultdict[int, OrderedDict[Any, None]] = defaultdict(OrderedDict)
+        # Keys cached without a byte limit; their (costly) size is estimated once a limit is set.
+        self._unsized: set[Any] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._entries
+
+    def get(self, key: Any) -> Any:
+        """Cached value of `key` or :data:`MISSING`; counts a hit or a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return MISSING
+        self.stats.hits += 1
+        self._touch(key)
+        return entry[0]
+
+    def put(self, key: Any, value: Any) -> None:
+        """Cache `value` under `key`, then evict down to the limits (possibly `value` itself)."""
+        if key in self._entries:
+            self._remove(key)
+        if self.limits.max_bytes is None:
+            size = 0
+            self._unsized.add(key)
+        else:
+            size = estimate_size(value)
+        self._entries[key] = (value, size)
+        self.stats.bytes += size
+        self._counts[key] = 1
+        self._buckets[1][key] = None
+        self.stats.entries = len(self._entries)
+        self.shrink()
+
+    def shrink(self) -> None:
+        """Evict entries until the cache is within its limits."""
+        max_entries, max_bytes = self.limits.max_entries, self.limits.max_bytes
+        if max_bytes is not None and self._unsized:
+            self._estimate_unsized()
+        while self._entries and (
+            (max_entries is not None and len(self._entries) > max_entries)
+            or (max_bytes is not None and self.stats.bytes > max_bytes)
+        ):
+            self._remove(self._victim())
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+        self._counts.clear()
+        self._buckets.clear()
+        self._unsized.clear()
+        self.stats.entries = 0
+        self.stats.bytes = 0
+
+    def _estimate_unsized(self) -> None:
+        for key in self._unsized:
+            value, _ = self._entries[key]
+            size = estimate_size(value)
+            self._entries[key] = (value, size)
+            self.stats.bytes += size
+        self._unsized.clear()
+
+    def _touch(self, key: Any) -> None:
+        self._entries.move_to_end(key)
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+        self._counts[key] = count + 1
+        self._buckets[count + 1][key] = None
+
+    def _victim(self) -> Any:
+        if self.limits.policy == "lfu":
+            return next(iter(self._buckets[min(self._buckets)]))
+        return next(iter(self._entries))
+
+    def _remove(self, key: Any) -> None:
+        _, size = self._entries.pop(key)
+        self.stats.bytes -= size
+        self._unsized.discard(key)
+        count = self._counts.pop(key)
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+        self.stats.entries = len(self._entries)
+
+
+class SessionCache:
+    """The :class:`ClassCache`\\s of one session."""
+
+    def __init__(self, limits_for) -> None:
+        """`limits_for` maps a class name to its :class:`CacheLimits`."""
+        self._limits_for = limits_for
+        self.classes: dict[str, ClassCache] = {}
+
+    def cache(self, class_name: str) -> ClassCache:
+        """The cache of `class_name`, created on first use."""
+        result = self.classes.get(class_name)
+        if result is None:
+            result = self.classes[class_name] = ClassCache(self._limits_for(class_name))
+        return result
+
+    def configure(self) -> None:
+        """Re-read the limits of all classes (after a configuration change) and evict accordingly."""
+        for class_name, cache in self.classes.items():
+            cache.limits = self._limits_for(class_name)
+            cache.shrink()
+
+    def stats(self) -> dict[str, CacheStats]:
+        """Copies of the counters, by class name."""
+        return {class_name: replace(cache.stats) for class_name, cache in self.classes.items()}
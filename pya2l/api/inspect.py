@@ -38,8 +38,9 @@ import itertools
 import json
 import logging
 import weakref
-from collections.abc import Callable, Generator
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable, Generator, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
 from enum import IntEnum
 from functools import cached_property, reduce
 from operator import attrgetter, mul
@@ -50,11 +51,22 @@ from typing import (
     Union,
 )
 
-from sqlalchemy import not_
+import numpy as np
+from sqlalchemy import not_, select
+from sqlalchemy.orm import collections as _orm_collections
 from sqlalchemy.orm import object_session as _orm_object_session
+from sqlalchemy.orm import selectinload, with_parent
+from sqlalchemy.sql import ColumnElement
 
 import pya2l.model as model
 from pya2l import exceptions
+from pya2l.api.cache import (
+    MISSING,
+    CacheLimits,
+    CacheStats,
+    SessionCache,
+    estimate_size,
+)
 from pya2l.functions import (
     Coeffs,
     CoeffsLinear,
@@ -163,7 +175,12 @@ __all__ = [
 T = TypeVar("T")
 _CachedT = TypeVar("_CachedT", bound="CachedBase")
 
-DB_CACHE_SIZE = 4096  # Completly arbitrary, could be configurable.
+DB_CACHE_SIZE = 4096  # Default number of cached instances per class and session, see `CachedBase.configure_cache()`.
+
+DENSE_LUT_BUDGET = 64 * 1024 * 1024  # Bytes of dense conversion tables per session, see `CompuMethod.configure_dense_luts()`.
+DENSE_LUT_CACHE = "CompuMethod.lut"  # Session cache holding the dense conversion tables.
+
+_KEEP = object()
 
 
 def _process_sys_consts(values):
@@ -1334,6 +1351,108 @@ def fnc_np_order(order: str | None) -> str | None:
         return None
 
 
+_ANNOTATION_PATHS = (
+    "annotation_association.annotation.annotation_label",
+    "annotation_association.annotation.annotation_origin",
+    "annotation_association.annotation.annotation_text",
+)
+
+_COMMON_PATHS = (
+    *_ANNOTATION_PATHS,
+    "byte_order",
+    "display_identifier",
+    "ecu_address_extension",
+    "format",
+    "function_list._name",
+    "if_data_association.if_data",
+    "max_refresh",
+    "model_link",
+    "phys_unit",
+    "ref_memory_segment",
+    "symbol_link",
+)
+
+LOADER_PROFILES: dict[str, tuple[str, ...]] = {
+    "AxisPts": (
+        *_COMMON_PATHS,
+        "calibration_access",
+        "deposit",
+        "extended_limits",
+        "monotony",
+        "step_size",
+    ),
+    "Characteristic": (
+        *_COMMON_PATHS,
+        *(f"axis_descr.{path}" for path in _ANNOTATION_PATHS),
+        "axis_descr.axis_pts_ref",
+        "axis_descr.byte_order",
+        "axis_descr.curve_axis_ref",
+        "axis_descr.deposit",
+        "axis_descr.extended_limits",
+        "axis_descr.fix_axis_par",
+        "axis_descr.fix_axis_par_dist",
+        "axis_descr.fix_axis_par_list._axisPts_Value",
+        "axis_descr.format",
+        "axis_descr.max_grad",
+        "axis_descr.monotony",
+        "axis_descr.phys_unit",
+        "axis_descr.step_size",
+        "bit_mask",
+        "calibration_access",
+        "comparison_quantity",
+        "dependent_characteristic._characteristic_id",
+        "encoding",
+        "extended_limits",
+        "map_list._name",
+        "matrix_dim._numbers",
+        "number",
+        "step_size",
+        "virtual_characteristic._characteristic_id",
+    ),
+    "Measurement": (
+        *_COMMON_PATHS,
+        "address_type",
+        "array_size",
+        "bit_mask",
+        "bit_operation",
+        "ecu_address",
+        "error_mask",
+        "layout",
+        "matrix_dim._numbers",
+        "virtual._measuringChannel",
+    ),
+}
+"""Relationships loaded in bulk (``selectinload``) when a :class:`FilteredList` instantiates the
+inspect class of the same name; dotted paths load nested relationships."""
+
+
+def loader_options(model_class: Any, paths: Iterable[str]) -> list[Any]:
+    """Build ``selectinload`` loader options for `model_class` from dotted relationship `paths`.
+
+    Parameters
+    ----------
+    model_class : Any
+        Mapped class the options are applied to, e.g. ``model.Characteristic``
+    paths : Iterable[str]
+        Relationship paths, e.g. ``"axis_descr.format"``
+
+    Returns
+    -------
+    list
+        Loader options for ``Query.options()``
+    """
+    result = []
+    for path in paths:
+        klass = model_class
+        option = None
+        for key in path.split("."):
+            attribute = getattr(klass, key)
+            option = selectinload(attribute) if option is None else option.selectinload(attribute)
+            klass = attribute.property.mapper.class_
+        result.append(option)
+    return result
+
+
 class FilteredList(Generic[_CachedT]):
     """A filtered list of objects from a database association.
 
@@ -1350,9 +1469,24 @@ class FilteredList(Generic[_CachedT]):
         Class to instantiate for each row
     attribute : Callable
         Function to extract the attribute used for instantiation
+    loader_paths : tuple[str, ...]
+        Relationships loaded in bulk before instantiation (see :data:`LOADER_PROFILES`)
+    batch_size : int
+        Number of rows whose relationships are loaded together
+    parent : Any
+        Owner of the association, if given by relationship name (see :meth:`__init__`)
     """
 
-    def __init__(self, session, association, klass: type[_CachedT], attr_name: str = "name") -> None:
+    def __init__(
+        self,
+        session,
+        association,
+        klass: type[_CachedT],
+        attr_name: str = "name",
+        loader_paths: tuple[str, ...] | None = None,
+        batch_size: int = 500,
+        parent: Any = None,
+    ) -> None:
         """Initialize a FilteredList instance.
 
         Parameters
@@ -1365,19 +1499,120 @@ class FilteredList(Generic[_CachedT]):
             Class to instantiate for each row
         attr_name : str, optional
             Name of the attribute to use for instantiation, by default "name"
+        loader_paths : Optional[tuple[str, ...]], optional
+            Relationships to load in bulk, by default the profile of `klass` in
+            :data:`LOADER_PROFILES`; pass ``()`` to load lazily row by row
+        batch_size : int, optional
+            Number of rows whose relationships are loaded together, by default 500
+        parent : Any, optional
+            Owner of the association; `association` is then the name of the relationship and
+            the collection is only loaded if :meth:`query` is called with a Python criterion
         """
         self.session = session
-        self.association = association
+        self.parent = parent
+        self._association = association
         self.klass = klass
+        self.attr_name = attr_name
         self.attribute = attrgetter(attr_name)
+        self.loader_paths = LOADER_PROFILES.get(klass.__name__, ()) if loader_paths is None else loader_paths
+        self.batch_size = batch_size
+
+    @property
+    def association(self) -> Any:
+        """The associated collection (loaded on access, if the list is bound to a parent)."""
+        if self.parent is not None:
+            return getattr(self.parent, self._association)
+        return self._association
+
+    def _relationship(self) -> tuple[Any, Any] | None:
+        """Return ``(parent, relationship attribute)`` of the association, if known."""
+        if self.parent is not None:
+            return self.parent, getattr(type(self.parent), self._association)
+        try:
+            adapter = _orm_collections.collection_adapter(self._association)
+        except AttributeError:  # Not an ORM collection.
+            return None
+        if adapter is None or adapter.owner_state.obj() is None:
+            return None
+        parent = adapter.owner_state.obj()
+        return parent, getattr(type(parent), adapter.attr.key)
+
+    def sql_filters(
+        self,
+        model_class: Any,
+        name: str | None = None,
+        regex: str | None = None,
+        address: tuple[int, int] | None = None,
+        datatype: str | Iterable[str] | None = None,
+    ) -> list[Any]:
+        """Translate the filter keywords of :meth:`query` into SQL expressions on `model_class`.
 
-    def query(self, criterion: Callable | None = None) -> Generator:
+        Raises
+        ------
+        ValueError
+            If `model_class` has no address / datatype to filter on.
+        """
+        column = getattr(model_class, self.attr_name)
+        result = []
+        if name is not None:
+            result.append(column.op("GLOB")(name))
+        if regex is not None:
+            result.append(column.regexp_match(regex))
+        if address is not None:
+            low, high = address
+            if hasattr(model_class, "address"):
+                result.append(model_class.address.between(low, high))
+            elif hasattr(model_class, "ecu_address"):
+                result.append(model_class.ecu_address.has(model.EcuAddress.address.between(low, high)))
+            else:
+                raise ValueError(f"{model_class.__name__} has no address.")
+        if datatype is not None:
+            if not hasattr(model_class, "datatype"):
+                raise ValueError(f"{model_class.__name__} has no datatype.")
+            result.append(model_class.datatype.in_([datatype] if isinstance(datatype, str) else list(datatype)))
+        return result
+
+    def preload(self, rows: list) -> None:
+        """Load the relationships in :attr:`loader_paths` of `rows` with a few ``SELECT ... IN`` queries.
+
+        Parameters
+        ----------
+        rows : list
+            Model instances of the association
+        """
+        if not self.loader_paths or not rows or self.session is None:
+            return
+        model_class = type(rows[0])
+        try:
+            options = loader_options(model_class, self.loader_paths)
+            self.session.query(model_class).options(*options).filter(model_class.rid.in_([row.rid for row in rows])).all()
+        except Exception as e:
+            _logger.debug("Error preloading %s relationships: %r", model_class.__name__, e)
+
+    def query(
+        self,
+        criterion: Callable | ColumnElement | Iterable[ColumnElement] | None = None,
+        *,
+        name: str | None = None,
+        regex: str | None = None,
+        address: tuple[int, int] | None = None,
+        datatype: str | Iterable[str] | None = None,
+    ) -> Generator:
         """Query the association with an optional filter criterion.
 
         Parameters
         ----------
-        criterion : Optional[Callable], optional
-            Function to filter rows, by default None
+        criterion : Optional[Union[Callable, ColumnElement, Iterable[ColumnElement]]], optional
+            Function to filter rows, or SQLAlchemy expression(s) on the model class,
+            e.g. ``model.Measurement.upperLimit > 1000``, by default None
+        name : Optional[str], optional
+            Glob pattern (SQLite ``GLOB``, case-sensitive) matched against the name, e.g. ``"ABC_*"``
+        regex : Optional[str], optional
+            Regular expression searched (``re.search``) in the name, via SQLite ``REGEXP``
+        address : Optional[tuple[int, int]], optional
+            Inclusive address range (ECU_ADDRESS for measurements)
+        datatype : Optional[Union[str, Iterable[str]]], optional
+            Datatype(s) of measurements, e.g. ``"UWORD"`` or ``("SLONG", "ULONG")``
 
         Returns
         -------
@@ -1387,9 +1622,45 @@ class FilteredList(Generic[_CachedT]):
         Notes
         -----
         If criterion is None, all rows are returned.
-        The criterion function should take a row and return True if the row
+        A criterion function should take a row and return True if the row
         should be included in the results.
+        SQL expressions and the keyword filters are evaluated by SQLite; rows
+        are streamed in chunks of :attr:`batch_size`, so only matching rows are
+        loaded. Filters are combined with AND.
+        Pending changes of the session are flushed first.
         """
+        if criterion is None or isinstance(criterion, ColumnElement):
+            clauses = [] if criterion is None else [criterion]
+            criterion = None
+        elif not callable(criterion):
+            clauses = list(criterion)
+            criterion = None
+        else:
+            clauses = []
+        filtering = bool(clauses) or any(value is not None for value in (name, regex, address, datatype))
+        relationship = self._relationship() if (filtering or self.parent is not None) else None
+
+        if relationship is not None:
+            parent, attribute = relationship
+            model_class = attribute.property.mapper.class_
+            clauses.extend(self.sql_filters(model_class, name, regex, address, datatype))
+            if self.session.new or self.session.dirty or self.session.deleted:
+                self.session.flush()  # The session doesn't autoflush; objects added through the create API must be found.
+            statement = (
+                self.session.query(model_class)
+                .filter(with_parent(parent, attribute), *clauses)
+                .order_by(model_class.rid)
+                .options(*loader_options(model_class, self.loader_paths))
+                .yield_per(max(1, self.batch_size))
+            )
+            rows = (row for row in statement if criterion is None or criterion(row))
+            yield from self._instances(rows, preload=False)
+            return
+        elif filtering:
+            if self._association:
+                raise ValueError("SQL filters need an association bound to a database object.")
+            return
+
         if criterion is None:
 
             def criterion(x):
@@ -1398,9 +1669,16 @@ class FilteredList(Generic[_CachedT]):
         if self.association is None:
             return
 
+        yield from self._instances(row for row in self.association if criterion(row))
+
+    def _instances(self, rows: Iterable, preload: bool = True) -> Generator:
+        """Instantiate :attr:`klass` for `rows`, :attr:`batch_size` rows at a time."""
         try:
-            for row in self.association:
-                if criterion(row):
+            rows = iter(rows)
+            while batch := list(itertools.islice(rows, max(1, self.batch_size))):
+                if preload:
+                    self.preload(batch)
+                for row in batch:
                     try:
                         attr_val = self.attribute(row)
                         if hasattr(self.klass, "get"):
@@ -1421,12 +1699,9 @@ class CachedBase:
     This class provides a caching mechanism to avoid creating duplicate instances
     of the same object, which can improve performance and memory usage.
 
-    Attributes
-    ----------
-    _cache : weakref.WeakValueDictionary
-        Dictionary mapping (class_name, object_name, args) tuples to instances
-    _strong_ref : collections.deque
-        Deque of strong references to instances to prevent garbage collection
+    Instances are cached per session and per class, in LRU (or LFU) caches bounded by
+    entry count and estimated memory, see :meth:`configure_cache`; hit / miss / eviction
+    counters are available through :meth:`cache_stats`.
 
     Note
     ----
@@ -1437,20 +1712,38 @@ class CachedBase:
     meas = Measurement.get(session, "someMeasurement")  # This is the right way.
 
     meas = Measurement(session, "someMeasurement")      # Constructor directly called, no caching.
+
+    Characteristic.configure_cache(max_bytes=64 * 1024 * 1024, policy="lfu")
+    print(CachedBase.cache_stats(session)["Characteristic"].hit_rate)
     """
 
     _cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
-    _fallback_cache: dict[int, dict[tuple[str, str | None, tuple[Any, ...]], Any]] = {}
-    _strong_ref: collections.deque = collections.deque(maxlen=DB_CACHE_SIZE)
+    _fallback_cache: dict[int, SessionCache] = {}
+    _session_caches: weakref.WeakSet = weakref.WeakSet()
+    _cache_limits: dict[str | None, CacheLimits] = {
+        None: CacheLimits(max_entries=DB_CACHE_SIZE),
+        DENSE_LUT_CACHE: CacheLimits(max_entries=None, max_bytes=DENSE_LUT_BUDGET),
+    }
+
+    @classmethod
+    def _limits_for(cls, class_name: str) -> CacheLimits:
+        limits = CachedBase._cache_limits
+        return limits.get(class_name, limits[None])
+
+    @classmethod
+    def _new_session_cache(cls) -> SessionCache:
+        cache = SessionCache(CachedBase._limits_for)
+        CachedBase._session_caches.add(cache)
+        return cache
 
     @classmethod
-    def _get_session_cache(cls, session: Any) -> dict[tuple[str, str | None, tuple[Any, ...]], Any]:
+    def _get_session_cache(cls, session: Any) -> SessionCache:
         """Return (and create) the cache bucket for a given session."""
         info = getattr(session, "info", None)
         if isinstance(info, dict):
             cache = info.get("pya2l_cached_base")
             if cache is None:
-                cache = {}
+                cache = cls._new_session_cache()
                 info["pya2l_cached_base"] = cache
             return cache
 
@@ -1460,21 +1753,85 @@ class CachedBase:
             key = id(session)
             cache = cls._fallback_cache.get(key)
             if cache is None:
-                cache = {}
+                cache = cls._new_session_cache()
                 cls._fallback_cache[key] = cache
             return cache
 
         if cache is None:
-            cache = {}
+            cache = cls._new_session_cache()
             cls._cache[session] = cache
         return cache
 
+    @classmethod
+    def configure_cache(
+        cls,
+        max_entries: int | None | object = _KEEP,
+        max_bytes: int | None | object = _KEEP,
+        policy: str | object = _KEEP,
+    ) -> CacheLimits:
+        """Set the cache limits of this class (all classes, if called on `CachedBase`).
+
+        Parameters
+        ----------
+        max_entries : Optional[int], optional
+            Maximum number of cached instances per session, None for no limit
+        max_bytes : Optional[int], optional
+            Maximum estimated size of the cached instances per session, None for no limit
+        policy : str, optional
+            "lru" (evict least recently used) or "lfu" (evict least frequently used)
+
+        Returns
+        -------
+        CacheLimits
+            The new limits; omitted parameters keep their current value.
+
+        Notes
+        -----
+        Limits set on a subclass take precedence over the defaults set on `CachedBase`;
+        existing caches are shrunk immediately.
+        """
+        class_name = None if cls is CachedBase else cls.__name__
+        current = cls._limits_for(class_name) if class_name else CachedBase._cache_limits[None]
+        changes = {
+            key: value
+            for key, value in (("max_entries", max_entries), ("max_bytes", max_bytes), ("policy", policy))
+            if value is not _KEEP
+        }
+        limits = replace(current, **changes)
+        CachedBase._cache_limits[class_name] = limits
+        for cache in list(CachedBase._session_caches):
+            cache.configure()
+        return limits
+
+    @classmethod
+    def cache_stats(cls, session: Any = None) -> dict[str, CacheStats]:
+        """Return cache counters by class name.
+
+        Parameters
+        ----------
+        session : Any, optional
+            Only count the cache of `session`, by default the caches of all live sessions are summed up
+
+        Returns
+        -------
+        dict[str, CacheStats]
+            Counters of this class only, or of all classes if called on `CachedBase`
+        """
+        caches = [cls._get_session_cache(session)] if session is not None else list(CachedBase._session_caches)
+        result: dict[str, CacheStats] = {}
+        for cache in caches:
+            for class_name, stats in cache.stats().items():
+                if cls is CachedBase or class_name == cls.__name__:
+                    result[class_name] = result.get(class_name, CacheStats()) + stats
+        return result
+
     @classmethod
     def clear(cls) -> None:
         """Clear all cached instances across all sessions."""
+        for cache in list(CachedBase._session_caches):
+            cache.classes.clear()
         cls._cache.clear()
         cls._fallback_cache.clear()
-        cls._strong_ref.clear()
 
     @classmethod
     def clear_session(cls, session: Any) -> None:
@@ -1577,24 +1934,22 @@ class CachedBase:
 
         if no_cache:
             try:
-                inst = _create_inst()
-                cls._strong_ref.append(inst)
-                return inst
+                return _create_inst()
             except Exception as e:
                 _logger.debug("%s.get(%r): %r", cls.__name__, name, e)
                 return None
 
-        cache = cls._get_session_cache(session)
-        entry = (cls.__name__, name, module_name, args)
-        if entry not in cache:
+        cache = cls._get_session_cache(session).cache(cls.__name__)
+        entry = (name, module_name, args)
+        inst = cache.get(entry)
+        if inst is MISSING:
             try:
                 inst = _create_inst()
-                cache[entry] = inst
-                cls._strong_ref.append(inst)
             except Exception as e:
                 _logger.debug("%s.get(%r): %r", cls.__name__, name, e)
                 return None
-        return cache[entry]
+            cache.put(entry, inst)
+        return inst
 
     @classmethod
     def inny(cls):
@@ -1759,13 +2114,15 @@ class NoCompuMethod(SingletonBase):
         """
         return self._refUnit
 
-    def int_to_physical(self, i: Any) -> Any:
+    def int_to_physical(self, i: Any, datatype: str | None = None) -> Any:
         """Convert internal value to physical value (identity function).
 
         Parameters
         ----------
         i : Any
             Internal value
+        datatype : Optional[str], optional
+            Ignored, for compatibility with `CompuMethod.int_to_physical`
 
         Returns
         -------
@@ -1969,8 +2326,17 @@ class CompuMethod(CachedBase):
         Reference unit
     evaluator : Callable
         Function object that performs the actual conversion
+
+    Note
+    ----
+    With dense lookup tables enabled (:meth:`configure_dense_luts`), `int_to_physical` converts arrays of
+    an 8 or 16 bit datatype with a table of all 256 / 65536 possible results, computed on first use and
+    shared per session by all instances of the same COMPU_METHOD.
     """
 
+    DENSE_LUT_TYPES = {name: dtype for name, dtype in ASAM_INTEGER_QUANTITIES.items() if ASAM_TYPE_SIZES[name] <= 2}
+    dense_luts = False
+
     compu_method: model.CompuMethod = field(repr=False)
     session: Any = field(repr=False)
     name: str
@@ -2097,21 +2463,91 @@ class CompuMethod(CachedBase):
         else:
             raise ValueError(f"Unknown conversation type '{cm_type}'.")
 
-    def int_to_physical(self, i: int | float | Any) -> Any:
+    def int_to_physical(self, i: int | float | Any, datatype: str | None = None) -> Any:
         """Convert internal value to physical value.
 
         Parameters
         ----------
         i : Union[int, float, Any]
             Internal value (can be scalar or array)
+        datatype : Optional[str], optional
+            ASAM datatype of the internal values (e.g. the MEASUREMENT's datatype); if dense lookup tables
+            are enabled, arrays of the matching NumPy type are converted with :meth:`dense_lut`
 
         Returns
         -------
         Any
             Physical value
         """
+        if datatype is not None and self.dense_luts and isinstance(i, np.ndarray):
+            dtype = self.DENSE_LUT_TYPES.get(datatype)
+            if dtype is not None and i.dtype == dtype:
+                lut = self.dense_lut(datatype)
+                if lut is not None:
+                    return lut.take(i.view(f"u{i.dtype.itemsize}"))
         return self.evaluator.int_to_physical(i)
 
+    def dense_lut(self, datatype: str) -> np.ndarray | None:
+        """Physical values of all internal values of an 8 or 16 bit `datatype`.
+
+        The table is indexed by the unsigned bit pattern of the internal value (i.e. ``-1`` of a SBYTE
+        is at index 255). Tables are cached per session and COMPU_METHOD, within the budget set by
+        :meth:`configure_dense_luts`.
+
+        Parameters
+        ----------
+        datatype : str
+            ASAM datatype, one of `DENSE_LUT_TYPES`
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            The table, or None if `datatype` is not supported, the conversion is an identity or
+            the table exceeds the budget
+        """
+        dtype = self.DENSE_LUT_TYPES.get(datatype)
+        if dtype is None or self.conversionType in ("IDENTICAL", "NO_COMPU_METHOD"):
+            return None
+        cache = self._get_session_cache(self.session).cache(DENSE_LUT_CACHE)
+        key = (self.compu_method.rid, datatype)
+        lut = cache.get(key)
+        if lut is MISSING:
+            raw = np.arange(1 << (8 * np.dtype(dtype).itemsize), dtype=f"u{np.dtype(dtype).itemsize}").view(dtype)
+            lut = np.asarray(self.evaluator.int_to_physical(raw))
+            max_bytes = cache.limits.max_bytes
+            if lut.shape != raw.shape or (max_bytes is not None and estimate_size(lut) > max_bytes):
+                lut = None  # Remembered, so the table isn't recomputed on every call.
+            cache.put(key, lut)
+        return lut
+
+    @classmethod
+    def configure_dense_luts(cls, enabled: bool | object = _KEEP, max_bytes: int | None | object = _KEEP) -> CacheLimits:
+        """Enable / disable dense lookup tables and set their memory budget per session.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            Use dense lookup tables in `int_to_physical`, disabled by default
+        max_bytes : Optional[int], optional
+            Maximum size of the tables per session, by default `DENSE_LUT_BUDGET`; least recently
+            used tables are evicted
+
+        Returns
+        -------
+        CacheLimits
+            Limits of the table cache (omitted parameters keep their current value).
+        """
+        if enabled is not _KEEP:
+            CompuMethod.dense_luts = bool(enabled)
+        limits = CachedBase._cache_limits[DENSE_LUT_CACHE]
+        if max_bytes is not _KEEP:
+            limits = CachedBase._cache_limits[DENSE_LUT_CACHE] = replace(limits, max_bytes=max_bytes)
+            for cache in list(CachedBase._session_caches):
+                cache.configure()
+                if DENSE_LUT_CACHE in cache.classes:
+                    cache.classes[DENSE_LUT_CACHE].clear()  # Forget tables rejected under the old budget.
+        return limits
+
     def physical_to_int(self, p: int | float | Any) -> Any:
         """Convert physical value to internal value.
 
@@ -2135,6 +2571,7 @@ class CompuMethod(CachedBase):
         module_name: str | None = None,
         *,
         no_cache: bool = False,
+        db_instance: model.CompuMethod | None = None,
     ) -> Union["CompuMethod", NoCompuMethod]:
         """Get a CompuMethod instance, using cache if available.
 
@@ -2146,6 +2583,8 @@ class CompuMethod(CachedBase):
             Name of the computation method to retrieve, by default None
         module_name : Optional[str], optional
             Name of the module, by default None
+        db_instance : Optional[model.CompuMethod], optional
+            Pre-loaded CompuMethod database object, by default None
 
         Returns
         -------
@@ -2155,7 +2594,7 @@ class CompuMethod(CachedBase):
         if name == "NO_COMPU_METHOD":
             return NoCompuMethod()
         else:
-            return super(cls, CompuMethod).get(session, name, module_name, no_cache=no_cache)
+            return super(cls, CompuMethod).get(session, name, module_name, no_cache=no_cache, db_instance=db_instance)
 
     def to_dict(self) -> dict:
         from pya2l.imex.json_exporter import compu_method_to_dict
@@ -2917,8 +3356,56 @@ def create_record_layout_components(parent) -> dict:
     return result
 
 
+class LazyAttributes:
+    """Mixin computing the attributes listed in `_attribute_loaders` on demand.
+
+    In eager mode (the default) the constructor computes all attributes. In lazy mode
+    an attribute is computed on first access and then stored on the instance, so code
+    touching only a few fields (e.g. `address`) skips annotations, IF_DATA, record layouts, ...
+
+    Example
+    -------
+    Characteristic.configure_lazy(True)              # All new instances of the class.
+
+    chx = Characteristic.get(session, "someCharacteristic", lazy=True)  # Just this one.
+    """
+
+    lazy = False
+    _attribute_loaders: dict[str, Callable[[Any, Any, str | None], Any]] = {}
+
+    @classmethod
+    def configure_lazy(cls, enabled: bool) -> bool:
+        """Set the default mode of this class (all classes, if called on `LazyAttributes`).
+
+        Returns
+        -------
+        bool
+            The previous setting
+        """
+        previous = cls.lazy
+        cls.lazy = enabled
+        return previous
+
+    def _init_attributes(self, session: Any, module_name: str | None, lazy: bool | None) -> None:
+        self._session = session
+        self._module_name = module_name
+        if not (type(self).lazy if lazy is None else lazy):
+            for name in self._attribute_loaders:
+                getattr(self, name)
+            del self._session  # Only lazy instances need the session later on.
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not (yet) set on the instance.
+        loader = type(self)._attribute_loaders.get(name)
+        if loader is None or "_session" not in self.__dict__:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = loader(self, self._session, self._module_name)
+        setattr(self, name, value)
+        return value
+
+
 @dataclass
-class AxisPts(CachedBase):
+class AxisPts(LazyAttributes, CachedBase):
     """"""
 
     axis: model.AxisPts = field(repr=False)
@@ -2954,7 +3441,14 @@ class AxisPts(CachedBase):
     depositAttr: RecordLayout
     record_layout_components: dict
 
-    def __init__(self, session, name: str | None = None, module_name: str | None = None, db_instance: model.AxisPts | None = None):
+    def __init__(
+        self,
+        session,
+        name: str | None = None,
+        module_name: str | None = None,
+        db_instance: model.AxisPts | None = None,
+        lazy: bool | None = None,
+    ):
         if db_instance is not None:
             self.axis = db_instance
         else:
@@ -2966,33 +3460,45 @@ class AxisPts(CachedBase):
         self.longIdentifier = self.axis.longIdentifier
         self.address = self.axis.address
         self.inputQuantity = self.axis.inputQuantity  # REF: Measurement
-        self.depositAttr = RecordLayout.get(session, self.axis.depositAttr, module_name)
-        self.deposit = self.axis.deposit.mode if self.axis.deposit else None
         self.maxDiff = self.axis.maxDiff
         self._conversionRef = self.axis.conversion
-        self.compuMethod = CompuMethod.get(session, self._conversionRef, module_name)
         self.maxAxisPoints = self.axis.maxAxisPoints
         self.lowerLimit = self.axis.lowerLimit
         self.upperLimit = self.axis.upperLimit
-        self.annotations = _annotations(session, self.axis.annotation)
-        self.byteOrder = self.axis.byte_order.byteOrder if self.axis.byte_order else None
-        self.calibrationAccess = self.axis.calibration_access
-        self.displayIdentifier = self.axis.display_identifier.display_name if self.axis.display_identifier else None
-        self.ecuAddressExtension = self.axis.ecu_address_extension.extension if self.axis.ecu_address_extension else 0
-        self.extendedLimits = _create_extended_limits(self.axis.extended_limits)
-        self.format = self.axis.format.formatString if self.axis.format else None
-        self.functionList = self.axis.function_list.name if self.axis.function_list else []
         self.guardRails = self.axis.guard_rails
-        self.maxRefresh = _dissect_max_refresh(self.axis.max_refresh)
-        self.modelLink = self.axis.model_link.link if self.axis.model_link else None
-        self.monotony = self.axis.monotony.monotony if self.axis.monotony else None
-        self.physUnit = self.axis.phys_unit.unit if self.axis.phys_unit else None
         self.readOnly = self.axis.read_only
-        self.refMemorySegment = self.axis.ref_memory_segment.name if self.axis.ref_memory_segment else None
-        self.stepSize = self.axis.step_size
-        self.symbolLink = _dissect_symbol_link(self.axis.symbol_link)
-        self.record_layout_components = create_record_layout_components(self) if self.depositAttr else None
-        self.if_data = IfData(session.parse_ifdata(self.axis.if_data), self.axis.if_data)
+        self._init_attributes(session, module_name, lazy)
+
+    _attribute_loaders = {
+        "depositAttr": lambda self, session, module_name: RecordLayout.get(session, self.axis.depositAttr, module_name),
+        "deposit": lambda self, session, module_name: self.axis.deposit.mode if self.axis.deposit else None,
+        "compuMethod": lambda self, session, module_name: CompuMethod.get(session, self._conversionRef, module_name),
+        "annotations": lambda self, session, module_name: _annotations(session, self.axis.annotation),
+        "byteOrder": lambda self, session, module_name: self.axis.byte_order.byteOrder if self.axis.byte_order else None,
+        "calibrationAccess": lambda self, session, module_name: self.axis.calibration_access,
+        "displayIdentifier": lambda self, session, module_name: (
+            self.axis.display_identifier.display_name if self.axis.display_identifier else None
+        ),
+        "ecuAddressExtension": lambda self, session, module_name: (
+            self.axis.ecu_address_extension.extension if self.axis.ecu_address_extension else 0
+        ),
+        "extendedLimits": lambda self, session, module_name: _create_extended_limits(self.axis.extended_limits),
+        "format": lambda self, session, module_name: self.axis.format.formatString if self.axis.format else None,
+        "functionList": lambda self, session, module_name: self.axis.function_list.name if self.axis.function_list else [],
+        "maxRefresh": lambda self, session, module_name: _dissect_max_refresh(self.axis.max_refresh),
+        "modelLink": lambda self, session, module_name: self.axis.model_link.link if self.axis.model_link else None,
+        "monotony": lambda self, session, module_name: self.axis.monotony.monotony if self.axis.monotony else None,
+        "physUnit": lambda self, session, module_name: self.axis.phys_unit.unit if self.axis.phys_unit else None,
+        "refMemorySegment": lambda self, session, module_name: (
+            self.axis.ref_memory_segment.name if self.axis.ref_memory_segment else None
+        ),
+        "stepSize": lambda self, session, module_name: self.axis.step_size,
+        "symbolLink": lambda self, session, module_name: _dissect_symbol_link(self.axis.symbol_link),
+        "record_layout_components": lambda self, session, module_name: (
+            create_record_layout_components(self) if self.depositAttr else None
+        ),
+        "if_data": lambda self, session, module_name: IfData(session.parse_ifdata(self.axis.if_data), self.axis.if_data),
+    }
 
     @property
     def record_layout(self) -> RecordLayout:
@@ -3138,7 +3644,7 @@ class AxisDescr(CachedBase):
 
 
 @dataclass
-class Characteristic(CachedBase):
+class Characteristic(LazyAttributes, CachedBase):
     """Convenient access (read-only) to CHARACTERISTIC objects.
 
     Parameters
@@ -3202,7 +3708,14 @@ class Characteristic(CachedBase):
     fnc_np_shape: tuple
     record_layout_components: dict
 
-    def __init__(self, session, name: str | None = None, module_name: str | None = None, db_instance: model.Characteristic | None = None):
+    def __init__(
+        self,
+        session,
+        name: str | None = None,
+        module_name: str | None = None,
+        db_instance: model.Characteristic | None = None,
+        lazy: bool | None = None,
+    ):
         if db_instance is not None:
             self.characteristic = db_instance
         else:
@@ -3214,68 +3727,101 @@ class Characteristic(CachedBase):
         self.longIdentifier = self.characteristic.longIdentifier
         self.type = self.characteristic.type
         self.address = self.characteristic.address
-        self.deposit = RecordLayout.get(session, self.characteristic.deposit, module_name)
         self.maxDiff = self.characteristic.maxDiff
         self._conversionRef = self.characteristic.conversion
-        self.compuMethod = (
+        self.lowerLimit = self.characteristic.lowerLimit
+        self.upperLimit = self.characteristic.upperLimit
+        self.discrete = self.characteristic.discrete
+        self.guardRails = self.characteristic.guard_rails
+        self.readOnly = self.characteristic.read_only
+        self._init_attributes(session, module_name, lazy)
+
+    def _fnc_np_shape(self) -> tuple:
+        if self.matrixDim.valid():
+            return fnc_np_shape(self.matrixDim)
+        elif self.number is not None:
+            return (self.number,)
+        elif self.axisDescriptions:
+            return tuple([ax.maxAxisPoints for ax in self.axisDescriptions])
+        return ()
+
+    _attribute_loaders = {
+        "deposit": lambda self, session, module_name: RecordLayout.get(session, self.characteristic.deposit, module_name),
+        "compuMethod": lambda self, session, module_name: (
             CompuMethod.get(session, self._conversionRef, module_name)
             if self._conversionRef != "NO_COMPU_METHOD"
             else "NO_COMPU_METHOD"
-        )
-        self.lowerLimit = self.characteristic.lowerLimit
-        self.upperLimit = self.characteristic.upperLimit
-        self.annotations = _annotations(session, self.characteristic.annotation)
-        self.bitMask = self.characteristic.bit_mask.mask if self.characteristic.bit_mask else None
-        self.byteOrder = self.characteristic.byte_order.byteOrder if self.characteristic.byte_order else None
+        ),
+        "annotations": lambda self, session, module_name: _annotations(session, self.characteristic.annotation),
+        "bitMask": lambda self, session, module_name: self.characteristic.bit_mask.mask if self.characteristic.bit_mask else None,
+        "byteOrder": lambda self, session, module_name: (
+            self.characteristic.byte_order.byteOrder if self.characteristic.byte_order else None
+        ),
         # all_axes_names()
-        self.axisDescriptions = [AxisDescr.get(session, a, module_name) for a in self.characteristic.axis_descr]
-        self.calibrationAccess = self.characteristic.calibration_access
-        self.comparisonQuantity = self.characteristic.comparison_quantity
-        if self.characteristic.dependent_characteristic:
-            self.dependent_characteristic = DependentCharacteristic(
+        "axisDescriptions": lambda self, session, module_name: [
+            AxisDescr.get(session, a, module_name) for a in self.characteristic.axis_descr
+        ],
+        "calibrationAccess": lambda self, session, module_name: self.characteristic.calibration_access,
+        "comparisonQuantity": lambda self, session, module_name: self.characteristic.comparison_quantity,
+        "dependent_characteristic": lambda self, session, module_name: (
+            DependentCharacteristic(
                 self.characteristic.dependent_characteristic.formula,
                 list(self.characteristic.dependent_characteristic.characteristic_id),
             )
-        else:
-            self.dependent_characteristic = None
-        self.discrete = self.characteristic.discrete
-        self.displayIdentifier = (
+            if self.characteristic.dependent_characteristic
+            else None
+        ),
+        "displayIdentifier": lambda self, session, module_name: (
             self.characteristic.display_identifier.display_name if self.characteristic.display_identifier else None
-        )
-        self.ecuAddressExtension = (
+        ),
+        "ecuAddressExtension": lambda self, session, module_name: (
             self.characteristic.ecu_address_extension.extension if self.characteristic.ecu_address_extension else 0
-        )
-        self.encoding = self.characteristic.encoding.encoding if self.characteristic.encoding else None
-        self.extendedLimits = _create_extended_limits(self.characteristic.extended_limits)
-        self.format = self.characteristic.format.formatString if self.characteristic.format else None
-        self.functionList = self.characteristic.function_list.name if self.characteristic.function_list else []
-        self.guardRails = self.characteristic.guard_rails
-        self.mapList = [f.name for f in self.characteristic.map_list] if self.characteristic.map_list else []
-        self.matrixDim = MatrixDim.from_model(self.characteristic.matrix_dim, get_asap2_version(session))
-        self.maxRefresh = _dissect_max_refresh(self.characteristic.max_refresh)
-        self.modelLink = self.characteristic.model_link.link if self.characteristic.model_link else None
-        self.number = self.characteristic.number.number if self.characteristic.number else None
-        self.physUnit = self.characteristic.phys_unit.unit if self.characteristic.phys_unit else None
-        self.readOnly = self.characteristic.read_only
-        self.refMemorySegment = self.characteristic.ref_memory_segment.name if self.characteristic.ref_memory_segment else None
-        self.stepSize = self.characteristic.step_size
-        self.symbolLink = _dissect_symbol_link(self.characteristic.symbol_link)
-        if self.characteristic.virtual_characteristic:
-            self.virtual_characteristic = VirtualCharacteristic(
+        ),
+        "encoding": lambda self, session, module_name: (
+            self.characteristic.encoding.encoding if self.characteristic.encoding else None
+        ),
+        "extendedLimits": lambda self, session, module_name: _create_extended_limits(self.characteristic.extended_limits),
+        "format": lambda self, session, module_name: (
+            self.characteristic.format.formatString if self.characteristic.format else None
+        ),
+        "functionList": lambda self, session, module_name: (
+            self.characteristic.function_list.name if self.characteristic.function_list else []
+        ),
+        "mapList": lambda self, session, module_name: (
+            [f.name for f in self.characteristic.map_list] if self.characteristic.map_list else []
+        ),
+        "matrixDim": lambda self, session, module_name: MatrixDim.from_model(
+            self.characteristic.matrix_dim, get_asap2_version(session)
+        ),
+        "maxRefresh": lambda self, session, module_name: _dissect_max_refresh(self.characteristic.max_refresh),
+        "modelLink": lambda self, session, module_name: (
+            self.characteristic.model_link.link if self.characteristic.model_link else None
+        ),
+        "number": lambda self, session, module_name: self.characteristic.number.number if self.characteristic.number else None,
+        "physUnit": lambda self, session, module_name: (
+            self.characteristic.phys_unit.unit if self.characteristic.phys_unit else None
+        ),
+        "refMemorySegment": lambda self, session, module_name: (
+            self.characteristic.ref_memory_segment.name if self.characteristic.ref_memory_segment else None
+        ),
+        "stepSize": lambda self, session, module_name: self.characteristic.step_size,
+        "symbolLink": lambda self, session, module_name: _dissect_symbol_link(self.characteristic.symbol_link),
+        "virtual_characteristic": lambda self, session, module_name: (
+            VirtualCharacteristic(
                 self.characteristic.virtual_characteristic.formula,
                 list(self.characteristic.virtual_characteristic.characteristic_id),
             )
-        else:
-            self.virtual_characteristic = None
-        self.record_layout_components = create_record_layout_components(self) if self.deposit else None
-        self.fnc_np_shape: tuple = ()
-        if self.matrixDim.valid():
-            self.fnc_np_shape = fnc_np_shape(self.matrixDim)
-        elif self.number is not None:
-            self.fnc_np_shape = (self.number,)
-        elif self.axisDescriptions:
-            self.fnc_np_shape = tuple([ax.maxAxisPoints for ax in self.axisDescriptions])
-        self.if_data = IfData(session.parse_ifdata(self.characteristic.if_data), self.characteristic.if_data)
+            if self.characteristic.virtual_characteristic
+            else None
+        ),
+        "record_layout_components": lambda self, session, module_name: (
+            create_record_layout_components(self) if self.deposit else None
+        ),
+        "fnc_np_shape": lambda self, session, module_name: self._fnc_np_shape(),
+        "if_data": lambda self, session, module_name: IfData(
+            session.parse_ifdata(self.characteristic.if_data), self.characteristic.if_data
+        ),
+    }
 
     def axisDescription(self, axis) -> AxisDescr:
         MAP = {
@@ -3460,7 +4006,7 @@ def axispts_or_characteristic(session, name: str) -> AxisPts | Characteristic:
 
 
 @dataclass
-class Measurement(CachedBase):
+class Measurement(LazyAttributes, CachedBase):
     """Convenient access (read-only) to MEASUREMENT objects.
 
     Parameters
@@ -3683,7 +4229,14 @@ class Measurement(CachedBase):
     fnc_np_shape: tuple
     if_data: list[dict]
 
-    def __init__(self, session, name: str | None = None, module_name: str | None = None, db_instance: model.Measurement | None = None):
+    def __init__(
+        self,
+        session,
+        name: str | None = None,
+        module_name: str | None = None,
+        db_instance: model.Measurement | None = None,
+        lazy: bool | None = None,
+    ):
         if db_instance is not None:
             self.measurement = db_instance
         else:
@@ -3699,29 +4252,51 @@ class Measurement(CachedBase):
         self.accuracy = self.measurement.accuracy
         self.lowerLimit = self.measurement.lowerLimit
         self.upperLimit = self.measurement.upperLimit
-        self.annotations = _annotations(session, self.measurement.annotation)
-        self.arraySize = self.measurement.array_size.number if self.measurement.array_size else None
-        self.bitMask = self.measurement.bit_mask.mask if self.measurement.bit_mask else None
-        self.bitOperation = _dissect_bit_operation(self.measurement.bit_operation)
-        self.byteOrder = self.measurement.byte_order.byteOrder if self.measurement.byte_order else None
         self.discrete = self.measurement.discrete
-        self.displayIdentifier = self.measurement.display_identifier.display_name if self.measurement.display_identifier else None
-        self.ecuAddress = self.measurement.ecu_address.address if self.measurement.ecu_address else None
-        self.ecuAddressExtension = self.measurement.ecu_address_extension.extension if self.measurement.ecu_address_extension else 0
-        self.errorMask = self.measurement.error_mask.mask if self.measurement.error_mask else None
-        self.format = self.measurement.format.formatString if self.measurement.format else None
-        self.functionList = self.measurement.function_list.name if self.measurement.function_list else []
-        self.layout = self.measurement.layout.indexMode if self.measurement.layout else None
-        self.matrixDim = MatrixDim.from_model(self.measurement.matrix_dim, get_asap2_version(session))
-        self.maxRefresh = _dissect_max_refresh(self.measurement.max_refresh)
-        self.physUnit = self.measurement.phys_unit.unit if self.measurement.phys_unit else None
         self.readWrite = False if self.measurement.read_write is None else True
-        self.refMemorySegment = self.measurement.ref_memory_segment.name if self.measurement.ref_memory_segment else None
-        self.symbolLink = _dissect_symbol_link(self.measurement.symbol_link)
-        self.virtual = self.measurement.virtual.measuringChannel if self.measurement.virtual else []
-        self.compuMethod = CompuMethod.get(session, self._conversionRef, module_name)
-        self.fnc_np_shape = fnc_np_shape(self.matrixDim)
-        self.if_data = IfData(session.parse_ifdata(self.measurement.if_data), self.measurement.if_data)
+        self._init_attributes(session, module_name, lazy)
+
+    _attribute_loaders = {
+        "annotations": lambda self, session, module_name: _annotations(session, self.measurement.annotation),
+        "arraySize": lambda self, session, module_name: self.measurement.array_size.number if self.measurement.array_size else None,
+        "bitMask": lambda self, session, module_name: self.measurement.bit_mask.mask if self.measurement.bit_mask else None,
+        "bitOperation": lambda self, session, module_name: _dissect_bit_operation(self.measurement.bit_operation),
+        "byteOrder": lambda self, session, module_name: (
+            self.measurement.byte_order.byteOrder if self.measurement.byte_order else None
+        ),
+        "displayIdentifier": lambda self, session, module_name: (
+            self.measurement.display_identifier.display_name if self.measurement.display_identifier else None
+        ),
+        "ecuAddress": lambda self, session, module_name: (
+            self.measurement.ecu_address.address if self.measurement.ecu_address else None
+        ),
+        "ecuAddressExtension": lambda self, session, module_name: (
+            self.measurement.ecu_address_extension.extension if self.measurement.ecu_address_extension else 0
+        ),
+        "errorMask": lambda self, session, module_name: self.measurement.error_mask.mask if self.measurement.error_mask else None,
+        "format": lambda self, session, module_name: self.measurement.format.formatString if self.measurement.format else None,
+        "functionList": lambda self, session, module_name: (
+            self.measurement.function_list.name if self.measurement.function_list else []
+        ),
+        "layout": lambda self, session, module_name: self.measurement.layout.indexMode if self.measurement.layout else None,
+        "matrixDim": lambda self, session, module_name: MatrixDim.from_model(
+            self.measurement.matrix_dim, get_asap2_version(session)
+        ),
+        "maxRefresh": lambda self, session, module_name: _dissect_max_refresh(self.measurement.max_refresh),
+        "physUnit": lambda self, session, module_name: self.measurement.phys_unit.unit if self.measurement.phys_unit else None,
+        "refMemorySegment": lambda self, session, module_name: (
+            self.measurement.ref_memory_segment.name if self.measurement.ref_memory_segment else None
+        ),
+        "symbolLink": lambda self, session, module_name: _dissect_symbol_link(self.measurement.symbol_link),
+        "virtual": lambda self, session, module_name: (
+            self.measurement.virtual.measuringChannel if self.measurement.virtual else []
+        ),
+        "compuMethod": lambda self, session, module_name: CompuMethod.get(session, self._conversionRef, module_name),
+        "fnc_np_shape": lambda self, session, module_name: fnc_np_shape(self.matrixDim),
+        "if_data": lambda self, session, module_name: IfData(
+            session.parse_ifdata(self.measurement.if_data), self.measurement.if_data
+        ),
+    }
 
     @property
     def is_virtual(self):
@@ -4932,6 +5507,107 @@ class UserRights(CachedBase):
         return _to_json_str(self.to_dict(), indent)
 
 
+CONVERT_BATCH_SIZE = 500  # Names per query in `Module.convert_many()`.
+
+
+@dataclass(frozen=True)
+class TableColumn:
+    """Column of `Module.measurement_table()` / `Module.characteristic_table()`.
+
+    Attributes
+    ----------
+    attribute : str
+        Column of the element's table, or of the table of `relationship`
+    relationship : Optional[str]
+        Optional element (e.g. "bit_mask"), outer-joined to the element
+    dtype : str
+        NumPy dtype of the result; "O" (object) for strings, missing values are None
+    default : Any
+        Value of integer columns if the optional element is missing; None gives a masked array
+    """
+
+    attribute: str
+    relationship: str | None = None
+    dtype: str = "O"
+    default: Any = None
+
+
+_COMMON_TABLE_COLUMNS = {
+    "name": TableColumn("name"),
+    "longIdentifier": TableColumn("longIdentifier"),
+    "conversion": TableColumn("conversion"),
+    "lowerLimit": TableColumn("lowerLimit", dtype="float64"),
+    "upperLimit": TableColumn("upperLimit", dtype="float64"),
+    "ecuAddressExtension": TableColumn("extension", "ecu_address_extension", "int64", default=0),
+    "bitMask": TableColumn("mask", "bit_mask", "uint64"),
+    "byteOrder": TableColumn("byteOrder", "byte_order"),
+    "format": TableColumn("formatString", "format"),
+    "physUnit": TableColumn("unit", "phys_unit"),
+}
+
+MEASUREMENT_TABLE_COLUMNS = {
+    "name": _COMMON_TABLE_COLUMNS["name"],
+    "longIdentifier": _COMMON_TABLE_COLUMNS["longIdentifier"],
+    "datatype": TableColumn("datatype"),
+    "conversion": _COMMON_TABLE_COLUMNS["conversion"],
+    "resolution": TableColumn("resolution", dtype="int64"),
+    "accuracy": TableColumn("accuracy", dtype="float64"),
+    "lowerLimit": _COMMON_TABLE_COLUMNS["lowerLimit"],
+    "upperLimit": _COMMON_TABLE_COLUMNS["upperLimit"],
+    "ecuAddress": TableColumn("address", "ecu_address", "uint64"),
+    "arraySize": TableColumn("number", "array_size", "int64"),
+    **{name: column for name, column in _COMMON_TABLE_COLUMNS.items() if name not in ("name", "longIdentifier")},
+}
+
+CHARACTERISTIC_TABLE_COLUMNS = {
+    "name": _COMMON_TABLE_COLUMNS["name"],
+    "longIdentifier": _COMMON_TABLE_COLUMNS["longIdentifier"],
+    "type": TableColumn("type"),
+    "address": TableColumn("address", dtype="uint64"),
+    "deposit": TableColumn("deposit"),
+    "maxDiff": TableColumn("maxDiff", dtype="float64"),
+    "conversion": _COMMON_TABLE_COLUMNS["conversion"],
+    "lowerLimit": _COMMON_TABLE_COLUMNS["lowerLimit"],
+    "upperLimit": _COMMON_TABLE_COLUMNS["upperLimit"],
+    "number": TableColumn("number", "number", "int64"),
+    **{name: column for name, column in _COMMON_TABLE_COLUMNS.items() if name not in ("name", "longIdentifier")},
+}
+
+
+def _table_array(column: TableColumn, values: tuple) -> np.ndarray:
+    if column.dtype == "O":
+        result = np.empty(len(values), dtype=object)
+        result[:] = values
+        return result
+    if np.dtype(column.dtype).kind == "f":
+        return np.array(values, dtype=column.dtype)  # None becomes NaN.
+    if column.relationship is None:
+        return np.array(values, dtype=column.dtype)
+    if column.default is not None:
+        return np.array([column.default if value is None else value for value in values], dtype=column.dtype)
+    mask = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+    data = np.array([0 if value is None else value for value in values] if mask.any() else values, dtype=column.dtype)
+    return np.ma.masked_array(data, mask=mask)
+
+
+def _batched(items: list, size: int) -> Generator[list, None, None]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _convert_group(convert: Callable, lut: np.ndarray | None, signals: list[tuple[str, np.ndarray]]) -> list[tuple[str, Any]]:
+    """Convert signals sharing a COMPU_METHOD and datatype (with its dense table, if any), see `Module.convert_many()`."""
+    if lut is not None:
+        return [(name, lut.take(values.view(f"u{values.dtype.itemsize}"))) for name, values in signals]
+    if len(signals) > 1 and len({values.dtype for _, values in signals}) == 1:
+        flat = np.concatenate([values.ravel() for _, values in signals])
+        result = np.asarray(convert(flat))
+        if result.shape == flat.shape:
+            parts = np.split(result, np.cumsum([values.size for _, values in signals])[:-1])
+            return [(name, part.reshape(values.shape)) for (name, values), part in zip(signals, parts)]
+    return [(name, np.asarray(convert(values))) for name, values in signals]
+
+
 @dataclass
 class Module(CachedBase):
     """
@@ -4996,34 +5672,173 @@ class Module(CachedBase):
         self.name = self.module.name
         self.longIdentifier = self.module.longIdentifier
 
-        self.axis_pts = FilteredList(self.session, self.module.axis_pts, AxisPts)
-        self.blob = FilteredList(self.session, self.module.blob, Blob)
+        self.axis_pts = FilteredList(self.session, "axis_pts", AxisPts, parent=self.module)
+        self.blob = FilteredList(self.session, "blob", Blob, parent=self.module)
 
-        self.characteristic = FilteredList(self.session, self.module.characteristic, Characteristic)
-        self.compu_method = FilteredList(self.session, self.module.compu_method, CompuMethod)
-        self.compu_tab = FilteredList(self.session, self.module.compu_tab, CompuTab)
-        self.compu_tab_verb = FilteredList(self.session, self.module.compu_vtab, CompuTabVerb)
-        self.compu_tab_verb_ranges = FilteredList(self.session, self.module.compu_vtab_range, CompuTabVerbRanges)
+        self.characteristic = FilteredList(self.session, "characteristic", Characteristic, parent=self.module)
+        self.compu_method = FilteredList(self.session, "compu_method", CompuMethod, parent=self.module)
+        self.compu_tab = FilteredList(self.session, "compu_tab", CompuTab, parent=self.module)
+        self.compu_tab_verb = FilteredList(self.session, "compu_vtab", CompuTabVerb, parent=self.module)
+        self.compu_tab_verb_ranges = FilteredList(self.session, "compu_vtab_range", CompuTabVerbRanges, parent=self.module)
 
-        self.frame = FilteredList(self.session, self.module.frame, Frame)
-        self.function = FilteredList(self.session, self.module.function, Function)
-        self.group = FilteredList(self.session, self.module.group, Group, "groupName")
+        self.frame = FilteredList(self.session, "frame", Frame, parent=self.module)
+        self.function = FilteredList(self.session, "function", Function, parent=self.module)
+        self.group = FilteredList(self.session, "group", Group, "groupName", parent=self.module)
         self.if_data = IfData(self.session.parse_ifdata(self.module.if_data), self.module.if_data)
 
-        self.measurement = FilteredList(self.session, self.module.measurement, Measurement)
+        self.measurement = FilteredList(self.session, "measurement", Measurement, parent=self.module)
         self.mod_common = ModCommon.get(self.session, self.name, module_name=self.module.name)
         self.mod_par = ModPar.get(self.session, self.name, module_name=self.module.name)
 
-        self.record_layout = FilteredList(self.session, self.module.record_layout, RecordLayout)
-        self.transformer = FilteredList(self.session, self.module.transformer, Transformer)
+        self.record_layout = FilteredList(self.session, "record_layout", RecordLayout, parent=self.module)
+        self.transformer = FilteredList(self.session, "transformer", Transformer, parent=self.module)
 
-        self.typedef_structure = FilteredList(self.session, self.module.typedef_structure, TypedefStructure)
+        self.typedef_structure = FilteredList(self.session, "typedef_structure", TypedefStructure, parent=self.module)
 
-        self.unit = FilteredList(self.session, self.module.unit, Unit)
-        self.user_rights = FilteredList(self.session, self.module.user_rights, UserRights, "userLevelId")
+        self.unit = FilteredList(self.session, "unit", Unit, parent=self.module)
+        self.user_rights = FilteredList(self.session, "user_rights", UserRights, "userLevelId", parent=self.module)
 
         self.variant_coding = VariantCoding.get(self.session, module_name=self.module.name)
 
+    def convert_many(self, signals: Mapping[str, Any], direction: str = "int_to_physical", *, workers: int = 1) -> dict[str, Any]:
+        """Convert the values of many MEASUREMENTs at once.
+
+        Parameters
+        ----------
+        signals : Mapping[str, Any]
+            Values (scalars or array-likes) by MEASUREMENT name
+        direction : str, optional
+            "int_to_physical" (default) or "physical_to_int"
+        workers : int, optional
+            Number of threads converting groups in parallel (NumPy releases the GIL), by default 1
+
+        Returns
+        -------
+        dict[str, Any]
+            Converted values as NumPy arrays of the input shapes, by MEASUREMENT name (in input order)
+
+        Raises
+        ------
+        KeyError
+            If a name is not a MEASUREMENT of this module
+        ValueError
+            If `direction` is unknown or a MEASUREMENT references a missing COMPU_METHOD
+
+        Notes
+        -----
+        MEASUREMENTs and COMPU_METHODs are resolved with one query each (per `CONVERT_BATCH_SIZE` names);
+        signals sharing COMPU_METHOD and datatype are converted with a single vectorized call.
+        """
+        if direction not in ("int_to_physical", "physical_to_int"):
+            raise ValueError(f"direction must be 'int_to_physical' or 'physical_to_int', got {direction!r}.")
+        names = list(signals)
+        conversions: dict[str, tuple[str, str]] = {}
+        for chunk in _batched(names, CONVERT_BATCH_SIZE):
+            rows = self.session.query(model.Measurement.name, model.Measurement.conversion, model.Measurement.datatype).filter(
+                with_parent(self.module, model.Module.measurement), model.Measurement.name.in_(chunk)
+            )
+            conversions.update((name, (conversion, datatype)) for name, conversion, datatype in rows)
+        missing = [name for name in names if name not in conversions]
+        if missing:
+            raise KeyError(f"MEASUREMENT(s) {', '.join(missing)} not found in module {self.name!r}.")
+
+        methods: dict[str, Any] = {"NO_COMPU_METHOD": NoCompuMethod()}
+        method_names = sorted({conversion for conversion, _ in conversions.values()} - methods.keys())
+        for chunk in _batched(method_names, CONVERT_BATCH_SIZE):
+            rows = self.session.query(model.CompuMethod).filter(
+                with_parent(self.module, model.Module.compu_method), model.CompuMethod.name.in_(chunk)
+            )
+            for row in rows:
+                methods[row.name] = CompuMethod.get(self.session, row.name, self.name, db_instance=row)
+        groups: dict[tuple[str, str], list[str]] = {}
+        for name in names:
+            groups.setdefault(conversions[name], []).append(name)
+
+        tasks = []
+        for (conversion, datatype), members in groups.items():
+            method = methods.get(conversion)
+            if method is None:
+                raise ValueError(f"COMPU_METHOD {conversion!r} does not exist.")
+            values = [(name, np.asarray(signals[name])) for name in members]
+            lut = None
+            if direction == "int_to_physical" and isinstance(method, CompuMethod) and method.dense_luts:
+                dtype = CompuMethod.DENSE_LUT_TYPES.get(datatype)
+                if all(array.dtype == dtype for _, array in values):
+                    lut = method.dense_lut(datatype)  # Looked up here, as the session cache is not thread-safe.
+            tasks.append((getattr(method, direction), lut, values))
+        if workers > 1 and len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                converted = list(pool.map(lambda task: _convert_group(*task), tasks))
+        else:
+            converted = [_convert_group(*task) for task in tasks]
+        results = {name: value for group in converted for name, value in group}
+        return {name: results[name] for name in names}
+
+    def measurement_table(self, columns: Iterable[str] | None = None) -> dict[str, np.ndarray]:
+        """Columns of all MEASUREMENTs of the module, from a single query.
+
+        Parameters
+        ----------
+        columns : Optional[Iterable[str]], optional
+            Names from `MEASUREMENT_TABLE_COLUMNS` (named like the `Measurement` attributes), by default all
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            One array per column, rows ordered as in the A2L file; ``pandas.DataFrame(result)`` gives a table.
+            Strings are object arrays, optional integers (e.g. "bitMask") masked arrays.
+
+        Raises
+        ------
+        ValueError
+            On unknown column names
+        """
+        return self._element_table(model.Measurement, "measurement", MEASUREMENT_TABLE_COLUMNS, columns)
+
+    def characteristic_table(self, columns: Iterable[str] | None = None) -> dict[str, np.ndarray]:
+        """Columns of all CHARACTERISTICs of the module, from a single query.
+
+        Parameters
+        ----------
+        columns : Optional[Iterable[str]], optional
+            Names from `CHARACTERISTIC_TABLE_COLUMNS` (named like the `Characteristic` attributes), by default all
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            See :meth:`measurement_table`; "deposit" is the name of the RECORD_LAYOUT.
+
+        Raises
+        ------
+        ValueError
+            On unknown column names
+        """
+        return self._element_table(model.Characteristic, "characteristic", CHARACTERISTIC_TABLE_COLUMNS, columns)
+
+    def _element_table(
+        self, model_class: Any, association: str, available: dict[str, TableColumn], columns: Iterable[str] | None
+    ) -> dict[str, np.ndarray]:
+        names = list(available) if columns is None else list(columns)
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            raise ValueError(f"Unknown column(s) {', '.join(unknown)}; available: {', '.join(available)}.")
+        expressions = []
+        joins = {}
+        for name in names:
+            column = available[name]
+            if column.relationship is None:
+                expressions.append(getattr(model_class, column.attribute))
+            else:
+                relationship = joins.setdefault(column.relationship, getattr(model_class, column.relationship))
+                expressions.append(getattr(relationship.property.mapper.class_, column.attribute))
+        statement = select(*expressions).select_from(model_class)
+        for relationship in joins.values():
+            statement = statement.outerjoin(relationship)
+        statement = statement.where(with_parent(self.module, getattr(model.Module, association))).order_by(model_class.rid)
+        rows = self.session.connection().execute(statement).all()  # Core execution, no ORM row processing.
+        values = list(zip(*rows)) if rows else [()] * len(names)
+        return {name: _table_array(available[name], column_values) for name, column_values in zip(names, values)}
+
     def to_dict(self) -> dict:
         from pya2l.imex.json_exporter import module_to_dict
 
@@ -26,11 +26,18 @@ __copyright__ = """
 """
 
 import enum
-from collections import Counter, namedtuple
+from bisect import bisect_right
+from collections import Counter, defaultdict, namedtuple
+from collections.abc import Iterable
 from logging import getLogger
+from math import prod
+from typing import NamedTuple
+
+from sqlalchemy import select, union
+from sqlalchemy.orm import selectinload
 
 import pya2l.model as model
-from pya2l.api.inspect import ModCommon, ModPar
+from pya2l.api.inspect import ASAM_TYPE_SIZES, ModCommon, ModPar
 
 
 # *** Validator generated no diagnostic messages ***
@@ -95,11 +102,299 @@ _CM_NEEDS_COMPU_TAB_REF = frozenset({"TAB_INTP", "TAB_NOINTP", "TAB_VERB"})
 _CM_NEEDS_FORMULA = frozenset({"FORM"})
 
 
+# Memory of the objects checked for OVERLAPPING_MEMORY.
+_POINTER_SIZES = {"PBYTE": 1, "PWORD": 2, "PLONG": 4, "PLONGLONG": 8}  # ADDRESS_TYPE: the address holds a pointer.
+_AXIS_NAMES = ("x", "y", "z", "4", "5")
+_AXIS_PARAMETERS = ("dist_op", "no_axis_pts", "no_rescale", "offset", "rip_addr", "shift_op", "src_addr")
+_STORED_AXES = frozenset({"STD_AXIS", "RES_AXIS"})  # Axis points are part of the CHARACTERISTIC's record.
+
+
 def names(objs):
     """ """
     return [o.name for o in objs]
 
 
+class MemoryRange(NamedTuple):
+    """Memory [start, end) of an object; `segment` is the MEMORY_SEGMENT containing `start` (if any)."""
+
+    start: int
+    end: int
+    keyword: str
+    name: str
+    extension: int = 0
+    segment: str | None = None
+    bit_mask: int | None = None
+
+
+class _LayoutSize(NamedTuple):
+    """Bytes of a RECORD_LAYOUT's parts."""
+
+    fnc: int  # per FNC_VALUES element
+    fixed: int  # IDENTIFICATION, RESERVED, RIP_ADDR_W
+    axis_points: tuple[int, ...]  # per point of axis x, y, z, 4, 5 (AXIS_PTS, or AXIS_RESCALE pairs)
+    axis_parameters: tuple[int, ...]  # NO_AXIS_PTS, OFFSET, ... of axis x, y, z, 4, 5
+
+
+def _type_size(component) -> int:
+    return ASAM_TYPE_SIZES.get(component.datatype, 0) if component is not None else 0
+
+
+def _layout_size(layout: model.RecordLayout) -> _LayoutSize:
+    axis_points = []
+    axis_parameters = []
+    for axis in _AXIS_NAMES:
+        rescale = getattr(layout, f"axis_rescale_{axis}")
+        axis_points.append(_type_size(getattr(layout, f"axis_pts_{axis}")) or 2 * _type_size(rescale))
+        axis_parameters.append(sum(_type_size(getattr(layout, f"{parameter}_{axis}")) for parameter in _AXIS_PARAMETERS))
+    fixed = _type_size(layout.identification) + _type_size(layout.rip_addr_w)
+    fixed += sum(ASAM_TYPE_SIZES.get(reserved.dataSize, 0) for reserved in layout.reserved)
+    return _LayoutSize(_type_size(layout.fnc_values), fixed, tuple(axis_points), tuple(axis_parameters))
+
+
+def _characteristic_size(layout: _LayoutSize | None, type_: str, count: int, axes: list[tuple[str, int]]) -> int | None:
+    """Bytes of a CHARACTERISTIC; `count`: elements of VAL_BLK / ASCII, `axes`: (attribute, maxAxisPoints) per AXIS_DESCR."""
+    if layout is None:
+        return None
+    if type_ == "VALUE":
+        values = 1
+    elif type_ in ("ASCII", "VAL_BLK"):
+        values = count
+    else:
+        values = prod(points or 1 for _, points in axes)
+    size = values * layout.fnc + layout.fixed
+    for index, (attribute, points) in enumerate(axes[: len(_AXIS_NAMES)]):
+        size += layout.axis_parameters[index]
+        if attribute in _STORED_AXES:
+            size += (points or 0) * layout.axis_points[index]
+    return size
+
+
+def _axis_pts_size(layout: _LayoutSize | None, max_axis_points: int) -> int | None:
+    if layout is None:
+        return None
+    return (max_axis_points or 0) * layout.axis_points[0] + layout.axis_parameters[0] + layout.fixed
+
+
+def memory_overlaps(ranges: Iterable[MemoryRange]) -> list[tuple[MemoryRange, MemoryRange]]:
+    """Overlapping pairs of `ranges`, per address extension and MEMORY_SEGMENT.
+
+    Sort-and-sweep, O(n log n + k) for k overlapping pairs: every range is compared to the
+    ranges still active at its start (the earlier starting range comes first in the pair).
+    Ranges which overlap only in bits of disjoint BIT_MASKs don't count.
+    """
+    groups = defaultdict(list)
+    for memory in ranges:
+        if memory.end > memory.start:
+            groups[(memory.extension, memory.segment)].append(memory)
+    result = []
+    for group in groups.values():
+        group.sort()
+        active = []
+        for memory in group:
+            active = [other for other in active if other.end > memory.start]
+            for other in active:
+                if memory.bit_mask is None or other.bit_mask is None or memory.bit_mask & other.bit_mask:
+                    result.append((other, memory))
+            active.append(memory)
+    return result
+
+
+def memory_ranges(session, module) -> list[MemoryRange]:
+    """Memory of the CHARACTERISTICs, AXIS_PTS, MEASUREMENTs, BLOBs and INSTANCEs of `module`.
+
+    Sizes come from the data types, MATRIX_DIM / ARRAY_SIZE / NUMBER, the RECORD_LAYOUTs
+    (FNC_VALUES, stored axes and their parameters, IDENTIFICATION, RESERVED) and the TYPEDEFs.
+    VIRTUAL MEASUREMENTs, VIRTUAL_CHARACTERISTICs and objects of unknown size are left out.
+    Objects are loaded as plain rows, this also works for very large modules.
+    """
+    rid = module.rid
+    layout_options = [
+        selectinload(getattr(model.RecordLayout, f"{variable}_{axis}"))
+        for axis in _AXIS_NAMES
+        for variable in ("axis_pts", "axis_rescale", *_AXIS_PARAMETERS)
+    ]
+    layout_options.extend(
+        selectinload(getattr(model.RecordLayout, key)) for key in ("fnc_values", "identification", "reserved", "rip_addr_w")
+    )
+    layouts = {
+        layout.name: _layout_size(layout)
+        for layout in session.scalars(
+            select(model.RecordLayout).where(model.RecordLayout._module_rid == rid).options(*layout_options)
+        )
+    }
+    dims: dict[int, list[int]] = defaultdict(list)
+    module_dims = union(
+        *(
+            select(element.matrix_dim_id).where(element._module_rid == rid)
+            for element in (
+                model.Characteristic,
+                model.Measurement,
+                model.Instance,
+                model.TypedefCharacteristic,
+                model.TypedefMeasurement,
+            )
+        )
+    )
+    for dim_rid, number in session.execute(
+        select(model.MatrixDimNumbers.rm_rid, model.MatrixDimNumbers.numbers)
+        .where(model.MatrixDimNumbers.rm_rid.in_(module_dims))
+        .order_by(model.MatrixDimNumbers.rm_rid, model.MatrixDimNumbers.position)
+    ):
+        dims[dim_rid].append(number or 1)
+    matrix = {dim_rid: prod(numbers) for dim_rid, numbers in dims.items()}
+    extension = model.EcuAddressExtension.extension
+
+    result = []
+    char_axes = defaultdict(list)
+    for char_rid, attribute, points in session.execute(
+        select(model.AxisDescr._characteristic_rid, model.AxisDescr.attribute, model.AxisDescr.maxAxisPoints)
+        .join(model.Characteristic, model.AxisDescr._characteristic_rid == model.Characteristic.rid)
+        .where(model.Characteristic._module_rid == rid)
+        .order_by(model.AxisDescr.rid)
+    ):
+        char_axes[char_rid].append((attribute, points))
+    for char_rid, name, type_, address, deposit, ext, dim_rid, number, mask in session.execute(
+        select(
+            model.Characteristic.rid,
+            model.Characteristic.name,
+            model.Characteristic.type,
+            model.Characteristic.address,
+            model.Characteristic.deposit,
+            extension,
+            model.Characteristic.matrix_dim_id,
+            model.Number.number,
+            model.BitMask.mask,
+        )
+        .outerjoin(model.Characteristic.ecu_address_extension)
+        .outerjoin(model.Characteristic.number)
+        .outerjoin(model.Characteristic.bit_mask)
+        .where(model.Characteristic._module_rid == rid, ~model.Characteristic.virtual_characteristic.has())
+    ):
+        count = matrix.get(dim_rid) or number or 1
+        size = _characteristic_size(layouts.get(deposit), type_, count, char_axes.get(char_rid, []))
+        if address is not None and size:
+            result.append(MemoryRange(address, address + size, "CHARACTERISTIC", name, ext or 0, None, mask))
+    for name, address, deposit, max_axis_points, ext in session.execute(
+        select(model.AxisPts.name, model.AxisPts.address, model.AxisPts.depositAttr, model.AxisPts.maxAxisPoints, extension)
+        .outerjoin(model.AxisPts.ecu_address_extension)
+        .where(model.AxisPts._module_rid == rid)
+    ):
+        size = _axis_pts_size(layouts.get(deposit), max_axis_points)
+        if address is not None and size:
+            result.append(MemoryRange(address, address + size, "AXIS_PTS", name, ext or 0))
+    for name, datatype, address, ext, number, dim_rid, mask, address_type in session.execute(
+        select(
+            model.Measurement.name,
+            model.Measurement.datatype,
+            model.EcuAddress.address,
+            extension,
+            model.ArraySize.number,
+            model.Measurement.matrix_dim_id,
+            model.BitMask.mask,
+            model.AddressType.addressType,
+        )
+        .join(model.Measurement.ecu_address)
+        .outerjoin(model.Measurement.ecu_address_extension)
+        .outerjoin(model.Measurement.array_size)
+        .outerjoin(model.Measurement.bit_mask)
+        .outerjoin(model.Measurement.address_type)
+        .where(model.Measurement._module_rid == rid, ~model.Measurement.virtual.has())
+    ):
+        size = _POINTER_SIZES.get(address_type) or ASAM_TYPE_SIZES.get(datatype, 0) * (matrix.get(dim_rid) or number or 1)
+        if address is not None and size:
+            result.append(MemoryRange(address, address + size, "MEASUREMENT", name, ext or 0, None, mask))
+    for name, address, size, ext in session.execute(
+        select(model.Blob.name, model.Blob.address, model.Blob.size, extension)
+        .outerjoin(model.Blob.ecu_address_extension)
+        .where(model.Blob._module_rid == rid)
+    ):
+        if address is not None and size:
+            result.append(MemoryRange(address, address + size, "BLOB", name, ext or 0))
+    typedef_sizes = _typedef_sizes(session, rid, layouts, matrix)
+    for name, typedef_name, address, ext, dim_rid, address_type in session.execute(
+        select(
+            model.Instance.name,
+            model.Instance.typedefName,
+            model.Instance.address,
+            extension,
+            model.Instance.matrix_dim_id,
+            model.AddressType.addressType,
+        )
+        .outerjoin(model.Instance.ecu_address_extension)
+        .outerjoin(model.Instance.address_type)
+        .where(model.Instance._module_rid == rid)
+    ):
+        size = _POINTER_SIZES.get(address_type) or (typedef_sizes.get(typedef_name) or 0) * matrix.get(dim_rid, 1)
+        if address is not None and size:
+            result.append(MemoryRange(address, address + size, "INSTANCE", name, ext or 0))
+    return _assign_segments(session, rid, result)
+
+
+def _typedef_sizes(session, module_rid: int, layouts: dict[str, _LayoutSize], matrix: dict[int, int]) -> dict[str, int]:
+    """Bytes of the TYPEDEF_* of a module, by name."""
+    result = {}
+    for typedef in (model.TypedefStructure, model.TypedefBlob):
+        result.update(session.execute(select(typedef.name, typedef.size).where(typedef._module_rid == module_rid)).all())
+    for name, datatype, dim_rid in session.execute(
+        select(model.TypedefMeasurement.name, model.TypedefMeasurement.datatype, model.TypedefMeasurement.matrix_dim_id).where(
+            model.TypedefMeasurement._module_rid == module_rid
+        )
+    ):
+        result[name] = ASAM_TYPE_SIZES.get(datatype, 0) * matrix.get(dim_rid, 1)
+    for name, deposit, max_axis_points in session.execute(
+        select(model.TypedefAxis.name, model.TypedefAxis.depositAttr, model.TypedefAxis.maxAxisPoints).where(
+            model.TypedefAxis._module_rid == module_rid
+        )
+    ):
+        result[name] = _axis_pts_size(layouts.get(deposit), max_axis_points)
+    axes = defaultdict(list)
+    for typedef_rid, attribute, points in session.execute(
+        select(model.AxisDescr._typedef_characteristic_rid, model.AxisDescr.attribute, model.AxisDescr.maxAxisPoints)
+        .join(model.TypedefCharacteristic, model.AxisDescr._typedef_characteristic_rid == model.TypedefCharacteristic.rid)
+        .where(model.TypedefCharacteristic._module_rid == module_rid)
+        .order_by(model.AxisDescr.rid)
+    ):
+        axes[typedef_rid].append((attribute, points))
+    for typedef_rid, name, type_, deposit, dim_rid, number in session.execute(
+        select(
+            model.TypedefCharacteristic.rid,
+            model.TypedefCharacteristic.name,
+            model.TypedefCharacteristic.type,
+            model.TypedefCharacteristic.deposit,
+            model.TypedefCharacteristic.matrix_dim_id,
+            model.Number.number,
+        )
+        .outerjoin(model.TypedefCharacteristic.number)
+        .where(model.TypedefCharacteristic._module_rid == module_rid)
+    ):
+        count = matrix.get(dim_rid) or number or 1
+        result[name] = _characteristic_size(layouts.get(deposit), type_, count, axes.get(typedef_rid, []))
+    return result
+
+
+def _assign_segments(session, module_rid: int, ranges: list[MemoryRange]) -> list[MemoryRange]:
+    """Set `MemoryRange.segment` to the MEMORY_SEGMENT (of MOD_PAR) containing the start address."""
+    segments = sorted(
+        session.execute(
+            select(model.MemorySegment.address, model.MemorySegment.size, model.MemorySegment.name)
+            .join(model.ModPar, model.MemorySegment._mod_par_rid == model.ModPar.rid)
+            .where(model.ModPar._module_rid == module_rid)
+        )
+    )
+    if not segments:
+        return ranges
+    starts = [address for address, _, _ in segments]
+    result = []
+    for memory in ranges:
+        index = bisect_right(starts, memory.start) - 1
+        if index >= 0:
+            address, size, name = segments[index]
+            if memory.start < address + size:
+                memory = memory._replace(segment=name)
+        result.append(memory)
+    return result
+
+
 class Validator:
     """
     Paramaters
@@ -151,6 +446,7 @@ class Validator:
             self._check_limits(module)
             self._check_characteristic_axis_counts(module)
             self._check_ecu_addresses(module)
+            self._check_overlapping_memory(module)
 
     def _validate_mod_common(self, module):
         if module.mod_common is None:
@@ -402,6 +698,20 @@ class Validator:
                     f"{module.name}: MEASUREMENT '{meas.name}' has no ECU_ADDRESS (cannot be acquired).",
                 )
 
+    def _check_overlapping_memory(self, module):
+        """Emit OVERLAPPING_MEMORY for objects sharing memory, see :func:`memory_overlaps`."""
+        for first, second in memory_overlaps(memory_ranges(self.session, module)):
+            where = f"address extension {second.extension}"
+            if second.segment is not None:
+                where += f", MEMORY_SEGMENT '{second.segment}'"
+            self.emit_diagnostic(
+                Level.ERROR,
+                Category.DUPLICATE,
+                Diagnostics.OVERLAPPING_MEMORY,
+                f"{module.name}: {second.keyword} '{second.name}' [0x{second.start:X}, 0x{second.end:X}) overlaps "
+                f"{first.keyword} '{first.name}' [0x{first.start:X}, 0x{first.end:X}) ({where}).",
+            )
+
     def _check_c_identifier_lengths(self, module):
         """Emit INVALID_C_IDENTIFIER for any name exceeding MAX_C_IDENTIFIER_LEN (ISO C90)."""
         named_collections = [
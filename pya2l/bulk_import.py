@@ -0,0 +1,518 @@
+__copyright__ = """
+    pySART - Simplified AUTOSAR-Toolkit for Python.
+
+   (C) 2026 by Christoph Schueler <github.com/Christoph2,
+                                        cpu12.gems@googlemail.com>
+
+   All Rights Reserved
+
+  This program is free software; you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation; either version 2 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License along
+  with this program; if not, write to the Free Software Foundation, Inc.,
+  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+"""Bulk Core-INSERT import path.
+
+The ORM path (:meth:`pya2l.a2lparser.A2LParser.traverse`) creates one mapped
+instance per keyword and lets the unit-of-work resolve foreign keys on flush.
+:class:`BulkImporter` instead walks the ``ValueContainer`` tree once, turns every
+keyword into a plain row dictionary and writes the rows table by table with
+``executemany`` inserts.
+
+Primary keys are handed out from per-table ``rid`` counters while walking the
+tree, so foreign keys are known up-front and never need a round-trip to the
+database. Foreign-key checks are deferred until commit, because rows are
+buffered in post-order (children before their parents).
+
+The importer can also be fed incrementally (:meth:`BulkImporter.add_chunk`) by
+the streaming parser ``a2lparser_ext.parse_stream``, which hands over every
+completed MODULE child as soon as it is parsed; memory use then stays bounded by
+``batch_size`` instead of growing with the file.
+
+With :meth:`BulkImporter.run_parallel` every MODULE is parsed and converted to
+rows in a worker process (:func:`collect_module_rows`); the rows are shifted
+into the writer's ``rid`` ranges and written by the single writer process.
+The preprocessor state (includes, IF_DATA offsets, token buffer) belongs to one
+parse, so every worker preprocesses the whole file again and skips the children
+of the other MODULEs at token level; N workers thus cost N + 1 preprocessing runs.
+"""
+
+import typing
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+
+from sqlalchemy import bindparam, func, inspect, select, text
+from sqlalchemy.ext.associationproxy import AssociationProxy
+from sqlalchemy.orm import MANYTOONE
+
+from pya2l import model
+from pya2l.a2lparser import (
+    ASSOC_MAP,
+    FLAG_KEYWORDS,
+    KW_MAP,
+    VALUE_TABLE_MAP,
+    ZIPPER_MAP,
+    _get_parser_ext,
+    decode_if_data_sections,
+)
+from pya2l.logger import Logger
+
+
+BATCH_SIZE = 50000  # Buffered rows (all tables) before an executemany round.
+
+
+class Link(typing.NamedTuple):
+    """How a child keyword is attached to its parent row."""
+
+    kind: str  # "parent_fk" | "child_fk" | "association" | "flag" | "detached"
+    column: str | None = None
+    association: typing.Optional["TablePlan"] = None
+    association_column: str | None = None
+
+
+class Collection(typing.NamedTuple):
+    """One-to-many collection of plain value rows (identifiers, COMPU_TAB pairs, ...)."""
+
+    plan: "TablePlan"
+    parent_column: str
+    value_column: str | None
+
+
+class ModuleRows(typing.NamedTuple):
+    """Rows of one MODULE subtree, as collected by a worker process.
+
+    ``rid`` values (and foreign keys) are local to the worker: 1, 2, ... per table.
+    """
+
+    tables: dict[str, tuple[tuple[str, ...], list[tuple]]]  # table name -> (column keys, rows)
+    counters: dict[tuple[str, str], list[dict[str, int]]]  # (table name, counter column) -> updates
+    module: dict[str, typing.Any]  # Placeholder MODULE row (only link columns are set).
+    keywords: int
+
+
+@cache
+def _foreign_key_targets(table: typing.Any) -> dict[str, typing.Any]:
+    return {column.key: fk.column.table for column in table.columns for fk in column.foreign_keys}
+
+
+class TablePlan:
+    """Per mapped class: target table, row template and attachment rules."""
+
+    def __init__(self, klass: type) -> None:
+        self.mapper = inspect(klass)
+        self.table = self.mapper.local_table
+        self.columns: dict[str, str] = {prop.key: prop.columns[0].key for prop in self.mapper.column_attrs}
+        template: dict[str, typing.Any] = {}
+        for column in self.table.columns:
+            default = column.default
+            template[column.key] = default.arg if default is not None and default.is_scalar else None
+        if self.mapper.polymorphic_on is not None and self.mapper.polymorphic_identity is not None:
+            template[self.mapper.polymorphic_on.key] = self.mapper.polymorphic_identity
+        self.template = template
+        self._links: dict[str, Link] = {}
+        self._collections: dict[str, Collection] = {}
+
+    @classmethod
+    @cache
+    def get(cls, klass: type) -> "TablePlan":
+        return cls(klass)
+
+    def new_row(self, rid: int) -> dict[str, typing.Any]:
+        row = self.template.copy()
+        row["rid"] = rid
+        return row
+
+    def link(self, attr: str) -> Link:
+        result = self._links.get(attr)
+        if result is None:
+            result = self._links[attr] = self._make_link(attr)
+        return result
+
+    def _make_link(self, attr: str) -> Link:
+        relationships = self.mapper.relationships
+        if attr in relationships:
+            rel = relationships[attr]
+            local, remote = rel.local_remote_pairs[0]
+            if rel.direction is MANYTOONE:
+                return Link("parent_fk", column=local.key)
+            return Link("child_fk", column=remote.key)
+        descriptor = self.mapper.all_orm_descriptors.get(attr)
+        if isinstance(descriptor, AssociationProxy):
+            # Polymorphic association (ANNOTATION, IF_DATA): parent -> association row -> children.
+            rel = relationships[descriptor.target_collection]
+            assoc_mapper = rel.mapper
+            inner = assoc_mapper.relationships[descriptor.value_attr]
+            return Link(
+                "association",
+                column=rel.local_remote_pairs[0][0].key,
+                association=TablePlan.get(assoc_mapper.class_),
+                association_column=inner.local_remote_pairs[0][1].key,
+            )
+        if attr in self.columns:
+            return Link("flag", column=self.columns[attr])
+        return Link("detached")
+
+    def collection(self, attr: str) -> Collection:
+        """`attr` is either a one-to-many relationship or an association proxy on top of one."""
+        result = self._collections.get(attr)
+        if result is None:
+            value_column = None
+            descriptor = self.mapper.all_orm_descriptors.get(attr)
+            if isinstance(descriptor, AssociationProxy):
+                rel = self.mapper.relationships[descriptor.target_collection]
+                value_attr = descriptor.value_attr
+            else:
+                rel = self.mapper.relationships[attr]
+                value_attr = None
+            plan = TablePlan.get(rel.mapper.class_)
+            if value_attr is not None:
+                value_column = plan.columns[value_attr]
+            result = self._collections[attr] = Collection(
+                plan=plan,
+                parent_column=rel.local_remote_pairs[0][1].key,
+                value_column=value_column,
+            )
+        return result
+
+
+class BulkImporter:
+    """Write a parsed ``ValueContainer`` tree with Core ``executemany`` inserts.
+
+    Parameters
+    ----------
+    session: SessionProxy
+        Session of the freshly created :class:`pya2l.model.A2LDatabase`.
+
+    encoding: str
+        Encoding used to decode raw IF_DATA sections.
+
+    progress: callable
+        Called once for every visited keyword (drives the progress bar).
+
+    batch_size: int
+        Number of buffered rows (over all tables) that triggers a write round.
+    """
+
+    def __init__(
+        self,
+        session: typing.Any,
+        encoding: str = "latin-1",
+        progress: typing.Callable[[], None] | None = None,
+        batch_size: int = BATCH_SIZE,
+    ) -> None:
+        self.session = session
+        self.encoding = encoding
+        self.progress = progress
+        self.batch_size = batch_size
+        self.logger = Logger("A2LDB.bulk", "INFO")
+        self._rids: dict[typing.Any, int] = {}
+        self._buffers: dict[typing.Any, list[dict[str, typing.Any]]] = defaultdict(list)
+        self._pending = 0
+        self._named_tables: dict[tuple[str, str], int] = {}
+        self._forbidden_combinations: deque[int] = deque()
+        self._counters: dict[typing.Any, list[dict[str, int]]] = defaultdict(list)
+        self._module_rows: list[dict[str, typing.Any]] = []
+        self._modules_visited = 0
+        self._started = False
+        self.row_count = 0
+
+    def run(self, tree: typing.Any, tables: typing.Sequence[typing.Any]) -> int:
+        """Import `tree` and the value tables (COMPU_TAB pairs, ...) delivered by the parser.
+
+        When fed by the streaming parser, `tree` is the remaining PROJECT / MODULE
+        skeleton after all :meth:`add_chunk` calls.
+
+        Returns the number of inserted rows.
+        """
+        self._start()
+        for keyword in tree.get_keywords():
+            self.visit(keyword, None, None, None)
+        self.write_value_tables(tables)
+        self.flush()
+        return self.row_count
+
+    def run_parallel(
+        self, file_name: str, tree: typing.Any, tables: typing.Sequence[typing.Any], workers: int, token_buffer: str = "file"
+    ) -> int:
+        """Import MODULEs in up to `workers` processes; `tree` is the skeleton returned by ``parse_stream``.
+
+        Returns the number of inserted rows.
+        """
+        self._start()
+        module_count = sum(
+            1
+            for project in tree.get_keywords()
+            if project.get_name() == "Project"
+            for keyword in project.get_keywords()
+            if keyword.get_name() == "Module"
+        )
+        for index in range(module_count):
+            self.module_row(index)
+        if module_count:
+            with ProcessPoolExecutor(max_workers=max(1, min(workers, module_count))) as pool:
+                futures = [
+                    pool.submit(collect_module_rows, file_name, self.encoding, token_buffer, index) for index in range(module_count)
+                ]
+                # Merge in file order, so rids come out as with a sequential import.
+                for index, future in enumerate(futures):
+                    self.merge(future.result(), self._module_rows[index])
+        return self.run(tree, tables)
+
+    def merge(self, rows: ModuleRows, module_row: dict[str, typing.Any]) -> None:
+        """Write worker `rows` of the MODULE reserved as `module_row`, shifting rids into this importer's ranges."""
+        tables = model.Base.metadata.tables
+        module_plan = TablePlan.get(model.Module)
+        offsets = {module_plan.table: module_row["rid"] - rows.module["rid"]}
+        for name, (_, values) in rows.tables.items():
+            table = tables[name]
+            offsets[table] = self.next_rid(table) - 1
+            self._rids[table] += len(values) - 1
+        for name, (keys, values) in rows.tables.items():
+            table = tables[name]
+            targets = _foreign_key_targets(table)
+            shifts = [(keys.index("rid"), offsets[table])]
+            shifts.extend((idx, offsets.get(targets[key], 0)) for idx, key in enumerate(keys) if key in targets)
+            for value_row in values:
+                row = list(value_row)
+                for idx, offset in shifts:
+                    if row[idx] is not None:
+                        row[idx] += offset
+                self.buffer(table, dict(zip(keys, row)))
+        targets = _foreign_key_targets(module_plan.table)
+        for key, value in rows.module.items():
+            if key != "rid" and value is not None and value != module_plan.template.get(key):
+                module_row[key] = value + offsets[targets[key]] if key in targets else value
+        for (name, counter), params in rows.counters.items():
+            table = tables[name]
+            offset = offsets[table]
+            self._counters[(table, counter)].extend({"_rid": p["_rid"] + offset, "_count": p["_count"]} for p in params)
+        if self.progress is not None:
+            for _ in range(rows.keywords):
+                self.progress()
+
+    def add_chunk(self, module_index: int, chunk: typing.Any, tables: typing.Sequence[typing.Any]) -> None:
+        """Import one completed MODULE child (streaming parser callback)."""
+        self._start()
+        module_plan = TablePlan.get(model.Module)
+        attr, _ = ASSOC_MAP["Module"][chunk.get_name()]
+        self.visit(chunk, module_plan, self.module_row(module_index), attr)
+        self.write_value_tables(tables)
+
+    def module_row(self, index: int) -> dict[str, typing.Any]:
+        """Row of the `index`-th MODULE; reserved up-front so streamed children can reference it."""
+        plan = TablePlan.get(model.Module)
+        while len(self._module_rows) <= index:
+            self._module_rows.append(plan.new_row(self.next_rid(plan.table)))
+        return self._module_rows[index]
+
+    def _start(self) -> None:
+        if not self._started:
+            # defer_foreign_keys is reset at the end of each transaction, and pysqlite only
+            # issues BEGIN in front of the first DML statement -- so open the transaction here.
+            dbapi_connection = self.session.connection().connection.dbapi_connection
+            if not dbapi_connection.in_transaction:
+                dbapi_connection.execute("BEGIN")
+            self.session.execute(text("PRAGMA defer_foreign_keys = ON"))
+            self._started = True
+
+    def next_rid(self, table: typing.Any) -> int:
+        rid = self._rids.get(table)
+        if rid is None:
+            rid = self.session.execute(select(func.max(table.c.rid))).scalar() or 0
+        rid += 1
+        self._rids[table] = rid
+        return rid
+
+    def buffer(self, table: typing.Any, row: dict[str, typing.Any]) -> None:
+        self._buffers[table].append(row)
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not (self._pending or self._counters):
+            return
+        for table in model.Base.metadata.sorted_tables:
+            rows = self._buffers.pop(table, None)
+            if rows:
+                self.session.execute(table.insert(), rows)
+                self.row_count += len(rows)
+        self._pending = 0
+        for (table, counter), params in self._counters.items():
+            stmt = table.update().where(table.c.rid == bindparam("_rid")).values({counter: bindparam("_count")})
+            self.session.execute(stmt, params)
+        self._counters.clear()
+
+    def visit(self, tree: typing.Any, parent_plan: TablePlan | None, parent_row: dict | None, attr: str | None) -> None:
+        if self.progress is not None:
+            self.progress()
+        name = tree.get_name()
+        link = parent_plan.link(attr) if parent_plan is not None and attr is not None else None
+        if name in FLAG_KEYWORDS:
+            if link is not None and link.kind == "flag":
+                parent_row[link.column] = True
+            return
+        try:
+            raw_if_data = tree.if_data
+        except UnicodeDecodeError as exc:
+            self.logger.warning(f"Failed to decode IF_DATA in {name!r} using encoding {self.encoding!r}: {exc}")
+            raw_if_data = []
+        if raw_if_data and parent_plan is not None:
+            if_data_plan = TablePlan.get(model.IfData)
+            if_data_link = parent_plan.link("if_data")
+            for section in decode_if_data_sections(raw_if_data, self.encoding):
+                row = if_data_plan.new_row(self.next_rid(if_data_plan.table))
+                row["raw"] = section
+                self.attach(if_data_link, parent_row, row)
+                self.buffer(if_data_plan.table, row)
+        if name == "IfData":
+            return
+        plan = TablePlan.get(KW_MAP[name])
+        try:
+            params = tree.parameters
+        except UnicodeDecodeError as e:
+            self.logger.error(f"UnicodeDecodeError reading parameters of {name!r}: {e}")
+            params = {}
+        if name == "Module":
+            row = self.module_row(self._modules_visited)
+            self._modules_visited += 1
+        else:
+            row = plan.new_row(self.next_rid(plan.table))
+        for key, value in ZIPPER_MAP[name](params, tree.multiple_values).items():
+            column = plan.columns.get(key)
+            if column is not None:
+                row[column] = value
+            else:
+                self.add_values(plan.collection(key), row["rid"], value)
+        if link is not None:
+            self.attach(link, parent_row, row)
+        if name in VALUE_TABLE_MAP:
+            if name == "VarForbiddenComb":
+                self._forbidden_combinations.append(row["rid"])
+            else:
+                self._named_tables.setdefault((name, row["name"]), row["rid"])
+        children = ASSOC_MAP[name]
+        for keyword in tree.get_keywords():
+            child_attr, _ = children[keyword.get_name()]
+            self.visit(keyword, plan, row, child_attr)
+        self.buffer(plan.table, row)
+
+    def attach(self, link: Link, parent_row: dict | None, row: dict) -> None:
+        if parent_row is None:
+            return
+        kind = link.kind
+        if kind == "child_fk":
+            row[link.column] = parent_row["rid"]
+        elif kind == "parent_fk":
+            parent_row[link.column] = row["rid"]
+        elif kind == "association":
+            association_rid = parent_row[link.column]
+            if association_rid is None:
+                association = link.association
+                association_row = association.new_row(self.next_rid(association.table))
+                association_rid = parent_row[link.column] = association_row["rid"]
+                self.buffer(association.table, association_row)
+            row[link.association_column] = association_rid
+
+    def add_values(self, collection: Collection, parent_rid: int, items: typing.Iterable[typing.Any]) -> None:
+        plan = collection.plan
+        for position, item in enumerate(items):
+            row = plan.new_row(self.next_rid(plan.table))
+            row[collection.parent_column] = parent_rid
+            row[collection.value_column] = item
+            row["position"] = position
+            self.buffer(plan.table, row)
+
+    def write_value_tables(self, tables: typing.Sequence[typing.Any]) -> None:
+        """Bulk counterpart of :func:`pya2l.a2lparser.update_tables`.
+
+        Counter columns (``numberValuePairs``, ...) are updated on the next :meth:`flush`.
+        """
+        combinations = self._forbidden_combinations
+        for table_type, name, rows in tables:
+            master_table, _, assoc, counter, columns = VALUE_TABLE_MAP[table_type]
+            if table_type == "VarForbiddenComb":
+                master_rid = combinations.popleft() if combinations else None
+            else:
+                master_rid = self._named_tables.get((table_type, name))
+            if master_rid is None:
+                continue
+            collection = TablePlan.get(master_table).collection(assoc)
+            plan = collection.plan
+            for position, values_row in enumerate(rows):
+                row = plan.new_row(self.next_rid(plan.table))
+                row.update(zip(columns, values_row))
+                row[collection.parent_column] = master_rid
+                row["position"] = position
+                self.buffer(plan.table, row)
+            if counter in master_table.__table__.c:
+                self._counters[(master_table.__table__, counter)].append({"_rid": master_rid, "_count": len(rows)})
+
+
+class RowCollector(BulkImporter):
+    """Worker side of :meth:`BulkImporter.run_parallel`: collects the rows of one MODULE in memory."""
+
+    def __init__(self, encoding: str = "latin-1") -> None:
+        super().__init__(None, encoding=encoding, progress=self._count_keyword)
+        self.keywords = 0
+        self._module: dict[str, typing.Any] | None = None
+        self._rows: dict[typing.Any, list[dict[str, typing.Any]]] = defaultdict(list)
+        self._collected_counters: dict[typing.Any, list[dict[str, int]]] = defaultdict(list)
+
+    def _count_keyword(self) -> bool:
+        self.keywords += 1
+        return False
+
+    def _start(self) -> None:
+        pass
+
+    def next_rid(self, table: typing.Any) -> int:
+        rid = self._rids.get(table, 0) + 1
+        self._rids[table] = rid
+        return rid
+
+    def module_row(self, index: int) -> dict[str, typing.Any]:
+        if self._module is None:
+            plan = TablePlan.get(model.Module)
+            self._module = plan.new_row(self.next_rid(plan.table))
+        return self._module
+
+    def flush(self) -> None:
+        for table, rows in self._buffers.items():
+            self._rows[table].extend(rows)
+        self._buffers.clear()
+        self._pending = 0
+        for key, params in self._counters.items():
+            self._collected_counters[key].extend(params)
+        self._counters.clear()
+
+    def result(self) -> ModuleRows:
+        self.flush()
+        tables = {}
+        for table, rows in self._rows.items():
+            keys = tuple(rows[0])
+            tables[table.name] = (keys, [tuple(row[key] for key in keys) for row in rows])
+        counters = {(table.name, counter): params for (table, counter), params in self._collected_counters.items()}
+        return ModuleRows(tables, counters, self._module or {"rid": 0}, self.keywords)
+
+
+def collect_module_rows(file_name: str, encoding: str, token_buffer: str, module_index: int) -> ModuleRows:
+    """Parse `file_name` and convert the `module_index`-th MODULE to rows (runs in a worker process).
+
+    The children of the other MODULEs are skipped by the parser without being built.
+    """
+    collector = RowCollector(encoding)
+    # Diagnostics are reported once by the writer's own (skeleton) parse.
+    _get_parser_ext().parse_stream(file_name, encoding, "CRITICAL", collector.add_chunk, token_buffer, module_index)
+    return collector.result()
@@ -7,6 +7,7 @@
     #include <cstdint>
     #include <cstdlib>
     #include <fstream>
+    #include <functional>
     #include <iostream>
     #include <limits>
     #include <map>
@@ -83,11 +84,27 @@ class A2LParser {
 
     using value_table_t = std::tuple<std::string, std::string, std::vector<std::vector<AsamVariantType>>>;
 
+    // Receives (module index, completed MODULE child, value tables collected for it).
+    using chunk_sink_t = std::function<void(std::size_t, ValueContainer&&, std::vector<value_table_t>&&)>;
+
     explicit A2LParser(
         std::optional<preprocessor_result_t> prepro_result, const std::string& file_name, const std::string& encoding,
-        spdlog::level::level_enum log_level
+        spdlog::level::level_enum log_level, chunk_sink_t sink = nullptr, std::optional<std::size_t> only_module = std::nullopt
+    ) :
+        A2LParser(
+            std::move(prepro_result), std::make_unique<FileSource>(file_name), encoding, log_level, std::move(sink), only_module
+        ) {
+    }
+
+    // `tokens`: token stream written by the preprocessor (see `Preprocessor::a2l_source()`).
+    // `only_module`: the children of all other MODULEs are skipped (not built), their shells are kept.
+    explicit A2LParser(
+        std::optional<preprocessor_result_t> prepro_result, std::unique_ptr<ByteSource> tokens, const std::string& encoding,
+        spdlog::level::level_enum log_level, chunk_sink_t sink = nullptr, std::optional<std::size_t> only_module = std::nullopt
     ) :
         m_prepro_result(std::move(prepro_result)),
+        m_sink(std::move(sink)),
+        m_only_module(only_module),
         m_keyword_counter(0),
         m_table(PARSER_TABLE),
         m_root("root"),
@@ -103,7 +120,7 @@ class A2LParser {
         }
 
         m_logger = create_logger("a2lparser", log_level);
-        parse(file_name, encoding);
+        parse(std::move(tokens), encoding);
         // Don't call spdlog::shutdown() here as it affects all loggers globally
     }
 
@@ -116,11 +133,14 @@ class A2LParser {
     // Move constructor
     A2LParser(A2LParser&& other) noexcept
         : m_prepro_result(std::move(other.m_prepro_result)),
+          m_sink(std::move(other.m_sink)),
+          m_only_module(other.m_only_module),
           m_logger(std::move(other.m_logger)),
           m_idr(std::move(other.m_idr)),
           m_encoding(std::move(other.m_encoding)),
           m_reader(std::move(other.m_reader)),
           m_keyword_counter(other.m_keyword_counter),
+          m_module_count(other.m_module_count),
           m_kw_stack(std::move(other.m_kw_stack)),
           m_value_stack(std::move(other.m_value_stack)),
           m_table(other.m_table),
@@ -142,11 +162,14 @@ class A2LParser {
 
             // Move resources from other
             m_prepro_result = std::move(other.m_prepro_result);
+            m_sink = std::move(other.m_sink);
+            m_only_module = other.m_only_module;
             m_logger = std::move(other.m_logger);
             m_idr = std::move(other.m_idr);
             m_encoding = std::move(other.m_encoding);
             m_reader = std::move(other.m_reader);
             m_keyword_counter = other.m_keyword_counter;
+            m_module_count = other.m_module_count;
             m_kw_stack = std::move(other.m_kw_stack);
             m_value_stack = std::move(other.m_value_stack);
             // m_table is a reference and can't be reseated
@@ -188,10 +211,10 @@ class A2LParser {
         }
     }
 
-    void parse(const std::string& file_name, const std::string& encoding) {
+    void parse(std::unique_ptr<ByteSource> tokens, const std::string& encoding) {
         ValueContainer::set_encoding(encoding);
         std::optional<std::string> if_data_section;
-        m_reader = std::make_unique<TokenReader>(file_name);
+        m_reader = std::make_unique<TokenReader>(std::move(tokens));
 
         while (true) {
             const auto token = m_reader->LT(1);
@@ -217,6 +240,9 @@ class A2LParser {
             if (kw_tos().contains(token->getType())) {
                 const auto ttype = kw_tos().get(token->type());
                 kw_push(ttype);
+                if (ttype.m_class_name == "Module") {
+                    m_module_count++;
+                }
                 auto& vref = value_tos().add_keyword(ValueContainer(ttype.m_class_name));
                 m_value_stack.push(&vref);
             } else {
@@ -245,6 +271,9 @@ class A2LParser {
                 value_tos().add_if_data(if_data_section.value());
                 if_data_section = std::nullopt;
             }
+            if (m_only_module && (value_tos().get_name() == "Module") && ((m_module_count - 1) != *m_only_module)) {
+                skip_children();
+            }
             if (value_tos().get_name() == "Asap2Version") {
                 const auto& version_par_vec = value_tos().get_parameters();
                 if (std::size(version_par_vec) == 2) {
@@ -261,6 +290,7 @@ class A2LParser {
             if (kw_tos().m_block == false) {
                 kw_pop();
                 m_value_stack.pop();
+                emit_chunk();
             }
             if (token_type() == A2LTokenType::END) {
                 handle_end_token();
@@ -448,19 +478,52 @@ class A2LParser {
         } else {
             kw_pop();
             m_value_stack.pop();
+            emit_chunk();
         }
 
         m_reader->consume();
     }
 
+    // Consume the children of the current block, up to (not including) its END token.
+    void skip_children() {
+        std::size_t depth = 0;
+        while (m_reader->LT(1)->getType() != ANTLRToken::_EOF) {
+            const auto type = token_type();
+            if (type == A2LTokenType::BEGIN) {
+                ++depth;
+            } else if (type == A2LTokenType::END) {
+                if (depth == 0) {
+                    return;
+                }
+                --depth;
+            }
+            m_reader->consume();
+        }
+    }
+
+    // Streaming mode: hand a just completed MODULE child (including its subtree) over
+    // to the sink and drop it from the tree, so memory stays bounded.
+    void emit_chunk() {
+        if (!m_sink || (value_tos().get_name() != "Module")) {
+            return;
+        }
+        auto chunk  = value_tos().take_last_keyword();
+        auto tables = std::move(m_tables);
+        m_tables.clear();
+        m_sink(m_module_count - 1, std::move(chunk), std::move(tables));
+    }
+
    private:
 
     std::optional<preprocessor_result_t> m_prepro_result;
+    chunk_sink_t                         m_sink;
+    std::optional<std::size_t>           m_only_module;
 	std::shared_ptr<spdlog::logger>      m_logger;
     std::unique_ptr<IfDataReader>        m_idr;
     std::string                          m_encoding;
     std::unique_ptr<TokenReader>         m_reader;
     std::size_t                          m_keyword_counter;
+    std::size_t                          m_module_count{ 0 };
     std::vector<Keyword>                 m_kw_stack;
     std::stack<ValueContainer*>          m_value_stack;
     Keyword&                             m_table;
@@ -33,7 +33,11 @@
     #include <cstdio>
     #include <cstdint>
 
+    #include <functional>
+    #include <memory>
+
     #include "logger.hpp"
+    #include "token_buffer.hpp"
     #include "tokenizer.hpp"
 
 using line_type = std::tuple< std::size_t, std::size_t>;
@@ -55,7 +59,7 @@ class IfDataBuilder : public IfDataBase {
    public:
 
     // Constructor
-    IfDataBuilder(std::ofstream& out) noexcept : m_out(out) {
+    IfDataBuilder(std::ostream& out) noexcept : m_out(out) {
         m_out.seekp(0);
     }
 
@@ -157,7 +161,7 @@ class IfDataBuilder : public IfDataBase {
         m_out << text;
     }
 
-    std::ofstream&     m_out;
+    std::ostream&      m_out;
     LineNumbers        m_line_numbers{};
     std::vector<Token> m_tokens{};
     std::size_t        m_length{ 0 };
@@ -168,81 +172,46 @@ class IfDataBuilder : public IfDataBase {
 class IfDataReader : public IfDataBase {
    public:
 
+    // Opens the IF_DATA stream on first use (temporary file, memory buffer or memory mapping).
+    using source_factory_t = std::function<std::unique_ptr<ByteSource>()>;
+
     IfDataReader() = default;
 
-    IfDataReader(const IfDataReader& other) {
-        m_file_name = other.m_file_name;
-        m_file      = other.m_file;
-        file_map    = other.file_map;
+    // Copies share the section index but open their own source.
+    IfDataReader(const IfDataReader& other) : m_factory(other.m_factory), file_map(other.file_map) {
     }
 
-    IfDataReader(IfDataReader&& other) noexcept {
-        m_file_name = std::move(other.m_file_name);
-        m_file      = std::move(other.m_file);
-        file_map    = std::move(other.file_map);
-    }
+    IfDataReader(IfDataReader&& other) noexcept = default;
 
     IfDataReader& operator=(const IfDataReader& other) {
         if (this != &other) {
-            // Close current file if open
             close();
-
-            // Copy members
-            m_file_name = other.m_file_name;
-            m_file      = nullptr;  // Don't copy the file pointer, we'll reopen if needed
-            file_map    = other.file_map;
-            m_size      = other.m_size;
-            m_file_open = false;
+            m_factory = other.m_factory;
+            file_map  = other.file_map;
         }
         return *this;
     }
 
-    IfDataReader& operator=(IfDataReader&& other) noexcept {
-        if (this != &other) {
-            // Close current file if open
-            close();
-
-            // Move members
-            m_file_name = std::move(other.m_file_name);
-            m_file      = other.m_file;
-            file_map    = std::move(other.file_map);
-            m_size      = other.m_size;
-            m_file_open = other.m_file_open;
+    IfDataReader& operator=(IfDataReader&& other) noexcept = default;
 
-            // Reset other's file pointer to prevent double-close
-            other.m_file      = nullptr;
-            other.m_file_open = false;
-        }
-        return *this;
+    IfDataReader(std::string_view fname, IfDataBuilder& builder) :
+        m_factory([file_name = std::string(fname)]() { return std::make_unique<FileSource>(file_name); }),
+        file_map(std::move(builder.get_map())) {
     }
 
-    IfDataReader(std::string_view fname, IfDataBuilder& builder) : m_file_name(fname), file_map(std::move(builder.get_map())) {
+    IfDataReader(source_factory_t factory, IfDataBuilder& builder) :
+        m_factory(std::move(factory)), file_map(std::move(builder.get_map())) {
     }
 
     void open() {
-    #if defined(_MSC_VER)
-        auto err = ::fopen_s(&m_file, m_file_name.c_str(), "rb");
-        if (err != 0) {
-            throw std::runtime_error("[ERROR (pya2l.IfDataReader)]  Could not open file '" + m_file_name + "'.");
+        if (!m_factory) {
+            throw std::runtime_error("[ERROR (pya2l.IfDataReader)]  No IF_DATA source.");
         }
-    #else
-        m_file = ::fopen(m_file_name.c_str(), "rb");
-        if (m_file == nullptr) {
-            throw std::runtime_error("[ERROR (pya2l.IfDataReader)]  Could not open file '" + m_file_name + "'.");
-        }
-    #endif
-
-        struct stat stat_buf;
-        int         rc = stat(m_file_name.c_str(), &stat_buf);
-        m_size         = rc == 0 ? stat_buf.st_size : -1;
-        m_file_open    = true;
+        m_source = m_factory();
     }
 
     void close() {
-        if (m_file_open) {
-            ::fclose(m_file);
-            m_file_open = false;
-        }
+        m_source.reset();
     }
 
     ~IfDataReader() {
@@ -253,24 +222,24 @@ class IfDataReader : public IfDataBase {
         if (!file_map.contains(line)) {
             return std::nullopt;
         }
-        auto offset = static_cast<long>(file_map[line]);
+        auto offset = static_cast<std::size_t>(file_map[line]);
 
-        if (m_file == nullptr) {
+        if (m_source == nullptr) {
             open();
         }
 
-        if (offset >= m_size) {
+        if (offset >= m_source->size()) {
             auto logger = spdlog::get("preprocessor");
             if (logger) {
                 logger->error(
                     "[ERROR (pya2l.IfDataReader)]  File offset {} is out of range of file size {} in '{}'",
-                    offset, m_size, m_file_name
+                    offset, m_source->size(), m_source->name()
                 );
             }
             return std::nullopt;
         }
 
-        ::fseek(m_file, offset, SEEK_SET);
+        m_source->seek(offset);
         auto length = read_int();
         // #if (defined(CMAKE_BUILD_TYPE)) && (CMAKE_BUILD_TYPE == Debug)
         auto start_line = read_int();
@@ -290,10 +259,10 @@ class IfDataReader : public IfDataBase {
 
     std::size_t read_int() {
         std::uint64_t value = 0;
-        std::size_t nread  = ::fread((char*)&value, sizeof(value), 1, m_file);
-        if (nread != 1 && !::feof(m_file)) {
+        std::size_t nread  = m_source->read(&value, sizeof(value));
+        if (nread != sizeof(value) && !m_source->eof()) {
             throw std::runtime_error(
-                "[ERROR (pya2l.IfDataReader)]  Failed to read integer from '" + m_file_name + "'."
+                "[ERROR (pya2l.IfDataReader)]  Failed to read integer from '" + m_source->name() + "'."
             );
         }
         return static_cast<std::size_t>(value);
@@ -301,11 +270,11 @@ class IfDataReader : public IfDataBase {
 
     std::string read_string(std::size_t count) {
         std::vector<char> buf(count + 1);
-        std::size_t       nread = ::fread(buf.data(), 1, count, m_file);
-        if (nread != count && !::feof(m_file)) {
+        std::size_t       nread = m_source->read(buf.data(), count);
+        if (nread != count && !m_source->eof()) {
             throw std::runtime_error(
                 "[ERROR (pya2l.IfDataReader)]  Failed to read " + std::to_string(count) +
-                " bytes from '" + m_file_name + "'."
+                " bytes from '" + m_source->name() + "'."
             );
         }
         buf[count] = '\x00';
@@ -313,11 +282,9 @@ class IfDataReader : public IfDataBase {
         return result;
     }
 
-    std::string m_file_name;
-    std::FILE*  m_file{ nullptr };
-    map_type    file_map;
-    std::size_t m_size{ 0 };
-    bool        m_file_open{ false };
+    source_factory_t            m_factory{};
+    std::unique_ptr<ByteSource> m_source{};
+    map_type                    file_map{};
 };
 
 #endif  // __IFDATA_HPP
@@ -46,6 +46,7 @@ namespace fs = std::filesystem;
     #include "line_map.hpp"
     #include "logger.hpp"
     #include "tempfile.hpp"
+    #include "token_buffer.hpp"
     #include "token_stream.hpp"
     #include "tokenizer.hpp"
     #include "utils.hpp"
@@ -72,21 +73,22 @@ class Preprocessor {
    public:
 
     // Suffixes used for temporary files; files are created in the system temp directory.
+    // With BufferMode::MEMORY no files are created at all.
     const std::string A2L_TMP    = "_A2L.tmp";
     const std::string AML_TMP    = "_AML.tmp";
     const std::string IFDATA_TMP = "_IFDATA.tmp";
 
-    explicit Preprocessor(spdlog::level::level_enum log_level) :
-        tmp_a2l(A2L_TMP, true),
-        tmp_aml(AML_TMP),
-        tmp_ifdata(IFDATA_TMP, true),
-        a2l_token_writer(tmp_a2l),
-        ifdata_builder{ tmp_ifdata.handle() },
+    explicit Preprocessor(spdlog::level::level_enum log_level, BufferMode buffer_mode = BufferMode::TEMP_FILE) :
+        tmp_a2l(std::make_shared<TokenBuffer>(A2L_TMP, buffer_mode, true)),
+        tmp_aml(std::make_shared<TokenBuffer>(AML_TMP, buffer_mode)),
+        tmp_ifdata(std::make_shared<TokenBuffer>(IFDATA_TMP, buffer_mode, true)),
+        a2l_token_writer(tmp_a2l->handle()),
+        ifdata_builder{ tmp_ifdata->handle() },
         m_finalized(false) {
         get_include_paths_from_env();
-        m_filenames.a2l    = tmp_a2l.abs_path();
-        m_filenames.aml    = tmp_aml.abs_path();
-        m_filenames.ifdata = tmp_ifdata.abs_path();
+        m_filenames.a2l    = tmp_a2l->abs_path();
+        m_filenames.aml    = tmp_aml->abs_path();
+        m_filenames.ifdata = tmp_ifdata->abs_path();
         m_logger           = create_logger("preprocessor", log_level);
     }
 
@@ -147,9 +149,9 @@ class Preprocessor {
     void close() noexcept {
         if (!m_finalized) {
             try {
-                tmp_a2l.close();
-                tmp_aml.close();
-                tmp_ifdata.close();
+                tmp_a2l->close();
+                tmp_aml->close();
+                tmp_ifdata->close();
             } catch (...) {
                 // Suppress any exceptions during cleanup
                 // Log error if logger is available
@@ -164,10 +166,20 @@ class Preprocessor {
     preprocessor_result_t process(const std::string& filename, const std::string& encoding) {
         _process_file(filename);
         return {
-            m_filenames, line_map, IfDataReader{ m_filenames.ifdata, ifdata_builder }
+            m_filenames, line_map, IfDataReader{ [buffer = tmp_ifdata]() { return buffer->open_source(); }, ifdata_builder }
         };
     }
 
+    // Token stream for the A2L parser; call after `finalize()`.
+    std::unique_ptr<ByteSource> a2l_source() {
+        return tmp_a2l->open_source();
+    }
+
+    // Extracted A2ML text; call after `finalize()`.
+    std::string aml_text() {
+        return tmp_aml->content();
+    }
+
     void finalize() noexcept {
         // Don't call spdlog::shutdown() here as it affects all loggers globally
         close();
@@ -232,14 +244,14 @@ class Preprocessor {
                     for (const auto& line : lines) {
                         if (a2ml == true) {
                             if (suppress_comments) {
-                                tmp_aml() << std::string(line.length(), ' ');
+                                tmp_aml->handle() << std::string(line.length(), ' ');
                             } else {
-                                tmp_aml() << line;
+                                tmp_aml->handle() << line;
                             }
                         }
                         if (--line_count > 0) {
                             if (a2ml == true) {
-                                tmp_aml() << std::endl;
+                                tmp_aml->handle() << std::endl;
                             }
                         }
                     }
@@ -253,7 +265,7 @@ class Preprocessor {
                                 a2l_token_writer << item;
                                 // tmp_aml() << item.payload();
                             }
-                            tmp_aml() << "A2ML";
+                            tmp_aml->handle() << "A2ML";
                         } else if (token.payload() == "IF_DATA") {
                             ifdata = false;
                             ifdata_builder.add_token(token);
@@ -279,9 +291,9 @@ class Preprocessor {
                     if (a2ml == true) {
                         if (token.token_class() == TokenClass::STRING) {
                             // tmp_aml() << "\"" << token.payload() << "\"";
-                            tmp_aml() << token.payload();
+                            tmp_aml->handle() << token.payload();
                         } else {
-                            tmp_aml() << token.payload();
+                            tmp_aml->handle() << token.payload();
                         }
                         if (token.payload() == "/end") {
                             end = true;
@@ -345,7 +357,7 @@ class Preprocessor {
                         if (token.payload() == "A2ML") {
                             a2ml = true;
                             for (const auto& item : collected_tokens) {
-                                tmp_aml() << item.payload();
+                                tmp_aml->handle() << item.payload();
                             }
                         } else if (token.payload() == "IF_DATA") {
                             ifdata      = true;
@@ -370,7 +382,7 @@ class Preprocessor {
                         collected_tokens.push_back(token);
                     }
                     if (a2ml == true) {
-                        tmp_aml() << token.payload();
+                        tmp_aml->handle() << token.payload();
                     } else if (ifdata == true) {
                         ifdata_builder.add_token(token);
                     }
@@ -424,9 +436,9 @@ class Preprocessor {
    private:
 
     std::shared_ptr<spdlog::logger> m_logger;
-    TempFile                        tmp_a2l;
-    TempFile                        tmp_aml;
-    TempFile                        tmp_ifdata;
+    std::shared_ptr<TokenBuffer>    tmp_a2l;
+    std::shared_ptr<TokenBuffer>    tmp_aml;
+    std::shared_ptr<TokenBuffer>    tmp_ifdata;
     TokenWriter                     a2l_token_writer;
     IfDataBuilder                   ifdata_builder;
     Filenames                       m_filenames{};
@@ -0,0 +1,387 @@
+/*
+    pySART - Simplified AUTOSAR-Toolkit for Python.
+
+    (C) 2026 by Christoph Schueler <cpu12.gems.googlemail.com>
+
+    All Rights Reserved
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License along
+    with this program; if not, write to the Free Software Foundation, Inc.,
+    51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+    s. FLOSS-EXCEPTION.txt
+*/
+
+#if !defined(__TOKEN_BUFFER_HPP)
+    #define __TOKEN_BUFFER_HPP
+
+    #include <algorithm>
+    #include <cstdio>
+    #include <cstring>
+    #include <fstream>
+    #include <memory>
+    #include <sstream>
+    #include <stdexcept>
+    #include <string>
+    #include <string_view>
+
+    #if defined(_WIN32)
+        #if !defined(WIN32_LEAN_AND_MEAN)
+            #define WIN32_LEAN_AND_MEAN
+        #endif
+        #if !defined(NOMINMAX)
+            #define NOMINMAX
+        #endif
+        #if !defined(NOGDI)
+            #define NOGDI  // wingdi.h macros (ABSOLUTE, ...) clash with token names.
+        #endif
+        #include <windows.h>
+    #else
+        #include <fcntl.h>
+        #include <sys/mman.h>
+        #include <sys/stat.h>
+        #include <unistd.h>
+    #endif
+
+    #include "tempfile.hpp"
+
+/*
+ * Backing store of the preprocessor's intermediate streams (A2L tokens, AML text, IF_DATA sections).
+ *
+ *  - TEMP_FILE: temporary file, read back with stdio (default).
+ *  - MEMORY:    in-memory buffer, no file system round trip at all.
+ *  - MMAP:      temporary file, read back through a read-only memory mapping (huge files).
+ */
+enum class BufferMode {
+    TEMP_FILE,
+    MEMORY,
+    MMAP,
+};
+
+inline BufferMode buffer_mode_from_string(const std::string& mode) {
+    if (mode == "file") {
+        return BufferMode::TEMP_FILE;
+    } else if (mode == "memory") {
+        return BufferMode::MEMORY;
+    } else if (mode == "mmap") {
+        return BufferMode::MMAP;
+    }
+    throw std::invalid_argument("token buffer must be one of 'file', 'memory', 'mmap' -- got '" + mode + "'.");
+}
+
+/*
+ * Random-access read side of a token stream.
+ * `eof()` behaves like `feof()`: it is set by a `read()` that hit the end.
+ */
+class ByteSource {
+   public:
+
+    virtual ~ByteSource() = default;
+
+    virtual std::size_t read(void* dst, std::size_t count) = 0;
+
+    virtual void seek(std::size_t offset) = 0;
+
+    virtual bool eof() const noexcept = 0;
+
+    virtual std::size_t size() const noexcept = 0;
+
+    virtual const std::string& name() const noexcept = 0;
+};
+
+class FileSource : public ByteSource {
+   public:
+
+    explicit FileSource(const std::string& file_name) : m_name(file_name) {
+    #if defined(_MSC_VER)
+        auto err = ::fopen_s(&m_file, m_name.c_str(), "rb");
+        if (err != 0) {
+            throw std::runtime_error("[ERROR (pya2l.FileSource)]  Could not open file '" + m_name + "'.");
+        }
+    #else
+        m_file = ::fopen(m_name.c_str(), "rb");
+        if (m_file == nullptr) {
+            throw std::runtime_error("[ERROR (pya2l.FileSource)]  Could not open file '" + m_name + "'.");
+        }
+    #endif
+        std::error_code ec;
+        const auto      file_size = fs::file_size(m_name, ec);
+        m_size                    = ec ? 0 : static_cast<std::size_t>(file_size);
+    }
+
+    FileSource(const FileSource&)            = delete;
+    FileSource& operator=(const FileSource&) = delete;
+
+    ~FileSource() override {
+        if (m_file != nullptr) {
+            ::fclose(m_file);
+        }
+    }
+
+    std::size_t read(void* dst, std::size_t count) override {
+        return ::fread(dst, 1, count, m_file);
+    }
+
+    void seek(std::size_t offset) override {
+        ::fseek(m_file, static_cast<long>(offset), SEEK_SET);
+    }
+
+    bool eof() const noexcept override {
+        return ::feof(m_file) != 0;
+    }
+
+    std::size_t size() const noexcept override {
+        return m_size;
+    }
+
+    const std::string& name() const noexcept override {
+        return m_name;
+    }
+
+   private:
+
+    std::string m_name;
+    std::FILE*  m_file{ nullptr };
+    std::size_t m_size{ 0 };
+};
+
+/*
+ * Reads from contiguous memory (in-memory buffer or memory mapping);
+ * `keep_alive` owns the underlying storage.
+ */
+class ViewSource : public ByteSource {
+   public:
+
+    ViewSource(std::string_view data, std::string name, std::shared_ptr<const void> keep_alive) :
+        m_data(data), m_name(std::move(name)), m_keep_alive(std::move(keep_alive)) {
+    }
+
+    std::size_t read(void* dst, std::size_t count) override {
+        const auto available = std::size(m_data) - m_pos;
+        const auto nread     = std::min(count, available);
+        if (nread > 0) {
+            std::memcpy(dst, m_data.data() + m_pos, nread);
+        }
+        m_pos += nread;
+        if (nread < count) {
+            m_eof = true;
+        }
+        return nread;
+    }
+
+    void seek(std::size_t offset) override {
+        m_pos = std::min(offset, std::size(m_data));
+        m_eof = false;
+    }
+
+    bool eof() const noexcept override {
+        return m_eof;
+    }
+
+    std::size_t size() const noexcept override {
+        return std::size(m_data);
+    }
+
+    const std::string& name() const noexcept override {
+        return m_name;
+    }
+
+   private:
+
+    std::string_view            m_data;
+    std::string                 m_name;
+    std::shared_ptr<const void> m_keep_alive;
+    std::size_t                 m_pos{ 0 };
+    bool                        m_eof{ false };
+};
+
+/*
+ * Read-only memory mapping of a whole file.
+ */
+class MappedFile {
+   public:
+
+    explicit MappedFile(const std::string& file_name) {
+    #if defined(_WIN32)
+        m_file = ::CreateFileA(file_name.c_str(), GENERIC_READ, FILE_SHARE_READ, nullptr, OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, nullptr);
+        if (m_file == INVALID_HANDLE_VALUE) {
+            throw std::runtime_error("[ERROR (pya2l.MappedFile)]  Could not open file '" + file_name + "'.");
+        }
+        LARGE_INTEGER file_size{};
+        ::GetFileSizeEx(m_file, &file_size);
+        m_size = static_cast<std::size_t>(file_size.QuadPart);
+        if (m_size > 0) {
+            m_mapping = ::CreateFileMappingA(m_file, nullptr, PAGE_READONLY, 0, 0, nullptr);
+            if (m_mapping == nullptr) {
+                release();
+                throw std::runtime_error("[ERROR (pya2l.MappedFile)]  Could not map file '" + file_name + "'.");
+            }
+            m_data = static_cast<const char*>(::MapViewOfFile(m_mapping, FILE_MAP_READ, 0, 0, 0));
+        }
+    #else
+        m_fd = ::open(file_name.c_str(), O_RDONLY);
+        if (m_fd == -1) {
+            throw std::runtime_error("[ERROR (pya2l.MappedFile)]  Could not open file '" + file_name + "'.");
+        }
+        struct stat stat_buf;
+        m_size = (::fstat(m_fd, &stat_buf) == 0) ? static_cast<std::size_t>(stat_buf.st_size) : 0;
+        if (m_size > 0) {
+            void* addr = ::mmap(nullptr, m_size, PROT_READ, MAP_PRIVATE, m_fd, 0);
+            if (addr == MAP_FAILED) {
+                release();
+                throw std::runtime_error("[ERROR (pya2l.MappedFile)]  Could not map file '" + file_name + "'.");
+            }
+            ::madvise(addr, m_size, MADV_SEQUENTIAL);
+            m_data = static_cast<const char*>(addr);
+        }
+    #endif
+        if ((m_size > 0) && (m_data == nullptr)) {
+            release();
+            throw std::runtime_error("[ERROR (pya2l.MappedFile)]  Could not map file '" + file_name + "'.");
+        }
+    }
+
+    MappedFile(const MappedFile&)            = delete;
+    MappedFile& operator=(const MappedFile&) = delete;
+
+    ~MappedFile() {
+        release();
+    }
+
+    std::string_view view() const noexcept {
+        return { m_data, m_size };
+    }
+
+   private:
+
+    void release() noexcept {
+    #if defined(_WIN32)
+        if (m_data != nullptr) {
+            ::UnmapViewOfFile(m_data);
+        }
+        if (m_mapping != nullptr) {
+            ::CloseHandle(m_mapping);
+        }
+        if (m_file != INVALID_HANDLE_VALUE) {
+            ::CloseHandle(m_file);
+        }
+        m_mapping = nullptr;
+        m_file    = INVALID_HANDLE_VALUE;
+    #else
+        if (m_data != nullptr) {
+            ::munmap(const_cast<char*>(m_data), m_size);
+        }
+        if (m_fd != -1) {
+            ::close(m_fd);
+        }
+        m_fd = -1;
+    #endif
+        m_data = nullptr;
+    }
+
+    #if defined(_WIN32)
+    HANDLE m_file{ INVALID_HANDLE_VALUE };
+    HANDLE m_mapping{ nullptr };
+    #else
+    int m_fd{ -1 };
+    #endif
+    const char* m_data{ nullptr };
+    std::size_t m_size{ 0 };
+};
+
+/*
+ * Write side of a token stream; `open_source()` hands out readers once writing is done.
+ */
+class TokenBuffer {
+   public:
+
+    TokenBuffer(const std::string& suffix, BufferMode mode, bool binary = false) : m_mode(mode), m_binary(binary) {
+        if (m_mode == BufferMode::MEMORY) {
+            m_memory = std::make_unique<std::ostringstream>(binary ? (std::ios::out | std::ios::binary) : std::ios::out);
+        } else {
+            m_file = std::make_unique<TempFile>(suffix, binary);
+        }
+    }
+
+    TokenBuffer(const TokenBuffer&)            = delete;
+    TokenBuffer& operator=(const TokenBuffer&) = delete;
+
+    std::ostream& operator()() noexcept {
+        return handle();
+    }
+
+    std::ostream& handle() noexcept {
+        if (m_memory) {
+            return *m_memory;
+        }
+        return m_file->handle();
+    }
+
+    BufferMode mode() const noexcept {
+        return m_mode;
+    }
+
+    // Finish writing; idempotent.
+    void close() noexcept {
+        if (m_memory) {
+            if (!m_content) {
+                m_content = std::make_shared<const std::string>(std::move(*m_memory).str());
+            }
+        } else {
+            m_file->close();
+        }
+    }
+
+    std::string abs_path() const {
+        if (m_file) {
+            return m_file->abs_path();
+        }
+        return "<memory>";
+    }
+
+    std::unique_ptr<ByteSource> open_source() {
+        close();
+        switch (m_mode) {
+            case BufferMode::MEMORY:
+                return std::make_unique<ViewSource>(*m_content, abs_path(), m_content);
+            case BufferMode::MMAP:
+                {
+                    auto mapping = std::make_shared<const MappedFile>(abs_path());
+                    return std::make_unique<ViewSource>(mapping->view(), abs_path(), mapping);
+                }
+            default:
+                return std::make_unique<FileSource>(abs_path());
+        }
+    }
+
+    std::string content() {
+        close();
+        if (m_content) {
+            return *m_content;
+        }
+        std::ifstream      file(abs_path(), m_binary ? (std::ios::in | std::ios::binary) : std::ios::in);
+        std::ostringstream result;
+        result << file.rdbuf();
+        return result.str();
+    }
+
+   private:
+
+    BufferMode                          m_mode;
+    bool                                m_binary;
+    std::unique_ptr<TempFile>           m_file{};
+    std::unique_ptr<std::ostringstream> m_memory{};
+    std::shared_ptr<const std::string>  m_content{};
+};
+
+#endif  // __TOKEN_BUFFER_HPP
@@ -13,6 +13,7 @@
 
     #include "exceptions.hpp"
     #include "tempfile.hpp"
+    #include "token_buffer.hpp"
     #include "tokenizer.hpp"
 
     #if defined(_WIN32)
@@ -68,7 +69,7 @@ class TokenWriter {
     TokenWriter() = delete;
 
     // Constructor
-    explicit TokenWriter(TempFile &outf) : m_outf(outf.handle()) {
+    explicit TokenWriter(std::ostream &outf) : m_outf(outf) {
     }
 
     // Copy constructor - both objects will reference the same stream
@@ -133,7 +134,7 @@ class TokenWriter {
 
    private:
 
-    std::ofstream &m_outf;
+    std::ostream &m_outf;
 };
 
 class ANTLRToken /*: public antlr4::Token*/ {
@@ -307,11 +308,17 @@ class TokenReader {
    public:
 
     // Constructor
-    TokenReader(std::string_view fname) : m_file_name(fname), _p(0), m_numMarkers{}, m_currentTokenIndex{ 0 }, m_file(nullptr) {
+    TokenReader(std::string_view fname) : m_file_name(fname), _p(0), m_numMarkers{}, m_currentTokenIndex{ 0 } {
         open();
         fill(1);
     }
 
+    // Read tokens from an already written token buffer (file, memory or memory mapping).
+    explicit TokenReader(std::unique_ptr<ByteSource> source) :
+        m_file_name(source->name()), m_source(std::move(source)), _p(0), m_numMarkers{}, m_currentTokenIndex{ 0 } {
+        fill(1);
+    }
+
     // Delete copy constructor
     TokenReader(const TokenReader &) = delete;
 
@@ -327,9 +334,7 @@ class TokenReader {
         m_lastToken(std::move(other.m_lastToken)),
         m_lastTokenBufferStart(std::move(other.m_lastTokenBufferStart)),
         m_currentTokenIndex(other.m_currentTokenIndex),
-        m_file(other.m_file) {
-        // Prevent double-close
-        other.m_file = nullptr;
+        m_source(std::move(other.m_source)) {
     }
 
     // Move assignment operator
@@ -346,10 +351,7 @@ class TokenReader {
             m_lastToken            = std::move(other.m_lastToken);
             m_lastTokenBufferStart = std::move(other.m_lastTokenBufferStart);
             m_currentTokenIndex    = other.m_currentTokenIndex;
-            m_file                 = other.m_file;
-
-            // Prevent double-close
-            other.m_file = nullptr;
+            m_source               = std::move(other.m_source);
         }
         return *this;
     }
@@ -489,31 +491,17 @@ class TokenReader {
     }
 
     bool eof() const noexcept {
-        return m_file == nullptr || ::feof(m_file) != 0;
+        return m_source == nullptr || m_source->eof();
     }
 
     void open() {
         // Make sure file is closed before opening
         close();
-
-    #if defined(_MSC_VER)
-        auto err = ::fopen_s(&m_file, m_file_name.c_str(), "rb");
-        if (err != 0) {
-            throw std::runtime_error("[ERROR (pya2l.TokenReader)]  Could not open file '" + m_file_name + "'.");
-        }
-    #else
-        m_file = ::fopen(m_file_name.c_str(), "rb");
-        if (m_file == nullptr) {
-            throw std::runtime_error("[ERROR (pya2l.TokenReader)]  Could not open file '" + m_file_name + "'.");
-        }
-    #endif
+        m_source = std::make_unique<FileSource>(m_file_name);
     }
 
     void close() noexcept {
-        if (m_file != nullptr) {
-            ::fclose(m_file);
-            m_file = nullptr;
-        }
+        m_source.reset();
     }
 
    protected:
@@ -557,8 +545,8 @@ class TokenReader {
 
     std::size_t read_int() const {
         std::uint64_t value = 0;
-        std::size_t nread = ::fread((char *)&value, sizeof(value), 1, m_file);
-        if (nread != 1 && !::feof(m_file)) {
+        std::size_t nread = m_source->read(&value, sizeof(value));
+        if (nread != sizeof(value) && !m_source->eof()) {
             throw std::runtime_error(
                 "[ERROR (pya2l.TokenReader)]  Failed to read integer from '" + m_file_name + "'."
             );
@@ -568,8 +556,8 @@ class TokenReader {
 
     std::string read_string(std::size_t count) const {
         std::vector<char> buf(count + 1);
-        std::size_t       nread = ::fread(buf.data(), 1, count, m_file);
-        if (nread != count && !::feof(m_file)) {
+        std::size_t       nread = m_source->read(buf.data(), count);
+        if (nread != count && !m_source->eof()) {
             throw std::runtime_error(
                 "[ERROR (pya2l.TokenReader)]  Failed to read " + std::to_string(count) +
                 " bytes from '" + m_file_name + "'."
@@ -583,8 +571,8 @@ class TokenReader {
    private:
 
     std::vector<ANTLRToken> _tokens;
-    std::string             m_file_name;
-    std::FILE              *m_file{ nullptr };
+    std::string                 m_file_name;
+    std::unique_ptr<ByteSource> m_source{};
     size_t                  _p;
     int                     m_numMarkers;
     ANTLRToken              m_lastToken;
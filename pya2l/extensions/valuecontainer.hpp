@@ -54,6 +54,13 @@ class ValueContainer {
         return m_keywords.emplace_back(kw);
     }
 
+    // Move the most recently added keyword out of this container (used for streaming).
+    container_type take_last_keyword() {
+        auto result = std::move(m_keywords.back());
+        m_keywords.pop_back();
+        return result;
+    }
+
     void add_if_data(const std::string& if_data) noexcept {
         m_if_data_sections.emplace_back(if_data);
     }
@@ -0,0 +1,386 @@
+__copyright__ = """
+    pySART - Simplified AUTOSAR-Toolkit for Python.
+
+   (C) 2026 by Christoph Schueler <cpu12.gems@googlemail.com>
+
+   All Rights Reserved
+
+  This program is free software; you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation; either version 2 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License along
+  with this program; if not, write to the Free Software Foundation, Inc.,
+  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+"""Compiler for ASAP2 formulas (COMPU_METHOD ... FORM).
+
+A formula is parsed once into a :class:`CompiledFormula`, a vectorized callable of
+``X1 .. Xn`` (``X`` is an alias of ``X1``). Compiled formulas hold no mutable state,
+so they may be shared between threads; :func:`compile_formula` caches them by
+formula text, system constants, syntax (legacy or current) and backend.
+
+Backends:
+
+- ``"numpy"``: the formula becomes a Python function on NumPy ufuncs (always available).
+- ``"numexpr"``: the normalized expression is evaluated by *numexpr* (optional accelerator).
+- ``"auto"``: *numexpr* if installed, else NumPy.
+"""
+
+import ast
+import re
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+
+try:
+    import numexpr as _numexpr  # type: ignore[import-untyped]
+except ImportError:
+    _numexpr = None  # type: ignore[assignment]
+
+NUMEXPR_AVAILABLE = _numexpr is not None
+
+BACKENDS = ("auto", "numpy", "numexpr")
+
+SYSC = re.compile(r"sysc\s*\((?P<param>.*?)\s*\)", re.IGNORECASE)
+PARAMETER = re.compile(r"X(?P<index>[1-9][0-9]*)?")
+LOGICAL_NOT = re.compile(r"!(?!=)")
+OPERAND = re.compile(r"(?P<number>0[xX][0-9a-fA-F]+|(?:\d|\.\d)[\w.]*(?:(?<=[eE])[+-]\d+)?)|(?P<name>[A-Za-z_]\w*)")
+
+MATH_FUNCTIONS = {
+    "abs": np.abs,
+    "arccos": np.arccos,
+    "arcsin": np.arcsin,
+    "arctan": np.arctan,
+    "cos": np.cos,
+    "cosh": np.cosh,
+    "exp": np.exp,
+    "log": np.log,
+    "log10": np.log10,
+    "sin": np.sin,
+    "sinh": np.sinh,
+    "sqrt": np.sqrt,
+    "tan": np.tan,
+    "tanh": np.tanh,
+}
+
+# ASAP2 spellings of NumPy function names; "arcos" is legacy (ASAP2 < 1.60) only.
+FUNCTION_ALIASES = {"acos": "arccos", "asin": "arcsin", "atan": "arctan"}
+LEGACY_FUNCTION_ALIASES = {**FUNCTION_ALIASES, "arcos": "arccos"}
+
+_ALLOWED_NODES = {
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.Load,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.Mod,
+    ast.Pow,
+    ast.LShift,
+    ast.RShift,
+    ast.BitOr,
+    ast.BitXor,
+    ast.BitAnd,
+    ast.UAdd,
+    ast.USub,
+    ast.Invert,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+}
+
+
+def normalize(text: str, system_constants: dict | None = None, legacy: bool = False) -> str:
+    """Translate the operators of an ASAP2 formula to Python / numexpr syntax and insert ``sysc()`` values.
+
+    Parameters
+    ----------
+    text: str
+        Formula as found in the A2L file.
+
+    system_constants: dict
+        Values of SYSTEM_CONSTANTs by name.
+
+    legacy: bool
+        Syntax before ASAM MCD-2 MC 1.6: ``&``, ``|``, ``~`` are logical, ``^`` is power and ``XOR`` is exclusive or;
+        ``&&``, ``||``, ``!`` are not supported. Otherwise ``&&``, ``||``, ``!`` are logical, ``&``, ``|``, ``~``, ``^``
+        are bitwise and ``XOR`` is not supported.
+
+    Raises
+    ------
+    ValueError
+        If the formula uses operators of the other syntax, or an unknown system constant.
+    """
+    result = text
+    if legacy:
+        if ("&&" in result) or ("||" in result) or re.search(r"!(?!=)", result):
+            raise ValueError("Legacy formula does not support '&&', '||', or '!' operators.")
+        result = result.replace("^", "**")  # Must come before XOR, to keep its caret.
+        result = re.sub(r"\bxor\b", " != ", result, flags=re.IGNORECASE)  # Boolean inequality is logical XOR.
+    else:
+        if re.search(r"\bxor\b", result, flags=re.IGNORECASE):
+            raise ValueError("Current formula does not support 'XOR' keyword.")
+        # Python's "and" / "or" have the (low) precedence of C's "&&" / "||", see _Translator.visit_BoolOp().
+        result = result.replace("&&", " and ").replace("||", " or ")
+        result = _logical_not(result)
+
+    def sysc(match: re.Match) -> str:
+        name = match.group("param").strip()
+        try:
+            return f"({(system_constants or {})[name]})"
+        except KeyError:
+            raise ValueError(f"Unknown system constant {name!r} in formula {text!r}.") from None
+
+    return SYSC.sub(sysc, result).strip()
+
+
+def _closing_parenthesis(text: str, pos: int) -> int:
+    """Index after the parenthesis matching the one at `pos` (end of `text` if unbalanced)."""
+    depth = 0
+    for index in range(pos, len(text)):
+        if text[index] == "(":
+            depth += 1
+        elif text[index] == ")":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+    return len(text)
+
+
+def _operand_end(text: str, pos: int) -> int:
+    """End of the operand of a unary operator, i.e. of the unary expression starting at `pos`."""
+    while pos < len(text) and text[pos].isspace():
+        pos += 1
+    if pos == len(text):
+        return pos
+    if text[pos] in "!~-+":
+        return _operand_end(text, pos + 1)
+    if text[pos] == "(":
+        return _closing_parenthesis(text, pos)
+    match = OPERAND.match(text, pos)
+    if match is None:
+        return pos
+    end = match.end()
+    if match.group("name"):
+        call = end
+        while call < len(text) and text[call].isspace():
+            call += 1
+        if call < len(text) and text[call] == "(":
+            return _closing_parenthesis(text, call)
+    return end
+
+
+def _logical_not(text: str) -> str:
+    """Rewrite ``!operand`` to ``(not (operand))``, see _Translator.visit_UnaryOp().
+
+    The operand is delimited here, as Python's ``not`` binds weaker than arithmetic and comparisons.
+    """
+    result = []
+    pos = 0
+    while match := LOGICAL_NOT.search(text, pos):
+        end = _operand_end(text, match.end())
+        result.append(text[pos : match.start()])
+        result.append(f"(not ({_logical_not(text[match.end() : end])}))")
+        pos = end
+    result.append(text[pos:])
+    return "".join(result)
+
+
+def _is_boolean(node: ast.AST) -> bool:
+    """Does `node` (already translated) yield booleans?"""
+    if isinstance(node, ast.Compare):
+        return True
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr)):
+        return _is_boolean(node.left) and _is_boolean(node.right)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Invert):
+        return _is_boolean(node.operand)
+    return False
+
+
+class _Translator(ast.NodeTransformer):
+    """Check a parsed formula and map parameters, functions and constants."""
+
+    def __init__(self, system_constants: dict, legacy: bool) -> None:
+        self.system_constants = system_constants
+        self.aliases = LEGACY_FUNCTION_ALIASES if legacy else FUNCTION_ALIASES
+        self.arity = 0
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        match = PARAMETER.fullmatch(node.id)
+        if match:
+            index = int(match.group("index") or 1)
+            self.arity = max(self.arity, index)
+            return ast.copy_location(ast.Name(id=f"X{index}", ctx=ast.Load()), node)
+        value = self.system_constants.get(node.id)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return ast.copy_location(ast.Constant(value=value), node)
+        raise ValueError(f"Unknown name {node.id!r} in formula.")
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        # Element-wise logical and / or, as "and" / "or" would need a single truth value.
+        op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        values = [self.visit(value) for value in node.values]
+        values = [
+            value if _is_boolean(value) else ast.Compare(left=value, ops=[ast.NotEq()], comparators=[ast.Constant(0)])
+            for value in values
+        ]
+        result = values[0]
+        for value in values[1:]:
+            result = ast.BinOp(left=result, op=op, right=value)
+        return ast.copy_location(result, node)
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        if not isinstance(node.op, ast.Not):
+            return self.generic_visit(node)
+        # Element-wise logical not, like visit_BoolOp(): 1 for zero operands, else 0.
+        operand = self.visit(node.operand)
+        if _is_boolean(operand):
+            result = ast.UnaryOp(op=ast.Invert(), operand=operand)
+        else:
+            result = ast.Compare(left=operand, ops=[ast.Eq()], comparators=[ast.Constant(0)])
+        return ast.copy_location(result, node)
+
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        if type(node.value) not in (int, float):  # Not bool, str, complex, ...
+            raise ValueError(f"Unsupported literal {node.value!r} in formula.")
+        return node
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise ValueError("Unsupported function call in formula.")
+        name = node.func.id.lower()
+        args = [self.visit(arg) for arg in node.args]
+        if name == "pow":
+            if len(args) != 2:
+                raise ValueError("pow() takes exactly two arguments.")
+            return ast.copy_location(ast.BinOp(left=args[0], op=ast.Pow(), right=args[1]), node)
+        name = self.aliases.get(name, name)
+        if name not in MATH_FUNCTIONS:
+            raise ValueError(f"Unknown function {node.func.id!r} in formula.")
+        if len(args) != 1:
+            raise ValueError(f"{name}() takes exactly one argument.")
+        return ast.copy_location(ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[]), node)
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        if type(node) not in _ALLOWED_NODES:
+            raise ValueError(f"Unsupported syntax ({type(node).__name__}) in formula.")
+        return super().generic_visit(node)
+
+
+class CompiledFormula:
+    """A formula compiled for repeated, vectorized evaluation.
+
+    Call it with the values of ``X1 .. Xn`` (scalars or arrays); 0-d results are returned as Python scalars.
+
+    Attributes
+    ----------
+    source: str
+        Formula text as given.
+    expression: str
+        Normalized expression (Python / numexpr syntax).
+    arity: int
+        Number of parameters (highest ``Xn`` used).
+    backend: str
+        ``"numpy"`` or ``"numexpr"``.
+    """
+
+    __slots__ = ("_function", "_names", "arity", "backend", "expression", "source")
+
+    def __init__(self, source: str, expression: str, arity: int, backend: str, function) -> None:
+        self.source = source
+        self.expression = expression
+        self.arity = arity
+        self.backend = backend
+        self._function = function
+        self._names = tuple(f"X{i}" for i in range(1, arity + 1))
+
+    def __call__(self, *args: Any) -> Any:
+        if len(args) < self.arity:
+            raise ValueError(f"Formula {self.source!r} requires {self.arity} parameter(s), got {len(args)}.")
+        values = [np.asarray(arg) for arg in args[: self.arity]]
+        if self.backend == "numexpr":
+            try:
+                result = _numexpr.evaluate(self.expression, local_dict=dict(zip(self._names, values)))
+            except (KeyError, NotImplementedError, TypeError, ValueError):  # e.g. unsupported operand types.
+                result = self._function(*values)
+        else:
+            result = self._function(*values)
+        if isinstance(result, np.ndarray) and result.shape == ():
+            return result.item()
+        if isinstance(result, np.generic):
+            return result.item()
+        return result
+
+    def __repr__(self) -> str:
+        return f"CompiledFormula({self.source!r}, backend={self.backend!r})"
+
+
+def compile_formula(
+    text: str, system_constants: dict | None = None, legacy: bool = False, backend: str = "auto"
+) -> CompiledFormula:
+    """Compile an ASAP2 formula; results are cached (thread-safe) by all arguments.
+
+    Parameters
+    ----------
+    text: str
+        Formula as found in the A2L file, e.g. ``"X1 * 0.5 + sysc(OFFSET)"``.
+
+    system_constants: dict
+        Values of SYSTEM_CONSTANTs by name, for ``sysc()`` and numeric constants referenced by name.
+
+    legacy: bool
+        Use the formula syntax before ASAM MCD-2 MC 1.6 (see :func:`normalize`).
+
+    backend: str
+        ``"auto"``, ``"numpy"`` or ``"numexpr"``.
+
+    Raises
+    ------
+    ValueError
+        If the formula is invalid or uses unsupported syntax.
+    ImportError
+        If `backend` is ``"numexpr"`` and numexpr is not installed.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}.")
+    if backend == "numexpr" and not NUMEXPR_AVAILABLE:
+        raise ImportError("The 'numexpr' formula backend requires numexpr. Install it with: pip install pya2ldb[compute]")
+    if backend == "auto":
+        backend = "numexpr" if NUMEXPR_AVAILABLE else "numpy"
+    constants = tuple(sorted((system_constants or {}).items()))
+    return _compile(text, constants, legacy, backend)
+
+
+@lru_cache(maxsize=1024)
+def _compile(text: str, constants: tuple, legacy: bool, backend: str) -> CompiledFormula:
+    system_constants = dict(constants)
+    if not text or not text.strip():
+        raise ValueError("Formula cannot be None or empty.")
+    try:
+        tree = ast.parse(normalize(text, system_constants, legacy), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid formula {text!r}: {e.msg}.") from None
+    translator = _Translator(system_constants, legacy)
+    tree = ast.fix_missing_locations(translator.visit(tree))
+    arity = max(translator.arity, 1)
+    expression = ast.unparse(tree)
+    parameters = ", ".join(f"X{i}" for i in range(1, arity + 1))
+    code = compile(f"lambda {parameters}: {expression}", f"<formula {text!r}>", "eval")
+    function = eval(code, {"__builtins__": {}, **MATH_FUNCTIONS})  # nosec B307 - only whitelisted syntax, see _Translator.
+    return CompiledFormula(text, expression, arity, backend, function)
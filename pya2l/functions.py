@@ -27,7 +27,6 @@ __copyright__ = """
 
 import bisect
 import logging
-import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from operator import itemgetter
@@ -59,11 +58,7 @@ def _require_compute(feature: str) -> None:
 
 
 from pya2l import exceptions
-
-
-POW = re.compile(r"pow\s*\((?P<params>.*?)\s*\)", re.IGNORECASE)
-SYSC = re.compile(r"sysc\s*\((?P<param>.*?)\s*\)", re.IGNORECASE)
-HEX_INT = re.compile(r"0x[0-9a-fA-F]+")
+from pya2l.formula import compile_formula, normalize
 
 
 @dataclass
@@ -360,15 +355,14 @@ class Linear:
         """"""  # noqa: DAR101, DAR201
         return self.p(i)
 
-    def _eval_pti(self, p):
-        return (self.p - p).roots[0]
-
     def physical_to_int(self, p):
-        """"""  # noqa: DAR101, DAR201
+        """"""  # noqa: DAR101, DAR201, DAR401
+        if self.a == 0:
+            raise exceptions.MathError("Cannot invert constant function.")
         if hasattr(p, "__iter__"):
-            return np.array([self._eval_pti(i) for i in p])
+            return (np.asarray(p, dtype="float64") - self.b) / self.a
         else:
-            return self._eval_pti(p)
+            return (p - self.b) / self.a
 
     def __str__(self) -> str:
         return f"Linear(coeffs=(a={self.a}, b={self.b}))"
@@ -376,6 +370,58 @@ class Linear:
     __repr__ = __str__
 
 
+def _value_table(values, default) -> np.ndarray:
+    """`values` followed by `default`, so that index ``len(values)`` selects the default.
+
+    Falls back to an object array if `default` (e.g. ``None``) does not share the kind of `values`,
+    so that neither is coerced (numbers to strings or ``None`` to ``"None"``).
+    """
+    table = np.array(values)
+    is_text = table.dtype.kind in "SU"
+    if default is None or table.dtype.kind == "O" or is_text != isinstance(default, str):
+        table = np.empty(len(values) + 1, dtype=object)
+        table[:-1] = values
+        table[-1] = default
+        return table
+    return np.append(table, default)
+
+
+def _match_keys(keys: np.ndarray, values) -> tuple[np.ndarray, np.ndarray]:
+    """Positions of `values` in the sorted array `keys` and a mask of exact matches."""
+    values = np.asarray(values)
+    if keys.size == 0:
+        return np.zeros(values.shape, dtype=np.intp), np.zeros(values.shape, dtype=bool)
+    pos = np.minimum(np.searchsorted(keys, values), keys.size - 1)
+    return pos, keys[pos] == values
+
+
+def _inverse_lookup(mapping_inv: dict, p):
+    """Vectorized ``[mapping_inv.get(r) for r in p]``.
+
+    Returns an array of the mapped values, with dtype object and ``None`` at unknown values if there are any.
+    """
+    if not hasattr(p, "__len__"):
+        p = list(p)
+    if not mapping_inv:
+        return np.full(len(p), None, dtype=object)
+    keys = np.array(list(mapping_inv.keys()))
+    values = np.array(list(mapping_inv.values()))
+    order = np.argsort(keys, kind="stable")
+    keys, values = keys[order], values[order]
+    try:
+        pos, hit = _match_keys(keys, p)
+    except TypeError:  # Incomparable types, e.g. numbers vs. display strings.
+        result = np.empty(len(p), dtype=object)
+        result[:] = [mapping_inv.get(r) for r in p]
+        return result
+    result = values[pos]
+    if hit.all():
+        return result
+    result = result.astype(object)
+    result[~hit] = None
+    return result
+
+
 class LookupTable:
     """Basic lookup table.
     An integer value is mapped to an integer or display string.
@@ -388,6 +434,10 @@ class LookupTable:
 
         default: int or str
             returned if value is not in mapping.
+
+    Note
+    ----
+        Arrays are converted with a binary search (`numpy.searchsorted`) in the sorted keys.
     """
 
     def __init__(self, mapping, default=None):
@@ -395,7 +445,9 @@ class LookupTable:
         self.mapping = dict(mapping)
         self.mapping_inv = {v: k for k, v in self.mapping.items()}
         self.default = default
-        self.map_internal_to_phys_vec = np.vectorize(self.map_internal_to_phys)
+        keys = sorted(self.mapping)
+        self.keys = np.array(keys, dtype="int64")
+        self.values = _value_table([self.mapping[k] for k in keys], default)
 
     def map_internal_to_phys(self, value):
         return self.mapping.get(value, self.default)
@@ -403,14 +455,15 @@ class LookupTable:
     def int_to_physical(self, value):
         """"""  # noqa: DAR101, DAR201
         if hasattr(value, "__iter__"):
-            return self.map_internal_to_phys_vec(value)
+            pos, hit = _match_keys(self.keys, value)
+            return self.values[np.where(hit, pos, self.keys.size)]
         else:
             return self.map_internal_to_phys(value)
 
     def physical_to_int(self, p):
         """"""  # noqa: DAR101, DAR201
         if hasattr(p, "__iter__") and not isinstance(p, str):
-            return [self.mapping_inv.get(r) for r in p]
+            return _inverse_lookup(self.mapping_inv, p)
         else:
             return self.mapping_inv.get(p)
 
@@ -455,6 +508,11 @@ class LookupTableWithRanges:
 
         dtype: int | float
             Datatype of keys.
+
+    Note
+    ----
+        Ranges are closed intervals; arrays are converted with a binary search
+        (`numpy.searchsorted`) in the sorted lower bounds.
     """
 
     def __init__(self, mapping, default=None, dtype=int):
@@ -469,38 +527,36 @@ class LookupTableWithRanges:
         self.display_values = [item[2] for item in self.mapping]
         self.dict_inv = dict(zip(self.display_values, self.min_values))  # min_value, according to spec.
         self.default = default
-        # For integer ranges we include both endpoints. For floating-point ranges we use
-        # left-closed/right-open intervals, except that the very last range includes the
-        # global maximum on the right to avoid dropping the upper boundary to default.
-        if dtype is int:
-            self.in_range = lambda x, left, right: left <= x <= right
-        else:
-            self.in_range = lambda x, left, right: (left <= x <= right)
+        key_dtype = "int64" if dtype is int else "float64"
+        self.lower = np.array(self.min_values, dtype=key_dtype)
+        self.upper = np.array(self.max_values, dtype=key_dtype)
+        self.values = _value_table(self.display_values, default)
 
     def _lookup(self, x):
         """"""  # noqa: DAR101, DAR201
         if not (self.minimum <= x <= self.maximum):
             return self.default
         pos = bisect.bisect_right(self.min_values, x) - 1
-        display_value = self.display_values[pos]
-        min_value = self.min_values[pos]
-        max_value = self.max_values[pos]
-        if self.in_range(x, min_value, max_value):
-            return display_value
+        if self.min_values[pos] <= x <= self.max_values[pos]:
+            return self.display_values[pos]
         else:
             return self.default
 
     def int_to_physical(self, i):
         """"""  # noqa: DAR101, DAR201
         if hasattr(i, "__iter__"):
-            return np.array([self._lookup(r) for r in i])
+            i = np.asarray(i)
+            pos = np.searchsorted(self.lower, i, side="right") - 1
+            clipped = np.maximum(pos, 0)
+            hit = (pos >= 0) & (i <= self.upper[clipped])
+            return self.values[np.where(hit, clipped, self.lower.size)]
         else:
             return self._lookup(i)
 
     def physical_to_int(self, p):
         """"""  # noqa: DAR101, DAR201
         if hasattr(p, "__iter__") and not isinstance(p, str):
-            return [self.dict_inv.get(r, None) for r in p]
+            return _inverse_lookup(self.dict_inv, p)
         else:
             return self.dict_inv.get(p, None)
 
@@ -543,29 +599,15 @@ class FormulaBase(ABC):
     def sysc(self, key):
         return self.system_constants[key]
 
-    def _build_namespace(self, *args):
-        if len(args) == 0:
-            raise ValueError("Formula called with no paramters.")
-        xs = {f"X{i}": v for i, v in enumerate(args, 1)}
-        if len(args) == 1:  # In this case...
-            xs["X"] = xs.get("X1")  # ... create an alias.
-        namespace = self.MATH_FUNCS
-        namespace.update(xs)
-        namespace.update(self.system_constants)
-        namespace["sysc"] = self.sysc
-        return namespace
-
-    @staticmethod
-    def names_tolower(text: str) -> str:
-        MATH_FUNCTIONS = re.compile("abs|acos|asin|atan|cos|cosh|exp|log|log10|pow|sin|sinh|sqrt|tan|tanh", re.IGNORECASE)
-        return MATH_FUNCTIONS.sub(lambda m: m.group(0).lower(), text)
-
     @abstractmethod
     def _replace_special_symbols(self, text: str | None) -> str | None: ...
 
 
 class Formula(FormulaBase):
-    """ASAP2 formula interpreter based on *numexpr*.
+    """ASAP2 formula interpreter.
+
+    Formulas are compiled once (and cached across instances) by :func:`pya2l.formula.compile_formula`;
+    evaluation is thread-safe. Formulas the compiler does not support are logged and evaluate to an empty array.
 
     Parameters
     ----------
@@ -577,82 +619,37 @@ class Formula(FormulaBase):
         function for calculation of the control unit internal value from the physical value.
 
     system_constants: list of 2-tuples (name, value)
-    """
 
-    MATH_FUNCS: dict = {}
+    backend: str
+        "auto" (numexpr if installed, else NumPy), "numpy" or "numexpr".
+    """
 
-    def __init__(self, formula, inverse_formula=None, system_constants=None, legacy=False):
-        _require_compute("Formula")
+    def __init__(self, formula, inverse_formula=None, system_constants=None, legacy=False, backend="auto"):
+        self.backend = backend
         super().__init__(formula, inverse_formula, system_constants, legacy)
+        self.compiled = self._compile(formula)
+        self.compiled_inverse = self._compile(inverse_formula) if inverse_formula else None
 
     def _replace_special_symbols(self, text):
         if text is None:
             return None
-        # normalize case for known math function names first
-        result = FormulaBase.names_tolower(text)
-
-        if self.legacy:
-            # legacy: &, |, ~ are logical; ^ is power; XOR is exclusive OR keyword; &&, ||, ! are not supported
-            if ("&&" in result) or ("||" in result) or ("!" in result):
-                raise ValueError("Legacy formula does not support '&&', '||', or '!' operators.")
-            # function names: accept legacy spellings; ensure numpy names
-            # arcos (legacy) -> arccos (numpy); arcsin/arctan are already numpy-compatible
-            result = re.sub(r"\barcos\b", "arccos", result, flags=re.IGNORECASE)
-            # current short names also accepted in legacy, normalize to numpy long names
-            result = re.sub(r"\bacos\b", "arccos", result)
-            result = re.sub(r"\basin\b", "arcsin", result)
-            result = re.sub(r"\batan\b", "arctan", result)
-            # power: '^' => '**' (must be before XOR keyword replacement to avoid converting that caret)
-            result = result.replace("^", "**")
-            # XOR keyword => boolean inequality (logical XOR semantics without using '^')
-            result = re.sub(r"\bxor\b", " != ", result, flags=re.IGNORECASE)
-            # Do not replace &, |, ~ — numexpr uses these for logical ops over boolean arrays/scalars
-        else:
-            # current: &&, ||, ! are logical; &, |, ~ are bitwise; ^ is bitwise XOR; XOR keyword is not supported
-            if re.search(r"\bxor\b", result, flags=re.IGNORECASE):
-                raise ValueError("Current formula does not support 'XOR' keyword.")
-            # map current short names to numpy long names
-            result = result.replace("acos", "arccos").replace("asin", "arcsin").replace("atan", "arctan")
-            # logical tokens for numexpr must use bitwise forms
-            result = result.replace("&&", "&").replace("||", "|").replace("!", "~")
-
-        # normalize hex integer literals to decimal for numexpr
-        result = HEX_INT.sub(lambda m: str(int(m.group(0), 16)), result)
-
-        # replace 'pow(a, b)' with '(a ** b)'
-        while True:
-            match = POW.search(result)
-            if match:
-                params = [p.strip() for p in match.group("params").split(",")]
-                pow_expr = "({} ** {})".format(*params)
-                head = result[: match.start()]
-                tail = result[match.end() :]
-                result = f"{head}{pow_expr}{tail}"
-            else:
-                break
-        # replace 'sysc(a)' with concrete value
-        while True:
-            match = SYSC.search(result)
-            if match:
-                param = match.group("param").strip()
-                value = self.sysc(param)
-                head = result[: match.start()]
-                tail = result[match.end() :]
-                result = f"{head}{value}{tail}"
-            else:
-                break
-        return result.strip()
+        return normalize(text, self.system_constants, self.legacy)
+
+    def _compile(self, text):
+        # Like evaluation errors, unsupported formulas are only reported (see int_to_physical()).
+        try:
+            return compile_formula(text, self.system_constants, self.legacy, self.backend)
+        except ValueError as e:
+            _logger.warning("Error compiling formula %r: %s", text, e)
+            return None
 
     def int_to_physical(self, *args):
         """"""  # noqa: DAR101, DAR201
+        if self.compiled is None:
+            _logger.warning("Cannot evaluate unsupported formula %r.", self.formula)
+            return np.array([])
         try:
-            res = _numexpr.evaluate(self.formula, local_dict=self._build_namespace(*args))
-            if isinstance(res, np.ndarray):
-                return res.item() if res.shape == () else res
-            try:
-                return res.item()
-            except AttributeError:
-                return res
+            return self.compiled(*args)
         except Exception as e:
             _logger.warning("Error evaluating formula %r: %r", self.formula, e)
             return np.array([])
@@ -661,14 +658,11 @@ class Formula(FormulaBase):
         """"""  # noqa: DAR101, DAR201, DAR401
         if self.inverse_formula is None:
             raise NotImplementedError("Formula: physical_to_int() requires inverse_formula.")
+        if self.compiled_inverse is None:
+            _logger.warning("Cannot evaluate unsupported inverse formula %r.", self.inverse_formula)
+            return np.array([])
         try:
-            res = _numexpr.evaluate(self.inverse_formula, local_dict=self._build_namespace(*args))
-            if isinstance(res, np.ndarray):
-                return res.item() if res.shape == () else res
-            try:
-                return res.item()
-            except AttributeError:
-                return res
+            return self.compiled_inverse(*args)
         except Exception as e:
             _logger.warning("Error evaluating inverse formula %r: %r", self.inverse_formula, e)
             return np.array([])
@@ -2,10 +2,40 @@
 Import/Export helpers (A2L, JSON) for pyA2L.
 """
 
-from .a2l_exporter import export_db as export_a2l_db
-from .a2l_exporter import open_database as open_a2l_database
-from .json_exporter import open_database as open_json_database
-from .json_exporter import project_to_dict as export_json_dict
+import importlib
+import typing
 
 
-__all__ = ["export_a2l_db", "open_a2l_database", "export_json_dict", "open_json_database"]
+if typing.TYPE_CHECKING:
+    from .a2l_exporter import export_db as export_a2l_db
+    from .a2l_exporter import open_database as open_a2l_database
+    from .json_exporter import iter_json_records
+    from .json_exporter import open_database as open_json_database
+    from .json_exporter import project_to_dict as export_json_dict
+    from .json_exporter import write_json as export_json
+
+
+__all__ = ["export_a2l_db", "open_a2l_database", "export_json", "export_json_dict", "iter_json_records", "open_json_database"]
+
+# The exporters import the SQLAlchemy models, so they are loaded on first use.
+_EXPORTS = {
+    "export_a2l_db": (".a2l_exporter", "export_db"),
+    "open_a2l_database": (".a2l_exporter", "open_database"),
+    "open_json_database": (".json_exporter", "open_database"),
+    "export_json_dict": (".json_exporter", "project_to_dict"),
+    "export_json": (".json_exporter", "write_json"),
+    "iter_json_records": (".json_exporter", "iter_json_records"),
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _EXPORTS[name]
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -10,22 +10,28 @@ Robust against missing/empty IF_DATA sections.
 from __future__ import annotations
 
 import argparse
+import io
 import logging
 import re
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from functools import cache, partial
 from pathlib import Path
 from typing import Any, TextIO
 
+from sqlalchemy import select
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, with_parent
 
 import pya2l.model as model
+from pya2l.imex import parallel
 from pya2l.model import A2LDatabase
 
 
 logger = logging.getLogger(__name__)
 
+EXPORT_BATCH_SIZE = 500  # Elements per query (and per buffered write) of the MODULE sections.
+
 
 @dataclass
 class ExporterConfig:
@@ -33,6 +39,7 @@ class ExporterConfig:
     out_path: Path
     module_name: str | None
     loglevel: str = "INFO"
+    workers: int = 1
 
 
 def setup_logging(level: str) -> None:
@@ -1182,6 +1189,112 @@ def write_transformers(out, transformers: list[Any] | None) -> None:
         out.write("    /end TRANSFORMER\n\n")
 
 
+@cache
+def _load_plan(cls: type, path: tuple[type, ...] = ()) -> tuple[Any, ...]:
+    """`selectinload()` options for all relationships reachable from `cls`, the block writers read nearly all of them.
+
+    Relationships to `Module` and back to the classes on `path` (the parents) are not followed.
+    """
+    options = []
+    for relationship in cls.__mapper__.relationships:
+        target = relationship.mapper.class_
+        if target is model.Module or target is cls or target in path:
+            continue
+        option = selectinload(getattr(cls, relationship.key))
+        nested = _load_plan(target, (*path, cls))
+        options.append(option.options(*nested) if nested else option)
+    return tuple(options)
+
+
+# Writers of the MODULE sections (`Module` relationships) rendered by `_write_section()`, in output order.
+_SECTION_WRITERS: dict[str, Callable[..., None]] = {
+    "axis_pts": write_axis_pts,
+    "blob": write_blobs,
+    "characteristic": write_characteristics,
+    "compu_method": write_compu_methods,
+    "compu_tab": write_compu_tabs,
+    "compu_vtab": write_compu_tabs,
+    "compu_vtab_range": write_compu_tabs,
+    "frame": write_frames,
+    "function": write_functions,
+    "group": write_groups,
+    "instance": write_instances,
+    "measurement": write_measurements,
+    "typedef_characteristic": lambda out, batch: write_typedefs(out, batch, None, None),
+    "typedef_measurement": lambda out, batch: write_typedefs(out, None, batch, None),
+    "typedef_structure": lambda out, batch: write_typedefs(out, None, None, batch),
+    "typedef_axis": write_typedef_axes,
+    "typedef_blob": write_typedef_blobs,
+    "unit": write_units,
+    "user_rights": write_user_rights,
+    "record_layout": write_record_layouts,
+    "transformer": write_transformers,
+}
+
+# Sections missing in databases of older schemas, they are skipped with a warning.
+_SCHEMA_DEPENDENT_SECTIONS = {"record_layout": "RECORD_LAYOUT", "transformer": "TRANSFORMER"}
+
+
+def _write_section(
+    out: TextIO, session: Any, module: Any, key: str, *args: Any, start: int | None = None, stop: int | None = None
+) -> None:
+    """Write the `key` elements of `module` (or those with `rid` in [`start`, `stop`)), `EXPORT_BATCH_SIZE` elements at a time.
+
+    Every batch is fetched with the complete loading plan (one SELECT per relationship instead of one per
+    element and relationship) and rendered into a buffer, which is written to `out` in one piece.
+    The query is the relationship's lazy load (`with_parent`) ordered by `rid`, i.e. in the order of creation.
+    `args` are passed on to the section writer.
+    """
+    relationship = getattr(model.Module, key)
+    cls = relationship.property.mapper.class_
+    statement = (
+        select(cls)
+        .where(with_parent(module, relationship), *parallel.rid_range(cls, start, stop))
+        .order_by(cls.rid)
+        .options(*_load_plan(cls))
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    writer = _SECTION_WRITERS[key]
+    buffer = io.StringIO()
+    for batch in session.execute(statement).scalars().partitions():
+        writer(buffer, batch, *args)
+        out.write(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def _render_section(module_rid: int, key: str, start: int, stop: int | None, args: tuple[Any, ...]) -> str:
+    """Worker task (see `pya2l.imex.parallel`): elements with `rid` in [`start`, `stop`) of the `key` section as A2L text."""
+    session = parallel.worker_session()
+    out = io.StringIO()
+    _write_section(out, session, session.get(model.Module, module_rid), key, *args, start=start, stop=stop)
+    return out.getvalue()
+
+
+def _submit_sections(pool: Any, session: Any, module: Any, section_args: dict[str, tuple[Any, ...]]) -> dict[str, list[Any]]:
+    """Submit the chunks of all sections of `module` to `pool`; futures of the A2L text per section."""
+    result = {}
+    for key in _SECTION_WRITERS:
+        try:
+            chunks = parallel.section_chunks(session, module, key)
+        except OperationalError as exc:
+            logger.warning("Skipping %s export due to schema mismatch: %s", _SCHEMA_DEPENDENT_SECTIONS.get(key, key), exc)
+            chunks = []
+        args = section_args.get(key, ())
+        result[key] = [pool.submit(_render_section, module.rid, key, start, stop, args) for start, stop in chunks]
+    return result
+
+
+def _emit_section(
+    out: TextIO, session: Any, module: Any, section_args: dict[str, tuple[Any, ...]], futures: dict[str, list[Any]] | None, key: str
+) -> None:
+    """Write the `key` section of `module`: the results of `_submit_sections()` or, without `futures`, in-process."""
+    if futures is None:
+        _write_section(out, session, module, key, *section_args.get(key, ()))
+    else:
+        out.writelines(future.result() for future in futures[key])
+
+
 def _prepare_output(out_target: Path | TextIO) -> tuple[TextIO, bool]:
     if hasattr(out_target, "write"):
         return out_target, False
@@ -1189,7 +1302,12 @@ def _prepare_output(out_target: Path | TextIO) -> tuple[TextIO, bool]:
     return out_path.open("w", encoding="utf-8"), True
 
 
-def export_db(db: A2LDatabase, out_path: Path | TextIO, module_name: str | None = None) -> None:
+def export_db(db: A2LDatabase, out_path: Path | TextIO, module_name: str | None = None, workers: int | None = 1) -> None:
+    """Export `db` (or only its MODULE `module_name`) as A2L to `out_path`.
+
+    With `workers` > 1 (None or 0: one per CPU), the MODULE sections are rendered by a pool of
+    processes, see `pya2l.imex.parallel`; the output is the same.
+    """
     session = db.session
     logger = logging.getLogger(__name__)
     try:
@@ -1201,6 +1319,7 @@ def export_db(db: A2LDatabase, out_path: Path | TextIO, module_name: str | None
         logger.error("No Project row found in the database.")
         return
 
+    pool = parallel.create_pool(db, workers, logging.getLevelName(logger.getEffectiveLevel()))
     out, close_out = _prepare_output(out_path)
     try:
         out.write("/begin PROJECT\n")
@@ -1221,37 +1340,25 @@ def export_db(db: A2LDatabase, out_path: Path | TextIO, module_name: str | None
                 out.write("    VERSION\n")
                 out.write(f'      "{version.versionIdentifier}"  /* versionIdentifier */\n')
             out.write("  /end HEADER\n")
-        record_layout_opt = selectinload(model.Module.record_layout)
-        transformer_opt = selectinload(model.Module.transformer)
-        base_options = [
-            selectinload(model.Module.mod_par).selectinload(model.ModPar.addr_epk),
-            selectinload(model.Module.mod_par)
-            .selectinload(model.ModPar.calibration_method)
-            .selectinload(model.CalibrationMethod.calibration_handle),
-            selectinload(model.Module.mod_par).selectinload(model.ModPar.memory_segment),
+        # Element sections are loaded per batch by `_write_section()`; the module only preloads MOD_PAR,
+        # MOD_COMMON and the COMPU_* tables (`_min_passthrough_lookup()`).
+        modules_query = session.query(model.Module).options(
+            selectinload(model.Module.mod_par).options(*_load_plan(model.ModPar, (model.Module,))),
             selectinload(model.Module.compu_method).selectinload(model.CompuMethod.compu_tab_ref),
             selectinload(model.Module.compu_tab).selectinload(model.CompuTab.pairs),
             selectinload(model.Module.compu_vtab).selectinload(model.CompuVtab.pairs),
             selectinload(model.Module.compu_vtab_range).selectinload(model.CompuVtabRange.triples),
-            selectinload(model.Module.mod_common),
-            record_layout_opt,
-            transformer_opt,
-        ]
-        modules_query = session.query(model.Module).options(*base_options)
+            selectinload(model.Module.mod_common).options(*_load_plan(model.ModCommon, (model.Module,))),
+        )
         if module_name:
             modules_query = modules_query.filter(model.Module.name == module_name)
-        try:
-            modules = modules_query.all()
-        except OperationalError as exc:
-            logger.warning("Module preload failed (schema mismatch?). Retrying without RECORD_LAYOUT/TRANSFORMER: %s", exc)
-            fallback_opts = [opt for opt in base_options if opt not in (record_layout_opt, transformer_opt)]
-            modules_query = session.query(model.Module).options(*fallback_opts)
-            if module_name:
-                modules_query = modules_query.filter(model.Module.name == module_name)
-            modules = modules_query.all()
+        modules = modules_query.all()
         if not modules:
             logger.warning("No modules found (or incorrect module name).")
         for mod in modules:
+            section_args = {"measurement": (_min_passthrough_lookup(mod),)}
+            futures = _submit_sections(pool, session, mod, section_args) if pool is not None else None
+            write_section = partial(_emit_section, out, session, mod, section_args, futures)
             out.write("  /begin MODULE\n")
             out.write(f"    {mod.name}  /* name */\n")
             out.write(f'    "{safe_get(mod, "longIdentifier") or ""}"  /* longIdentifier */\n')
@@ -1261,19 +1368,13 @@ def export_db(db: A2LDatabase, out_path: Path | TextIO, module_name: str | None
                 out.write("\n")
                 out.write(aml_section.text.strip())
                 out.write("\n")
-            write_axis_pts(out, safe_get(mod, "axis_pts"))
-            write_blobs(out, safe_get(mod, "blob"))
-            write_characteristics(out, safe_get(mod, "characteristic"))
-            write_compu_methods(out, safe_get(mod, "compu_method"))
-            write_compu_tabs(out, safe_get(mod, "compu_tab"))
-            write_compu_tabs(out, safe_get(mod, "compu_vtab"))
-            write_compu_tabs(out, safe_get(mod, "compu_vtab_range"))
-            write_frames(out, safe_get(mod, "frame"))
-            write_functions(out, safe_get(mod, "function"))
-            write_groups(out, safe_get(mod, "group"))
+            for key in ("axis_pts", "blob", "characteristic", "compu_method", "compu_tab", "compu_vtab", "compu_vtab_range"):
+                write_section(key)
+            for key in ("frame", "function", "group"):
+                write_section(key)
             write_raw_ifdata(out, safe_get(mod, "if_data"))
-            write_instances(out, safe_get(mod, "instance"))
-            write_measurements(out, safe_get(mod, "measurement"), _min_passthrough_lookup(mod))
+            write_section("instance")
+            write_section("measurement")
             write_mod_common(out, safe_get(mod, "mod_common"))
             mp = safe_get(mod, "mod_par")
             if mp:
@@ -1338,29 +1439,22 @@ def export_db(db: A2LDatabase, out_path: Path | TextIO, module_name: str | None
                     out.write("      VERSION\n")
                     out.write(f'        "{mp.version.versionIdentifier}"\n')
                 out.write("    /end MOD_PAR\n\n")
-            write_typedefs(
-                out,
-                safe_get(mod, "typedef_characteristic"),
-                safe_get(mod, "typedef_measurement"),
-                safe_get(mod, "typedef_structure"),
-            )
-            write_typedef_axes(out, safe_get(mod, "typedef_axis"))
-            write_typedef_blobs(out, safe_get(mod, "typedef_blob"))
-            write_units(out, safe_get(mod, "unit"))
-            write_user_rights(out, safe_get(mod, "user_rights"))
+            for key in ("typedef_characteristic", "typedef_measurement", "typedef_structure", "typedef_axis", "typedef_blob"):
+                write_section(key)
+            write_section("unit")
+            write_section("user_rights")
             write_variant_coding(out, safe_get(mod, "variant_coding"))
-            try:
-                write_record_layouts(out, safe_get(mod, "record_layout"))
-            except OperationalError as exc:
-                logger.warning("Skipping RECORD_LAYOUT export due to schema mismatch: %s", exc)
-            try:
-                write_transformers(out, safe_get(mod, "transformer"))
-            except OperationalError as exc:
-                logger.warning("Skipping TRANSFORMER export due to schema mismatch: %s", exc)
+            for key, keyword in _SCHEMA_DEPENDENT_SECTIONS.items():
+                try:
+                    write_section(key)
+                except OperationalError as exc:
+                    logger.warning("Skipping %s export due to schema mismatch: %s", keyword, exc)
             out.write("  /end MODULE\n\n")
         write_raw_ifdata(out, safe_get(project, "if_data"))
         out.write("/end PROJECT\n")
     finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
         if close_out:
             out.close()
 
@@ -1371,6 +1465,9 @@ def parse_args(argv: list[str] | None = None) -> ExporterConfig:
     parser.add_argument("-o", "--output", type=Path, help="Output file (.a2l). Default: <db>.a2l")
     parser.add_argument("-m", "--module", type=str, help="Optional: export only this module.", default=None)
     parser.add_argument("-l", "--loglevel", type=str, help="Log level (DEBUG, INFO, WARNING).", default="INFO")
+    parser.add_argument(
+        "-w", "--workers", type=int, help="Render the MODULE sections in this many processes (0: one per CPU).", default=1
+    )
     args = parser.parse_args(argv)
     db_path = args.database
     if not db_path.exists():
@@ -1380,7 +1477,7 @@ def parse_args(argv: list[str] | None = None) -> ExporterConfig:
         else:
             raise FileNotFoundError(f"Database file not found: {args.database}")
     out_path = args.output or db_path.with_suffix(".a2l")
-    return ExporterConfig(db_path=db_path, out_path=out_path, module_name=args.module, loglevel=args.loglevel)
+    return ExporterConfig(db_path=db_path, out_path=out_path, module_name=args.module, loglevel=args.loglevel, workers=args.workers)
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -1390,7 +1487,7 @@ def main(argv: list[str] | None = None) -> None:
     logger.info("Starting export...")
     db = open_database(cfg.db_path, cfg.loglevel)
     try:
-        export_db(db, cfg.out_path, cfg.module_name)
+        export_db(db, cfg.out_path, cfg.module_name, workers=cfg.workers)
     finally:
         try:
             db.close()
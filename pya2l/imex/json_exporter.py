@@ -11,20 +11,25 @@ import argparse
 import json
 import logging
 import re
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from collections.abc import Sequence
 from collections.abc import Sequence as SequenceABC
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, with_parent
 
 import pya2l.model as model
+from pya2l.imex import parallel
 from pya2l.model import A2LDatabase
 
 
+JSON_FORMATS = ("json", "array", "ndjson")
+YIELD_PER = 500  # Rows per fetch of the streaming exporter.
+
+
 @dataclass
 class ExporterConfig:
     """Configuration for the JSON exporter."""
@@ -34,6 +39,8 @@ class ExporterConfig:
     module_name: str | None
     pretty: bool
     loglevel: str = "INFO"
+    format: str = "json"
+    workers: int = 1
 
 
 def setup_logging(level: str) -> None:
@@ -1067,6 +1074,309 @@ def project_to_dict(db: A2LDatabase, module_name: str | None = None) -> dict[str
     return to_json_serializable(out)
 
 
+# Element sections of `module_to_dict()`, which are streamed: converter(session, element, min_passthrough) -> dict.
+_STREAMED_SECTIONS: dict[str, Callable[[Any, Any, dict[str, float]], dict[str, Any]]] = {
+    "axis_pts": lambda session, ap, _: axis_pts_to_dict(session, ap),
+    "characteristic": lambda session, ch, _: characteristic_to_dict(session, ch),
+    "compu_method": lambda session, cm, _: compu_method_to_dict(cm),
+    "compu_tab": lambda session, t, _: compu_tab_to_dict(t),
+    "compu_vtab": lambda session, t, _: compu_vtab_to_dict(t),
+    "compu_vtab_range": lambda session, t, _: compu_vtab_range_to_dict(t),
+    "frame": lambda session, fr, _: frame_to_dict(session, fr),
+    "function": lambda session, fn, _: function_to_dict(session, fn),
+    "group": lambda session, g, _: group_to_dict(session, g),
+    "instance": lambda session, inst, _: instance_to_dict(session, inst),
+    "measurement": measurement_to_dict,
+    "typedef_characteristic": lambda session, tc, _: typedef_characteristic_to_dict(tc),
+    "typedef_measurement": lambda session, tm, _: typedef_measurement_to_dict(tm),
+    "typedef_structure": lambda session, ts, _: typedef_structure_to_dict(ts),
+    "typedef_axis": lambda session, ta, _: typedef_axis_to_dict(ta),
+    "unit": lambda session, u, _: unit_to_dict(u),
+    "user_rights": lambda session, ur, _: user_rights_to_dict(ur),
+    "blob": lambda session, b, _: blob_to_dict(session, b),
+}
+
+_SECTION_LOADER_OPTIONS = {
+    "compu_method": lambda: [selectinload(model.CompuMethod.compu_tab_ref)],
+    "compu_tab": lambda: [selectinload(model.CompuTab.pairs)],
+    "compu_vtab": lambda: [selectinload(model.CompuVtab.pairs)],
+    "compu_vtab_range": lambda: [selectinload(model.CompuVtabRange.triples)],
+}
+
+
+class _StreamedObject:
+    """JSON object written while `items` ((key, value) pairs) is iterated; iterators are written as JSON arrays."""
+
+    def __init__(self, items: Iterable[tuple[str, Any]]) -> None:
+        self.items = items
+
+
+def _stream_section(
+    session: Any,
+    mod: Any,
+    key: str,
+    min_passthrough: dict[str, float],
+    yield_per: int,
+    start: int | None = None,
+    stop: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Elements of a MODULE section (or those with `rid` in [`start`, `stop`)), fetched in batches of `yield_per` rows,
+    converted one by one.
+
+    The query is the relationship's lazy load (`with_parent`) ordered by `rid`, i.e. in the order of creation,
+    as in `module_to_dict()`.
+    """
+    relationship = getattr(model.Module, key)
+    cls = relationship.property.mapper.class_
+    query = session.query(cls).filter(with_parent(mod, relationship), *parallel.rid_range(cls, start, stop)).order_by(cls.rid)
+    if key in _SECTION_LOADER_OPTIONS:
+        query = query.options(*_SECTION_LOADER_OPTIONS[key]())
+    convert = _STREAMED_SECTIONS[key]
+    for element in query.yield_per(yield_per):
+        yield to_json_serializable(convert(session, element, min_passthrough))
+
+
+def _convert_section(
+    module_rid: int, key: str, start: int, stop: int | None, min_passthrough: dict[str, float], yield_per: int
+) -> list[dict[str, Any]]:
+    """Worker task (see `pya2l.imex.parallel`): elements with `rid` in [`start`, `stop`) of the `key` section, converted."""
+    session = parallel.worker_session()
+    mod = session.get(model.Module, module_rid)
+    return list(_stream_section(session, mod, key, min_passthrough, yield_per, start, stop))
+
+
+def _section_values(
+    session: Any,
+    mod: Any,
+    key: str,
+    min_passthrough: dict[str, float],
+    yield_per: int,
+    futures: dict[str, list[Any]] | None,
+) -> Iterator[dict[str, Any]]:
+    """Elements of the `key` section: streamed in-process or, with `futures`, the results of the worker tasks."""
+    if futures is None:
+        return _stream_section(session, mod, key, min_passthrough, yield_per)
+    return (element for future in futures[key] for element in future.result())
+
+
+def _submit_sections(pool: Any, session: Any, mod: Any, min_passthrough: dict[str, float], yield_per: int) -> dict[str, list[Any]]:
+    """Submit the chunks of the streamed sections of `mod` to `pool`; futures of the converted elements per section."""
+    return {
+        key: [
+            pool.submit(_convert_section, mod.rid, key, start, stop, min_passthrough, yield_per)
+            for start, stop in parallel.section_chunks(session, mod, key)
+        ]
+        for key in _STREAMED_SECTIONS
+    }
+
+
+def _module_items(session: Any, mod: Any, yield_per: int, pool: Any = None) -> Iterator[tuple[str, Any]]:
+    """(key, value) pairs of `module_to_dict()`, in the same order; element sections are iterators.
+
+    With a `pool` (`pya2l.imex.parallel`), the element sections are converted by its workers.
+    """
+    aml_section = session.query(model.AMLSection).first()
+    min_passthrough = _min_passthrough_lookup(mod)
+    futures = _submit_sections(pool, session, mod, min_passthrough, yield_per) if pool is not None else None
+    yield "name", safe_get(mod, "name")
+    yield "longIdentifier", safe_get(mod, "longIdentifier")
+    yield "aml_section_text", safe_get(aml_section, "text") if aml_section else None
+    for key in ("axis_pts", "characteristic", "compu_method", "compu_tab", "compu_vtab", "compu_vtab_range"):
+        yield key, _section_values(session, mod, key, min_passthrough, yield_per, futures)
+    for key in ("frame", "function", "group", "instance", "measurement"):
+        yield key, _section_values(session, mod, key, min_passthrough, yield_per, futures)
+    yield "mod_common", to_json_serializable(mod_common_to_dict(safe_get(mod, "mod_common")))
+    yield "mod_par", to_json_serializable(mod_par_to_dict(session, safe_get(mod, "mod_par")))
+    for key in ("typedef_characteristic", "typedef_measurement", "typedef_structure", "typedef_axis", "unit", "user_rights"):
+        yield key, _section_values(session, mod, key, min_passthrough, yield_per, futures)
+    yield "variant_coding", to_json_serializable(variant_coding_to_dict(safe_get(mod, "variant_coding")))
+    yield "if_data_raw", ifdata_raw_list(safe_get(mod, "if_data"))
+    yield "if_data_parsed", to_json_serializable(ifdata_parsed_list(session, safe_get(mod, "if_data")))
+    yield "blob", _section_values(session, mod, "blob", min_passthrough, yield_per, futures)
+    # Converted up-front like in `module_to_dict()`, a schema mismatch must not leave a truncated array behind.
+    try:
+        record_layouts = [record_layout_to_dict(rl) for rl in as_list(safe_get(mod, "record_layout"))]
+    except OperationalError as exc:
+        logging.getLogger(__name__).warning("Skipping RECORD_LAYOUT export due to schema mismatch: %s", exc)
+        record_layouts = []
+    yield "record_layout", iter(to_json_serializable(record_layouts))
+    try:
+        transformers = [transformer_to_dict(tr) for tr in as_list(safe_get(mod, "transformer"))]
+    except OperationalError as exc:
+        logging.getLogger(__name__).warning("Skipping TRANSFORMER export due to schema mismatch: %s", exc)
+        transformers = []
+    yield "transformer", iter(to_json_serializable(transformers))
+
+
+def _project_items(db: A2LDatabase, module_name: str | None, yield_per: int, pool: Any = None) -> Iterator[tuple[str, Any]]:
+    """(key, value) pairs of `project_to_dict()`; "modules" is a generator of `_module_items()` objects."""
+    session = db.session
+    proj = session.query(model.Project).first()
+    if proj is None:
+        raise RuntimeError("No Project row found in the database.")
+    header_obj = safe_get(proj, "header")
+    header: dict[str, Any] | None = None
+    if header_obj:
+        header = {
+            "comment": safe_get(header_obj, "comment"),
+            "project_no": safe_get(safe_get(header_obj, "project_no"), "projectNumber"),
+            "version": safe_get(safe_get(header_obj, "version"), "versionIdentifier"),
+        }
+    modules_query = session.query(model.Module).options(
+        selectinload(model.Module.mod_par).selectinload(model.ModPar.addr_epk),
+        selectinload(model.Module.mod_par)
+        .selectinload(model.ModPar.calibration_method)
+        .selectinload(model.CalibrationMethod.calibration_handle),
+        selectinload(model.Module.mod_par).selectinload(model.ModPar.memory_segment),
+        selectinload(model.Module.mod_common),
+    )
+    if module_name:
+        modules_query = modules_query.filter(model.Module.name == module_name)
+    yield "name", safe_get(proj, "name")
+    yield "longIdentifier", safe_get(proj, "longIdentifier")
+    yield "header", to_json_serializable(header)
+    yield "modules", (_StreamedObject(_module_items(session, mod, yield_per, pool)) for mod in modules_query.yield_per(1))
+    yield "if_data_raw", ifdata_raw_list(safe_get(proj, "if_data"))
+    yield "if_data_parsed", to_json_serializable(ifdata_parsed_list(session, safe_get(proj, "if_data")))
+
+
+def iter_json_records(
+    db: A2LDatabase, module_name: str | None = None, yield_per: int = YIELD_PER, workers: int | None = 1
+) -> Iterator[dict[str, Any]]:
+    """Flat records of the project, converted while being iterated.
+
+    The first record is ``{"keyword": "PROJECT", "module": None, "data": {...}}``; every MODULE is followed by
+    its elements (``{"keyword": "MEASUREMENT", "module": <module name>, "data": {...}}``, ...).
+    "data" holds the dict of the `*_to_dict()` function; the MODULE record holds the non-list items of
+    `module_to_dict()`.
+    With `workers` > 1 (None or 0: one per CPU), the elements are converted by a pool of processes
+    (`pya2l.imex.parallel`); the records are the same.
+    """
+    pool = parallel.create_pool(db, workers, _worker_loglevel())
+    try:
+        yield from _records(db, module_name, yield_per, pool)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def _worker_loglevel() -> str:
+    return logging.getLevelName(logging.getLogger(__name__).getEffectiveLevel())
+
+
+def _records(db: A2LDatabase, module_name: str | None, yield_per: int, pool: Any) -> Iterator[dict[str, Any]]:
+    project = {}
+    modules: Iterable[_StreamedObject] = ()
+    for key, value in _project_items(db, module_name, yield_per, pool):
+        if key == "modules":
+            modules = value
+        else:
+            project[key] = value
+    yield {"keyword": "PROJECT", "module": None, "data": project}
+    for streamed_module in modules:
+        module: dict[str, Any] = {}
+        sections = []
+        for key, value in streamed_module.items:
+            if isinstance(value, Iterator):
+                sections.append((key.upper(), value))
+            else:
+                module[key] = value
+        yield {"keyword": "MODULE", "module": module["name"], "data": module}
+        for keyword, elements in sections:
+            for element in elements:
+                yield {"keyword": keyword, "module": module["name"], "data": element}
+
+
+def _write_json_value(fp: IO[str], value: Any, encoder: json.JSONEncoder, indent: str | None, level: int) -> int:
+    """Write `value`, iterators and `_StreamedObject`s item by item; returns the number of array items written."""
+    if isinstance(value, _StreamedObject):
+        items: Iterable[Any] = value.items
+        brackets = "{}"
+    elif isinstance(value, Iterator):
+        items = value
+        brackets = "[]"
+    else:
+        text = encoder.encode(value)
+        fp.write(text if indent is None else text.replace("\n", "\n" + indent * level))
+        return 0
+    count = 0
+    separator = ""
+    fp.write(brackets[0])
+    for item in items:
+        fp.write(separator if indent is None else f"{separator}\n{indent * (level + 1)}")
+        separator = ","
+        if brackets == "{}":
+            key, item = item
+            fp.write(encoder.encode(key) + (":" if indent is None else ": "))
+        else:
+            count += 1
+        count += _write_json_value(fp, item, encoder, indent, level + 1)
+    if indent is not None and separator:
+        fp.write("\n" + indent * level)
+    fp.write(brackets[1])
+    return count
+
+
+def write_json(
+    db: A2LDatabase,
+    fp: IO[str],
+    module_name: str | None = None,
+    format: str = "json",
+    pretty: bool = False,
+    yield_per: int = YIELD_PER,
+    workers: int | None = 1,
+) -> int:
+    """Stream the project to `fp` with bounded memory: each object is written as soon as it is converted.
+
+    Parameters
+    ----------
+    db : A2LDatabase
+        Database to export
+    fp : IO[str]
+        Text file (or ``sys.stdout``)
+    module_name : Optional[str]
+        Export only this MODULE
+    format : str
+        "json": the document of :func:`project_to_dict`;
+        "array": a JSON array of the records of :func:`iter_json_records`;
+        "ndjson": the records of :func:`iter_json_records`, one per line (`pretty` is ignored)
+    pretty : bool
+        Indent by four spaces (like ``json.dump(..., indent=4)``)
+    yield_per : int
+        Rows fetched per database round trip
+    workers : Optional[int]
+        Convert the MODULE elements in this many processes (`pya2l.imex.parallel`); None or 0: one per CPU.
+        The output is the same.
+
+    Returns
+    -------
+    int
+        Number of objects written (MODULEs and their elements; for "array" / "ndjson" all records)
+    """
+    if format not in JSON_FORMATS:
+        raise ValueError(f"format must be one of {JSON_FORMATS!r}, got {format!r}.")
+    pool = parallel.create_pool(db, workers, _worker_loglevel())
+    try:
+        if format == "ndjson":
+            encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+            count = 0
+            for record in _records(db, module_name, yield_per, pool):
+                fp.write(encoder.encode(record))
+                fp.write("\n")
+                count += 1
+            return count
+        encoder = json.JSONEncoder(
+            ensure_ascii=False, indent=4 if pretty else None, separators=(",", ": ") if pretty else (",", ":")
+        )
+        indent = "    " if pretty else None
+        if format == "array":
+            return _write_json_value(fp, _records(db, module_name, yield_per, pool), encoder, indent, 0)
+        return _write_json_value(fp, _StreamedObject(_project_items(db, module_name, yield_per, pool)), encoder, indent, 0)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
 def parse_args(argv: list[str] | None = None) -> ExporterConfig:
     """Parse CLI arguments and build ExporterConfig."""
     parser = argparse.ArgumentParser(description="Export a2ldb -> JSON (pyA2L).")
@@ -1089,6 +1399,19 @@ def parse_args(argv: list[str] | None = None) -> ExporterConfig:
         default=None,
     )
     parser.add_argument("--pretty", action="store_true", help="Write formatted JSON.")
+    parser.add_argument(
+        "--format",
+        choices=JSON_FORMATS,
+        default="json",
+        help="One document (default), an array of flat records, or NDJSON (one record per line).",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Convert the MODULE elements in this many processes (0: one per CPU; default: 1).",
+        default=1,
+    )
     parser.add_argument(
         "-l",
         "--loglevel",
@@ -1113,6 +1436,8 @@ def parse_args(argv: list[str] | None = None) -> ExporterConfig:
         module_name=args.module,
         pretty=args.pretty,
         loglevel=args.loglevel,
+        format=args.format,
+        workers=args.workers,
     )
 
 
@@ -1125,13 +1450,9 @@ def main(argv: list[str] | None = None) -> None:
 
     db = open_database(cfg.db_path, cfg.loglevel)
     try:
-        data = project_to_dict(db, cfg.module_name)
         logger.info("Writing JSON to %s", cfg.out_path)
         with cfg.out_path.open("w", encoding="utf-8") as fh:
-            if cfg.pretty:
-                json.dump(data, fh, ensure_ascii=False, indent=4)
-            else:
-                json.dump(data, fh, ensure_ascii=False, separators=(",", ":"))
+            write_json(db, fh, cfg.module_name, format=cfg.format, pretty=cfg.pretty, workers=cfg.workers)
     finally:
         try:
             db.close()
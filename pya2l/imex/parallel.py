@@ -0,0 +1,95 @@
+"""Process pool for exporting the MODULE sections of an a2ldb in parallel.
+
+Sections are split into chunks of `CHUNK_SIZE` elements, as ranges of `rid`s (the exporters
+fetch the elements in `rid` order, serially as well). The exporters submit the chunks of a
+MODULE before they render its remaining parts and splice the results in submission order,
+so the output is the same for any number of workers.
+
+Every worker opens its own (query-only) connection to the database file; changes which are
+not committed in the exporting process are not visible to them.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import with_parent
+
+from pya2l import model
+from pya2l.model import A2LDatabase
+
+
+CHUNK_SIZE = 1000  # Elements per worker task.
+
+_worker_db: A2LDatabase | None = None  # Database of the worker process, see `_init_worker()`.
+
+
+def resolve_workers(workers: int | None) -> int:
+    """`workers` argument of the exporters: None or 0 for one process per CPU."""
+    return workers if workers else os.cpu_count() or 1
+
+
+def create_pool(db: A2LDatabase, workers: int | None, loglevel: str = "ERROR") -> ProcessPoolExecutor | None:
+    """Pool of export processes for `db`; None if the export runs in-process.
+
+    Parameters
+    ----------
+    db : A2LDatabase
+        Database file to export; in-memory databases are exported in-process
+    workers : Optional[int]
+        Number of processes; 1 for none, None or 0 for one per CPU
+    loglevel : str
+        Log level of the workers
+    """
+    workers = resolve_workers(workers)
+    if workers <= 1:
+        return None
+    if not db.dbname:
+        logging.getLogger(__name__).warning("In-memory databases can't be shared with worker processes, exporting serially.")
+        return None
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(str(Path(db.dbname).resolve()), loglevel))
+
+
+def _init_worker(db_name: str, loglevel: str) -> None:
+    global _worker_db
+    _worker_db = A2LDatabase(db_name, logLevel=loglevel)
+    _worker_db.session.execute(text("PRAGMA query_only=ON"))
+    try:
+        _worker_db.session.setup_ifdata_parser(loglevel)
+    except Exception:
+        logging.getLogger(__name__).debug("Initializing IfData parser failed.", exc_info=True)
+
+
+def worker_session() -> Any:
+    """Session of the worker process."""
+    if _worker_db is None:
+        raise RuntimeError("Not running in an export worker process.")
+    return _worker_db.session
+
+
+def section_chunks(session: Any, module: Any, key: str, chunk_size: int | None = None) -> list[tuple[int, int | None]]:
+    """`rid` ranges [start, stop) of `chunk_size` (default: `CHUNK_SIZE`) elements of the `key` section of `module`.
+
+    `key` is a `Module` relationship; stop is None for the last range, see `rid_range()`.
+    """
+    chunk_size = chunk_size or CHUNK_SIZE
+    relationship = getattr(model.Module, key)
+    cls = relationship.property.mapper.class_
+    rids = session.execute(select(cls.rid).where(with_parent(module, relationship)).order_by(cls.rid)).scalars().all()
+    starts = rids[::chunk_size]
+    return list(zip(starts, [*starts[1:], None]))
+
+
+def rid_range(cls: Any, start: int | None, stop: int | None) -> list[Any]:
+    """WHERE clauses selecting the elements of `cls` with `start` <= rid < `stop` (None: unbounded)."""
+    result = []
+    if start is not None:
+        result.append(cls.rid >= start)
+    if stop is not None:
+        result.append(cls.rid < stop)
+    return result
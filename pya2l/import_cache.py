@@ -0,0 +1,301 @@
+__copyright__ = """
+    pySART - Simplified AUTOSAR-Toolkit for Python.
+
+   (C) 2026 by Christoph Schueler <github.com/Christoph2,
+                                        cpu12.gems@googlemail.com>
+
+   All Rights Reserved
+
+  This program is free software; you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation; either version 2 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License along
+  with this program; if not, write to the Free Software Foundation, Inc.,
+  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+"""Content-addressed cache of imported ``.a2ldb`` files.
+
+Entries are keyed by a SHA-256 over the A2L file, every file it pulls in via
+``/include`` (transitively, resolved like the preprocessor does: current
+directory, directory of the including file, ``ASAP_INCLUDE``), the encoding, the
+import options that change the database content, the pyA2L version and the
+database schema version. Paths and timestamps are not part of the key, so a
+cache directory can be shared by processes, checkouts and machines.
+
+Entries are written to a temporary file in the cache directory and renamed into
+place (:func:`os.replace`), so concurrent writers never expose partial files;
+the last writer of an identical entry wins. Hits refresh the entry's mtime, which
+makes eviction by age (:attr:`ImportCache.max_age`) and size
+(:attr:`ImportCache.max_size`) least-recently-used.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import sqlite3
+import time
+import typing
+import uuid
+from pathlib import Path
+
+
+if typing.TYPE_CHECKING:
+    from pya2l import model
+
+
+CACHE_ENV_VAR = "PYA2L_IMPORT_CACHE"  # Default cache directory of `import_a2l()` / `open_create()`.
+ENTRY_SUFFIX = ".a2ldb"
+TEMP_SUFFIX = ".tmp"
+STALE_TEMP_AGE = 3600.0  # Seconds after which temporary files of crashed writers are removed.
+
+# Comments and strings are matched, so that ``/include`` only counts outside of them.
+_INCLUDE_SCAN = re.compile(rb'/\*.*?\*/|//[^\r\n]*|"(?:[^"\\]|\\.)*"|/include\s+("(?:[^"\\]|\\.)*"|[^\s"]+)', re.DOTALL)
+
+
+def _include_paths() -> list[str]:
+    value = os.environ.get("ASAP_INCLUDE")
+    return value.split(os.pathsep) if value else []
+
+
+def _locate(file_name: str, including_file: Path) -> Path | None:
+    for directory in (Path.cwd(), including_file.parent, *_include_paths()):
+        candidate = Path(directory) / file_name
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def source_files(file_name: str | Path) -> typing.Iterator[tuple[str, bytes | None]]:
+    """Contents of an A2L file and of all files it includes, in preprocessing order.
+
+    Parameters
+    ----------
+    file_name : str | Path
+        A2L file
+
+    Yields
+    ------
+    tuple[str, Optional[bytes]]
+        Name as written in the ``/include`` (the path for `file_name` itself) and the file content;
+        None if the included file cannot be located or is included circularly (the import reports these)
+    """
+    yield from _source_files(str(file_name), Path(file_name), ())
+
+
+def _source_files(name: str, path: Path, ancestors: tuple[Path, ...]) -> typing.Iterator[tuple[str, bytes | None]]:
+    content = path.read_bytes()
+    yield name, content
+    if b"/include" not in content:
+        return
+    ancestors = (*ancestors, path.resolve())
+    for match in _INCLUDE_SCAN.finditer(content):
+        included = match.group(1)
+        if included is None:
+            continue
+        included = included.decode("latin-1")
+        if included.startswith('"'):
+            included = included[1:-1]
+        included_path = _locate(included, path)
+        if included_path is None or included_path.resolve() in ancestors:
+            yield included, None
+        else:
+            yield from _source_files(included, included_path, ancestors)
+
+
+def import_key(file_name: str | Path, encoding: str | None, **options: typing.Any) -> str:
+    """Cache key of importing `file_name`.
+
+    Parameters
+    ----------
+    file_name : str | Path
+        A2L file
+    encoding : Optional[str]
+        Encoding passed to the importer; None stands for auto-detection
+    options
+        Further import options which change the content of the database (e.g. ``parse_ifdata``)
+
+    Returns
+    -------
+    str
+        Hex digest
+    """
+    from pya2l import __version__
+    from pya2l.model import CURRENT_SCHEMA_VERSION
+
+    digest = hashlib.sha256(repr((__version__, CURRENT_SCHEMA_VERSION, encoding, sorted(options.items()))).encode())
+    for index, (name, content) in enumerate(source_files(file_name)):
+        if index:
+            digest.update(name.encode("utf-8"))  # Included names, but not the location of the main file.
+        digest.update(b"\0" if content is None else len(content).to_bytes(8, "little") + content)
+    return digest.hexdigest()
+
+
+class ImportCache:
+    """Directory of imported databases, see module docstring.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Cache directory, created if missing; may be shared by concurrent processes
+    max_age : Optional[float]
+        Seconds since the last use after which entries are evicted
+    max_size : Optional[int]
+        Bytes; least recently used entries are evicted beyond this total size
+    """
+
+    def __init__(self, directory: str | Path, max_age: float | None = None, max_size: int | None = None) -> None:
+        self.directory = Path(directory)
+        self.max_age = max_age
+        self.max_size = max_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"ImportCache({str(self.directory)!r}, max_age={self.max_age!r}, max_size={self.max_size!r})"
+
+    def key(self, file_name: str | Path, encoding: str | None, **options: typing.Any) -> str:
+        """See :func:`import_key`."""
+        return import_key(file_name, encoding, **options)
+
+    def entry(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    def restore(self, key: str, db_name: str) -> "model.A2LDatabase | None":
+        """Open a copy of the cached database.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+        db_name : str
+            Database to create, ":memory:" for an in-memory database
+
+        Returns
+        -------
+        Optional[A2LDatabase]
+            None if there is no entry for `key`
+        """
+        from pya2l import model
+
+        entry = self.entry(key)
+        try:
+            if db_name == ":memory:":
+                source = sqlite3.connect(f"{entry.resolve().as_uri()}?mode=ro", uri=True)
+                db = model.A2LDatabase(db_name)
+                db.session.commit()
+                try:
+                    source.backup(db.session.connection().connection.driver_connection)
+                finally:
+                    source.close()
+                db.session.expire_all()
+            else:
+                self._atomic_copy(entry, Path(db_name))
+                db = model.A2LDatabase(db_name)
+        except (FileNotFoundError, sqlite3.OperationalError):
+            return None  # Missing, or evicted by another process meanwhile.
+        try:
+            os.utime(entry)
+        except OSError:
+            pass  # nosec B110 -- only affects eviction order.
+        return db
+
+    def store(self, key: str, db: "model.A2LDatabase") -> Path:
+        """Add `db` to the cache (atomically) and evict old entries.
+
+        Returns
+        -------
+        Path
+            The cache entry
+        """
+        entry = self.entry(key)
+        temp_name = _temp_name(entry)
+        try:
+            db.save_as(temp_name, vacuum=True)  # Compact entries, they may be copied around a lot.
+            with sqlite3.connect(temp_name) as connection:  # Read-only opens of WAL files would need a -shm file.
+                connection.execute("PRAGMA journal_mode=DELETE")
+            connection.close()
+            os.replace(temp_name, entry)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        self.evict()
+        return entry
+
+    def evict(self) -> list[Path]:
+        """Remove entries beyond `max_age` / `max_size` and stale temporary files.
+
+        Returns
+        -------
+        list[Path]
+            Removed files
+        """
+        now = time.time()
+        entries = []
+        removed = []
+        for item in os.scandir(self.directory):
+            try:
+                stat = item.stat()
+            except FileNotFoundError:
+                continue
+            age = now - stat.st_mtime
+            if item.name.endswith(TEMP_SUFFIX):
+                if age > STALE_TEMP_AGE:
+                    removed.append(Path(item.path))
+            elif item.name.endswith(ENTRY_SUFFIX):
+                if self.max_age is not None and age > self.max_age:
+                    removed.append(Path(item.path))
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, Path(item.path)))
+        if self.max_size is not None:
+            entries.sort(reverse=True)  # Most recently used first.
+            total = 0
+            for _, size, path in entries:
+                total += size
+                if total > self.max_size:
+                    removed.append(path)
+        result = []
+        for path in removed:
+            try:
+                path.unlink()
+            except OSError:
+                continue  # Already removed by another process (or still open on Windows).
+            result.append(path)
+        return result
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+    def _atomic_copy(self, source: Path, target: Path) -> None:
+        temp_name = _temp_name(target)
+        try:
+            shutil.copyfile(source, temp_name)
+            for suffix in ("-wal", "-shm"):  # Left over from the replaced database, they would corrupt the copy.
+                Path(f"{target}{suffix}").unlink(missing_ok=True)
+            os.replace(temp_name, target)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+
+def _temp_name(path: Path) -> str:
+    """Unique name next to `path` (unlike `tempfile.mkstemp()`, the file gets the umask's permissions)."""
+    return str(path.with_name(f"{path.name}.{uuid.uuid4().hex}{TEMP_SUFFIX}"))
+
+
+def resolve_cache(cache: "ImportCache | str | Path | None") -> ImportCache | None:
+    """`cache` argument of the import functions: an :class:`ImportCache`, a directory, or None for `CACHE_ENV_VAR`."""
+    if cache is None:
+        cache = os.environ.get(CACHE_ENV_VAR) or None
+    if cache is None or isinstance(cache, ImportCache):
+        return cache
+    return ImportCache(cache)
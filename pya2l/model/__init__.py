@@ -25,16 +25,17 @@ __copyright__ = """
   """
 
 import datetime
-import logging
 import mmap
+import os
 import pickle  # nosec B403 — only deserializes blobs written by pya2l's own AML parser (never untrusted data)
 import re
 import sqlite3
+import uuid
 import warnings
 from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Column, ForeignKey, create_engine, event
+from sqlalchemy import Column, ForeignKey, Index, create_engine, event
 from sqlalchemy import exc as sa_exc
 from sqlalchemy import orm, types
 from sqlalchemy.engine import Engine
@@ -42,6 +43,7 @@ from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.ext.orderinglist import ordering_list
 from sqlalchemy.orm import as_declarative, backref, declared_attr, relationship
 
+from pya2l.aml import ifdata_codec
 from pya2l.model.mixins import AxisDescrMixIn, CompareByPositionMixIn
 from pya2l.utils import SingletonBase
 
@@ -52,7 +54,7 @@ if TYPE_CHECKING:
 
 DB_EXTENSION = "a2ldb"
 
-CURRENT_SCHEMA_VERSION = 10
+CURRENT_SCHEMA_VERSION = 11
 
 # Registry: (from_version, to_version) -> migration callable
 _MIGRATIONS: dict[tuple[int, int], Callable] = {}
@@ -1328,6 +1330,11 @@ class IfData(Base):
 
     @property
     def value(self):
+        """Parsed section, if stored at import time (``import_a2l(..., parse_ifdata=True)``), else None."""
+        if not self.parsed:
+            return None
+        if ifdata_codec.is_encoded(self.parsed):
+            return ifdata_codec.decode(self.parsed)
         return pickle.loads(self.parsed)  # nosec B301 — data written exclusively by pya2l's AML parser
 
     __required_parameters__ = ()
@@ -1857,30 +1864,35 @@ class Module(Base, HasIfDatas):
         Element("UserRights", "USER_RIGHTS", True),
         Element("VariantCoding", "VARIANT_CODING", False),
     )
+    # Element collections are ordered by creation (i.e. file order), independent of the query plan.
     a2ml = relationship("A2ml", back_populates="module", uselist=False)
-    axis_pts = relationship("AxisPts", back_populates="module", uselist=True)
-    blob = relationship("Blob", back_populates="module", uselist=True)
-    characteristic = relationship("Characteristic", back_populates="module", uselist=True)
-    compu_method = relationship("CompuMethod", back_populates="module", uselist=True)
-    compu_tab = relationship("CompuTab", back_populates="module", uselist=True)
-    compu_vtab = relationship("CompuVtab", back_populates="module", uselist=True)
-    compu_vtab_range = relationship("CompuVtabRange", back_populates="module", uselist=True)
-    frame = relationship("Frame", back_populates="module", uselist=True)
-    function = relationship("Function", back_populates="module", uselist=True)
-    group = relationship("Group", back_populates="module", uselist=True)
-    instance = relationship("Instance", back_populates="module", uselist=True)
-    measurement = relationship("Measurement", back_populates="module", uselist=True)
+    axis_pts = relationship("AxisPts", back_populates="module", uselist=True, order_by="AxisPts.rid")
+    blob = relationship("Blob", back_populates="module", uselist=True, order_by="Blob.rid")
+    characteristic = relationship("Characteristic", back_populates="module", uselist=True, order_by="Characteristic.rid")
+    compu_method = relationship("CompuMethod", back_populates="module", uselist=True, order_by="CompuMethod.rid")
+    compu_tab = relationship("CompuTab", back_populates="module", uselist=True, order_by="CompuTab.rid")
+    compu_vtab = relationship("CompuVtab", back_populates="module", uselist=True, order_by="CompuVtab.rid")
+    compu_vtab_range = relationship("CompuVtabRange", back_populates="module", uselist=True, order_by="CompuVtabRange.rid")
+    frame = relationship("Frame", back_populates="module", uselist=True, order_by="Frame.rid")
+    function = relationship("Function", back_populates="module", uselist=True, order_by="Function.rid")
+    group = relationship("Group", back_populates="module", uselist=True, order_by="Group.rid")
+    instance = relationship("Instance", back_populates="module", uselist=True, order_by="Instance.rid")
+    measurement = relationship("Measurement", back_populates="module", uselist=True, order_by="Measurement.rid")
     mod_common = relationship("ModCommon", back_populates="module", uselist=False)
     mod_par = relationship("ModPar", back_populates="module", uselist=False)
-    record_layout = relationship("RecordLayout", back_populates="module", uselist=True)
-    transformer = relationship("Transformer", back_populates="module", uselist=True)
-    typedef_axis = relationship("TypedefAxis", back_populates="module", uselist=True)
-    typedef_blob = relationship("TypedefBlob", back_populates="module", uselist=True)
-    typedef_characteristic = relationship("TypedefCharacteristic", back_populates="module", uselist=True)
-    typedef_measurement = relationship("TypedefMeasurement", back_populates="module", uselist=True)
-    typedef_structure = relationship("TypedefStructure", back_populates="module", uselist=True)
-    unit = relationship("Unit", back_populates="module", uselist=True)
-    user_rights = relationship("UserRights", back_populates="module", uselist=True)
+    record_layout = relationship("RecordLayout", back_populates="module", uselist=True, order_by="RecordLayout.rid")
+    transformer = relationship("Transformer", back_populates="module", uselist=True, order_by="Transformer.rid")
+    typedef_axis = relationship("TypedefAxis", back_populates="module", uselist=True, order_by="TypedefAxis.rid")
+    typedef_blob = relationship("TypedefBlob", back_populates="module", uselist=True, order_by="TypedefBlob.rid")
+    typedef_characteristic = relationship(
+        "TypedefCharacteristic", back_populates="module", uselist=True, order_by="TypedefCharacteristic.rid"
+    )
+    typedef_measurement = relationship(
+        "TypedefMeasurement", back_populates="module", uselist=True, order_by="TypedefMeasurement.rid"
+    )
+    typedef_structure = relationship("TypedefStructure", back_populates="module", uselist=True, order_by="TypedefStructure.rid")
+    unit = relationship("Unit", back_populates="module", uselist=True, order_by="Unit.rid")
+    user_rights = relationship("UserRights", back_populates="module", uselist=True, order_by="UserRights.rid")
     variant_coding = relationship("VariantCoding", back_populates="module", uselist=False)
     _project_rid = Column(types.Integer, ForeignKey("project.rid"))
     project = relationship("Project", back_populates="module", uselist=True)
@@ -5568,27 +5580,77 @@ class SessionProxy:
         self._session = session
         self._ifdata_parser = None
 
-    def setup_ifdata_parser(self, loglevel: str = "INFO") -> None:
-        from pya2l.aml.ifdata_parser import IfDataParser
+    def setup_ifdata_parser(self, loglevel: str = "INFO", native: bool = True) -> None:
+        """Set up IF_DATA parsing; `native=False` selects the pure Python parser."""
+        from pya2l.aml.ifdata_parser import IfDataParser, NativeIfDataParser
 
-        self._ifdata_parser = IfDataParser(self._session, loglevel)
+        self._ifdata_parser = (NativeIfDataParser if native else IfDataParser)(self._session, loglevel)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._session, name)
 
     def parse_ifdata(self, sections: Sequence["IfData"]) -> list[Any]:
-        if self._ifdata_parser is None or not self._ifdata_parser.root or not sections:
+        """Parsed `sections`; values stored at import time are decoded, everything else is parsed now.
+
+        Sections that don't parse are left out.
+        """
+        return [value for value in self.parse_ifdata_many(sections) if value is not None]
+
+    def parse_ifdata_many(self, sections: Sequence["IfData"], workers: int = 1, executor: str = "thread") -> list[Any]:
+        """Parse `sections` in one batch; the result has one entry per section, None where parsing failed.
+
+        Values stored at import time are decoded, the remaining sections are decoded by the
+        native parser -- split across `workers` threads or processes (`executor`) if requested.
+        Requires :meth:`setup_ifdata_parser` unless all values are stored.
+        """
+        if not sections:
             return []
-        else:
-            result: list[Any] = []
-            for section in sections:
-                try:
-                    res = self._ifdata_parser.parse(section.raw)
-                except Exception as e:
-                    logging.getLogger("pya2l.ifdata").debug(f"Error parsing IF_DATA section: {section.raw!r}: {e!r}")
-                else:
-                    result.append(res)
+        result: list[Any] = [None] * len(sections)
+        pending: dict[int, str] = {}
+        for idx, section in enumerate(sections):
+            if ifdata_codec.is_encoded(section.parsed):
+                result[idx] = ifdata_codec.decode(section.parsed)  # None: section didn't parse at import time.
+            else:
+                pending[idx] = section.raw
+        parser = self._ifdata_parser
+        if not pending or parser is None or not parser.root:
             return result
+        values = parser.parse_many(pending.values(), workers=workers, executor=executor)
+        for idx, value in zip(pending, values):
+            result[idx] = value
+        return result
+
+
+def _create_index_pack(metadata: Any) -> list[Index]:
+    """Add the indexes the declarative columns don't provide.
+
+    - ``(_module_rid, name)`` on named top-level tables (lookups by name, scoped to a MODULE).
+    - Every foreign key column, unless it leads an existing index or the primary key
+      (otherwise lazy relationship loads and joins scan the referencing table).
+    """
+    result = []
+    for table in metadata.sorted_tables:
+        leading = {index.columns.values()[0].name for index in table.indexes}
+        leading.add(table.primary_key.columns.values()[0].name)
+        if "_module_rid" in table.c and "name" in table.c:
+            result.append(Index(f"ix_{table.name}__module_rid_name", table.c._module_rid, table.c.name))
+            leading.add("_module_rid")
+        for column in table.columns:
+            if column.foreign_keys and column.name not in leading:
+                result.append(Index(f"ix_{table.name}_{column.name}", column))
+                leading.add(column.name)
+    return result
+
+
+INDEX_PACK = _create_index_pack(Base.metadata)
+
+
+@_register_migration(10, 11)
+def _migrate_10_to_11(session: Any) -> None:
+    """Add the `INDEX_PACK` to databases created before it existed."""
+    connection = session.connection()
+    for index in INDEX_PACK:
+        index.create(connection, checkfirst=True)
 
 
 class A2LDatabase:
@@ -5664,6 +5726,70 @@ class A2LDatabase:
     def session(self) -> "SessionProxy":
         return self._session
 
+    def optimize(self) -> None:
+        """Refresh the query planner statistics (``ANALYZE``, ``PRAGMA optimize``).
+
+        Worthwhile after importing or heavily editing a database; the statistics are
+        stored in the database file.
+        """
+        connection = self.session.connection()
+        connection.exec_driver_sql("ANALYZE")
+        connection.exec_driver_sql("PRAGMA optimize")
+        self.session.commit()
+
+    def vacuum(self) -> None:
+        """Rebuild the database file with a compact, defragmented page layout (``VACUUM``)."""
+        self.session.commit()
+        self.session.connection().exec_driver_sql("VACUUM")
+        self.session.commit()
+
+    def save_as(self, filename: str, vacuum: bool = False) -> None:
+        """Write the database to `filename` in a single pass, e.g. to persist a ``:memory:`` database.
+
+        The copy is written to a temporary file next to `filename` and renamed into place, so an existing
+        file is only replaced by a complete copy.
+
+        Parameters
+        ----------
+        filename: str
+            Target file, replaced if it exists; must not be the database file itself.
+        vacuum: bool
+            Write a compact, defragmented copy (``VACUUM INTO``) instead of a page-by-page copy
+            (SQLite online backup API).
+
+        Raises
+        ------
+        ValueError
+            If `filename` is the file of this database.
+        """
+        if self.dbname and os.path.abspath(filename) == os.path.abspath(self.dbname):
+            raise ValueError(f"Cannot save database {self.dbname!r} onto itself.")
+        self.session.commit()
+        connection = self.session.connection()
+        temp_name = f"{filename}.{uuid.uuid4().hex}.tmp"  # Non-existing, as VACUUM INTO requires.
+        try:
+            if vacuum:
+                connection.exec_driver_sql("VACUUM INTO ?", (temp_name,))
+            else:
+                target = sqlite3.connect(temp_name)
+                try:
+                    connection.connection.driver_connection.backup(target)
+                finally:
+                    target.close()
+            for suffix in ("-wal", "-shm"):  # Left over from the replaced database, they would corrupt the copy.
+                try:
+                    os.unlink(f"{filename}{suffix}")
+                except FileNotFoundError:
+                    pass
+            os.replace(temp_name, filename)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except FileNotFoundError:
+                pass
+            raise
+        self.session.commit()
+
     def begin_transaction(self) -> None:
         """"""
 
@@ -22,7 +22,6 @@ __copyright__ = """
 """
 
 import argparse
-import json
 import logging
 import sys
 import traceback
@@ -36,7 +35,7 @@ from pya2l import import_a2l
 from pya2l.a2lparser import path_components
 from pya2l.imex import (
     export_a2l_db,
-    export_json_dict,
+    export_json,
     open_a2l_database,
     open_json_database,
 )
@@ -109,6 +108,39 @@ def main():
         dest="quiet",
     )
 
+    parser.add_argument(
+        "-w",
+        "--workers",
+        help="Import MODULEs / export MODULE sections in parallel using this many worker processes "
+        "(import: implies the bulk import engine)",
+        dest="workers",
+        type=int,
+        default=1,
+    )
+
+    parser.add_argument(
+        "--staging",
+        help="Build the database in the target file or in RAM, persisted in one pass when done (default: file)",
+        choices=["file", "memory"],
+        dest="staging",
+        default="file",
+    )
+
+    parser.add_argument(
+        "--vacuum",
+        help="Compact the imported database (VACUUM)",
+        action="store_true",
+        default=False,
+        dest="vacuum",
+    )
+
+    parser.add_argument(
+        "--cache",
+        help="Import cache directory: re-use the database of an identical earlier import (default: $PYA2L_IMPORT_CACHE)",
+        dest="cache",
+        default=None,
+    )
+
     parser.add_argument(
         "-V",
         help="Print pya2ldb version information and exit.",
@@ -144,6 +176,13 @@ def main():
         action="store_true",
         dest="pretty",
     )
+    parser.add_argument(
+        "--json-format",
+        help="JSON export layout: one document (default), an array of flat records, or NDJSON (one record per line)",
+        choices=["json", "array", "ndjson"],
+        default="json",
+        dest="json_format",
+    )
 
     parser.add_argument(
         "-f",
@@ -173,30 +212,23 @@ def main():
         if args.json_export:
             db_json = open_json_database(db_path, args.loglevel)
             try:
-                payload = export_json_dict(db_json, args.module)
+                if args.output:
+                    with Path(args.output).open("w", encoding="utf-8") as fh:
+                        export_json(db_json, fh, args.module, format=args.json_format, pretty=args.pretty, workers=args.workers)
+                else:
+                    export_json(db_json, sys.stdout, args.module, format=args.json_format, pretty=args.pretty, workers=args.workers)
+                    if args.json_format != "ndjson":
+                        sys.stdout.write("\n")
             finally:
                 try:
                     db_json.close()
                 except Exception:
                     _logger.debug("Error closing JSON database.", exc_info=True)
-
-            out = args.output
-            json_kwargs = {"ensure_ascii": False}
-            if args.pretty:
-                json_kwargs["indent"] = 4
-            else:
-                json_kwargs["separators"] = (",", ":")
-            if out:
-                with Path(out).open("w", encoding="utf-8") as fh:
-                    json.dump(payload, fh, **json_kwargs)
-            else:
-                json.dump(payload, sys.stdout, **json_kwargs)
-                sys.stdout.write("\n")
         else:
             db_export = open_a2l_database(db_path, args.loglevel)
             try:
                 target = sys.stdout if not args.output else Path(args.output)
-                export_a2l_db(db_export, target, args.module)
+                export_a2l_db(db_export, target, args.module, workers=args.workers)
             finally:
                 try:
                     db_export.close()
@@ -219,6 +251,11 @@ def main():
                 local=args.local,
                 progress_bar=not args.no_progress_bar,
                 force_overwrite=force,
+                engine="bulk" if args.workers > 1 else "orm",
+                workers=args.workers,
+                staging=args.staging,
+                vacuum=args.vacuum,
+                cache=args.cache,
             )
             session.close()
         except OSError as exc:
@@ -32,6 +32,12 @@ class IterationTimings:
     export_a2l_seconds: float
     export_json_seconds: float
     validate_seconds: float | None
+    export_a2l_bytes: int = 0
+
+    @property
+    def export_a2l_mb_per_s(self) -> float | None:
+        """A2L export throughput (MB of output per second)."""
+        return self.export_a2l_bytes / 1e6 / self.export_a2l_seconds if self.export_a2l_seconds else None
 
 
 def _aggregate(values: Iterable[float | None]) -> dict[str, float | None]:
@@ -74,6 +80,7 @@ def run_iteration(dataset: Path, module: str | None, loglevel: str) -> Iteration
                 t1 = time.perf_counter()
                 export_a2l_db(db, Path(tempdir) / "out.a2l", module)
                 export_a2l_seconds = time.perf_counter() - t1
+                export_a2l_bytes = (Path(tempdir) / "out.a2l").stat().st_size
 
                 t2 = time.perf_counter()
                 json_dict = export_json_dict(db, module)
@@ -101,6 +108,7 @@ def run_iteration(dataset: Path, module: str | None, loglevel: str) -> Iteration
         export_a2l_seconds=export_a2l_seconds,
         export_json_seconds=export_json_seconds,
         validate_seconds=validate_seconds,
+        export_a2l_bytes=export_a2l_bytes,
     )
 
 
@@ -181,6 +189,7 @@ def run_benchmark(
                                 "export_a2l",
                                 lambda: export_a2l_db(db, out_dir / "out.a2l", module),
                             )
+                            exp_a2l_bytes = (out_dir / "out.a2l").stat().st_size
                             _, json_to_dict_dur = profiled(
                                 "export_json_dict",
                                 lambda: export_json_dict(db, module),
@@ -202,6 +211,7 @@ def run_benchmark(
                         export_a2l_seconds=exp_a2l_dur,
                         export_json_seconds=json_to_dict_dur + json_serialize_dur,
                         validate_seconds=validate_dur,
+                        export_a2l_bytes=exp_a2l_bytes,
                     )
                 )
             else:
@@ -211,6 +221,7 @@ def run_benchmark(
             "iterations": iterations,
             "import": _aggregate(t.import_seconds for t in timings),
             "export_a2l": _aggregate(t.export_a2l_seconds for t in timings),
+            "export_a2l_mb_per_s": _aggregate(t.export_a2l_mb_per_s for t in timings),
             "export_json": _aggregate(t.export_json_seconds for t in timings),
             "validate": _aggregate(t.validate_seconds for t in timings),
         }
@@ -295,6 +306,9 @@ def main(argv: list[str] | None = None) -> None:
             print(
                 f"  {key}: mean={_fmt(agg['mean'])} median={_fmt(agg['median'])} " f"min={_fmt(agg['min'])} max={_fmt(agg['max'])}"
             )
+        throughput = data["export_a2l_mb_per_s"]
+        if throughput["mean"] is not None:
+            print(f"  export_a2l throughput: mean={throughput['mean']:.2f} MB/s min={throughput['min']:.2f} MB/s")
 
     if args.output:
         args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
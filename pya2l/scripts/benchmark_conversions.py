@@ -0,0 +1,115 @@
+"""Benchmark COMPU_METHOD evaluators (`pya2l.functions`) on large sample arrays."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from pya2l import functions
+from pya2l.functions import _COMPUTE_AVAILABLE
+
+
+DEFAULT_SAMPLES = 10_000_000
+
+
+def _evaluators() -> dict[str, Any]:
+    verb = [(k, f"State_{k}") for k in range(0, 256, 2)]
+    ranges = [(k, k + 7, f"Range_{k}") for k in range(0, 256, 10)]
+    table = [(k, k * 0.25) for k in range(0, 256, 4)]
+    result: dict[str, Any] = {
+        "IDENTICAL": functions.Identical(),
+        "LINEAR": functions.Linear(functions.CoeffsLinear(0.5, -10.0)),
+        "RAT_FUNC": functions.RatFunc(functions.Coeffs(0, 2.0, 20.0, 0, 0, 1.0)),
+        "TAB_NOINTP": functions.LookupTable(table, default=-1.0),
+        "TAB_VERB": functions.LookupTable(verb, default="unknown"),
+        "TAB_VERB_RANGES": functions.LookupTableWithRanges(ranges, default="out of range"),
+        "FORM": functions.Formula("X1 * 0.5 - 10", "(X1 + 10) * 2"),
+    }
+    if _COMPUTE_AVAILABLE:
+        result["TAB_INTP"] = functions.InterpolatedTable(table)
+    return result
+
+
+def _time(func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return {"mean": statistics.mean(durations), "min": min(durations), "max": max(durations)}
+
+
+def run_benchmark(samples: int, repeat: int, seed: int = 4711) -> dict[str, dict[str, Any]]:
+    """Time ``int_to_physical`` and ``physical_to_int`` of every conversion type on `samples` values."""
+    rng = np.random.default_rng(seed)
+    internal = rng.integers(0, 256, samples)
+    results: dict[str, dict[str, Any]] = {}
+    for name, evaluator in _evaluators().items():
+        entry: dict[str, Any] = {"int_to_physical": _time(partial(evaluator.int_to_physical, internal), repeat)}
+        physical = evaluator.int_to_physical(internal)
+        try:
+            evaluator.physical_to_int(physical[:1])
+        except NotImplementedError:
+            entry["physical_to_int"] = None
+        else:
+            entry["physical_to_int"] = _time(partial(evaluator.physical_to_int, physical), repeat)
+        results[name] = entry
+    return results
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark COMPU_METHOD conversions on sample arrays.")
+    parser.add_argument(
+        "-s",
+        "--samples",
+        dest="samples",
+        type=int,
+        default=DEFAULT_SAMPLES,
+        help=f"Number of samples per conversion (default: {DEFAULT_SAMPLES}).",
+    )
+    parser.add_argument(
+        "-n",
+        "--iterations",
+        dest="iterations",
+        type=int,
+        default=3,
+        help="Number of iterations per conversion (default: 3).",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        type=Path,
+        help="Optional JSON file to store benchmark results.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    results = run_benchmark(args.samples, args.iterations)
+
+    for name, data in results.items():
+        print(f"{name}:")
+        for direction in ("int_to_physical", "physical_to_int"):
+            agg = data[direction]
+            if agg is None:
+                print(f"  {direction}: n/a")
+            else:
+                rate = args.samples / agg["min"] / 1e6
+                print(f"  {direction}: mean={agg['mean']:.4f}s min={agg['min']:.4f}s ({rate:.1f} M samples/s)")
+
+    if args.output:
+        args.output.write_text(json.dumps({"samples": args.samples, "results": results}, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import io
+
+import pytest
+from sqlalchemy import event
+
+from pya2l import model
+from pya2l.a2lparser import A2LParser
+from pya2l.imex import a2l_exporter, parallel
+
+
+MEASUREMENT = """
+    /begin MEASUREMENT M{0} "Measurement {0}" UWORD CM.LINEAR 0 0 0 1000
+      ECU_ADDRESS 0x{0:04X}
+      BIT_MASK 0x0FF0
+      /begin ANNOTATION ANNOTATION_LABEL "Label {0}" /begin ANNOTATION_TEXT "Text {0}" /end ANNOTATION_TEXT /end ANNOTATION
+      /begin FUNCTION_LIST F1 /end FUNCTION_LIST
+    /end MEASUREMENT
+"""
+
+CHARACTERISTIC = """
+    /begin CHARACTERISTIC C{0} "Characteristic {0}" VALUE 0x{0:04X} RL.UWORD 0 CM.LINEAR 0 1000
+      EXTENDED_LIMITS 0 2000
+      FORMAT "%6.2"
+    /end CHARACTERISTIC
+"""
+
+A2L = """
+ASAP2_VERSION 1 71
+/begin PROJECT P ""
+  /begin MODULE MOD ""
+    /begin COMPU_METHOD CM.LINEAR "" LINEAR "%6.2" "V" COEFFS_LINEAR 2 0 /end COMPU_METHOD
+    /begin RECORD_LAYOUT RL.UWORD FNC_VALUES 1 UWORD COLUMN_DIR DIRECT /end RECORD_LAYOUT
+    /begin FUNCTION F1 "" /end FUNCTION
+{elements}
+  /end MODULE
+/end PROJECT
+"""
+
+
+def _export(tmp_path, count: int) -> tuple[str, int]:
+    """Export a database with `count` MEASUREMENTs and CHARACTERISTICs; returns output and number of SQL statements."""
+    a2l_file = tmp_path / f"elements_{count}.a2l"
+    elements = "".join(MEASUREMENT.format(idx) + CHARACTERISTIC.format(idx) for idx in range(count))
+    a2l_file.write_text(A2L.format(elements=elements), encoding="latin-1")
+    db = A2LParser().parse(str(a2l_file), in_memory=True, progress_bar=False, loglevel="ERROR")
+    statements = []
+    event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    try:
+        out = io.StringIO()
+        a2l_exporter.export_db(db, out)
+    finally:
+        db.close()
+    return out.getvalue(), len(statements)
+
+
+def test_statements_independent_of_element_count(tmp_path):
+    small, small_statements = _export(tmp_path, 5)
+    large, large_statements = _export(tmp_path, 200)
+    assert small.count("/begin MEASUREMENT") == 5
+    assert large.count("/begin MEASUREMENT") == 200
+    assert large.count("ANNOTATION_LABEL") == 200
+    assert large.count("EXTENDED_LIMITS") == 200
+    assert large_statements == small_statements
+
+
+@pytest.mark.parametrize("batch_size", [1, 7])
+def test_output_independent_of_batch_size(tmp_path, monkeypatch, batch_size):
+    expected, _ = _export(tmp_path, 20)
+    monkeypatch.setattr(a2l_exporter, "EXPORT_BATCH_SIZE", batch_size)
+    assert _export(tmp_path, 20)[0] == expected
+
+
+def test_parallel_export_matches_serial(tmp_path, monkeypatch, caplog):
+    expected, _ = _export(tmp_path, 30)
+    a2l_file = tmp_path / "elements_30.a2l"
+    db = A2LParser().parse(str(a2l_file), in_memory=True, progress_bar=False, loglevel="ERROR")
+    try:
+        out = io.StringIO()
+        a2l_exporter.export_db(db, out, workers=2)  # In-memory: exported in-process.
+        assert out.getvalue() == expected
+        assert "exporting serially" in caplog.text
+        db.save_as(str(tmp_path / "elements.a2ldb"))
+    finally:
+        db.close()
+    monkeypatch.setattr(parallel, "CHUNK_SIZE", 7)  # Sections are split across several tasks.
+    db = a2l_exporter.open_database(tmp_path / "elements.a2ldb", "ERROR")
+    try:
+        module = db.session.query(model.Module).one()
+        chunks = parallel.section_chunks(db.session, module, "measurement")
+        assert len(chunks) == 5
+        assert chunks[-1][1] is None
+        out = io.StringIO()
+        a2l_exporter.export_db(db, out, workers=2)
+    finally:
+        db.close()
+    assert out.getvalue() == expected
+
+
+def _render_whole(session):
+    """Rendering of `pya2l.export_a2l()` before it was streamed: the complete text, post-processed at once."""
+    from pya2l import _BLANK_BLOCKS, A2L_TEMPLATE, model
+    from pya2l.templates import doTemplateFromText
+
+    text = doTemplateFromText(A2L_TEMPLATE, {"session": session, "model": model}, formatExceptions=False, encoding="latin-1")
+    return _BLANK_BLOCKS.sub(r"\1\1", text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 1000])
+def test_a2l_writer_matches_whole_text(chunk_size):
+    from pya2l import _BLANK_BLOCKS, _A2LWriter
+    from pya2l.templates import indentText
+
+    text = "A\r\n\r\n\r\n  B  \n \t\n\n\nC\rD\x85E \n\n\n  \n\n\n"
+    for pieces in ([text], list(text), [text[:4], text[4:9], text[9:]]):
+        out = io.StringIO()
+        writer = _A2LWriter(out, chunk_size)
+        for piece in pieces:
+            writer.write(piece)
+        writer.close()
+        assert out.getvalue() == _BLANK_BLOCKS.sub(r"\1\1", indentText(text))
+
+
+def test_streamed_template_matches_whole_text(tmp_path):
+    from pya2l import _write_a2l
+
+    a2l_file = tmp_path / "elements_3.a2l"
+    a2l_file.write_text(A2L.format(elements="".join(MEASUREMENT.format(idx) + CHARACTERISTIC.format(idx) for idx in range(3))))
+    db = A2LParser().parse(str(a2l_file), in_memory=True, progress_bar=False, loglevel="ERROR")
+    try:
+        expected = _render_whole(db.session)
+        out = io.StringIO()
+        _write_a2l(db.session, out, "latin-1", chunk_size=64)
+    finally:
+        db.close()
+    assert "/begin MEASUREMENT" in expected
+    assert out.getvalue() == expected
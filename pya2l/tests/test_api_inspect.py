@@ -1,11 +1,14 @@
 import gc
 
+import numpy as np
 import pytest
 
 from pya2l.a2lparser import A2LParser
 from pya2l.api.inspect import (
+    DENSE_LUT_CACHE,
     AxisPts,
     Blob,
+    CachedBase,
     Characteristic,
     CompuMethod,
     FilteredList,
@@ -15,6 +18,7 @@ from pya2l.api.inspect import (
     MemoryType,
     ModCommon,
     ModPar,
+    Module,
     NoCompuMethod,
     NoModCommon,
     PrgTypeLayout,
@@ -485,6 +489,192 @@ def test_compu_method_linear(db):
     assert cm.physical_to_int(21) == 10.0
 
 
+COMPU_METHOD_FORM_A2L = """
+ASAP2_VERSION 1 71
+/begin PROJECT TestProject ""
+  /begin MODULE TestModule ""
+    /begin MOD_PAR "" /end MOD_PAR
+    /begin COMPU_METHOD FormMethod "" FORM "%6.2" "V"
+        /begin FORMULA "fmod(X1, 2)" /end FORMULA
+    /end COMPU_METHOD
+  /end MODULE
+/end PROJECT
+"""
+
+
+@pytest.mark.parametrize("db", [COMPU_METHOD_FORM_A2L], indirect=True)
+def test_compu_method_unsupported_formula(db):
+    cm = CompuMethod(db.session, "FormMethod")
+    assert cm.conversionType == "FORM"
+    assert cm.int_to_physical(3).size == 0
+
+
+DENSE_LUT_A2L = """
+ASAP2_VERSION 1 71
+/begin PROJECT TestProject ""
+  /begin MODULE TestModule ""
+    /begin COMPU_METHOD LinearMethod "" LINEAR "%6.2" "V" COEFFS_LINEAR 0.25 -10.0 /end COMPU_METHOD
+    /begin COMPU_METHOD RatFuncMethod "" RAT_FUNC "%6.2" "V" COEFFS 0 4 8 0 0 2 /end COMPU_METHOD
+    /begin COMPU_METHOD TabVerbMethod "" TAB_VERB "%s" "" COMPU_TAB_REF Vtab /end COMPU_METHOD
+    /begin COMPU_VTAB Vtab "" TAB_VERB 3 -1 "Error" 0 "Off" 1 "On" DEFAULT_VALUE "Unknown" /end COMPU_VTAB
+  /end MODULE
+/end PROJECT
+"""
+
+
+@pytest.fixture
+def dense_luts():
+    limits = CompuMethod.configure_dense_luts(enabled=True)
+    yield
+    CompuMethod.configure_dense_luts(enabled=False, max_bytes=limits.max_bytes)
+
+
+@pytest.mark.parametrize("db", [DENSE_LUT_A2L], indirect=True)
+def test_compu_method_dense_lut(db, dense_luts):
+    rng = np.random.default_rng(42)
+    for name in ("LinearMethod", "RatFuncMethod", "TabVerbMethod"):
+        cm = CompuMethod.get(db.session, name)
+        for datatype, dtype in (("UBYTE", "uint8"), ("SBYTE", "int8"), ("UWORD", "uint16"), ("SWORD", "int16")):
+            info = np.iinfo(dtype)
+            raw = rng.integers(info.min, info.max, 1000, endpoint=True).astype(dtype)
+            expected = cm.evaluator.int_to_physical(raw)
+            assert np.array_equal(cm.int_to_physical(raw, datatype), expected)
+            assert np.array_equal(cm.int_to_physical(raw[::-3], datatype), expected[::-3])
+            assert cm.dense_lut(datatype).shape == (info.max - info.min + 1,)
+        # Shared by all instances of the COMPU_METHOD in the session.
+        assert CompuMethod(db.session, name).dense_lut("UWORD") is cm.dense_lut("UWORD")
+    assert CachedBase.cache_stats(db.session)[DENSE_LUT_CACHE].entries == 12
+
+    cm = CompuMethod.get(db.session, "LinearMethod")
+    raw = np.array([0, 65535, 40], dtype="uint16")
+    assert cm.int_to_physical(raw.astype("int64"), "UWORD").tolist() == [-10.0, 16373.75, 0.0]  # No table for int64 input.
+    assert cm.dense_lut("FLOAT32_IEEE") is None and cm.dense_lut("ULONG") is None
+
+    CompuMethod.configure_dense_luts(max_bytes=100_000)  # Too small for 16 bit tables.
+    assert cm.dense_lut("UWORD") is None
+    assert cm.int_to_physical(raw, "UWORD").tolist() == [-10.0, 16373.75, 0.0]
+    assert cm.dense_lut("UBYTE") is not None
+    assert CachedBase.cache_stats(db.session)[DENSE_LUT_CACHE].bytes <= 100_000
+
+
+CONVERT_MANY_A2L = DENSE_LUT_A2L.replace(
+    "  /end MODULE",
+    """    /begin MEASUREMENT Speed "" UWORD LinearMethod 0 0 -10 16374 /end MEASUREMENT
+    /begin MEASUREMENT Torque "" SWORD LinearMethod 0 0 -8202 8182 /end MEASUREMENT
+    /begin MEASUREMENT Voltage "" UWORD LinearMethod 0 0 -10 16374 /end MEASUREMENT
+    /begin MEASUREMENT Ratio "" UBYTE RatFuncMethod 0 0 -2 126 /end MEASUREMENT
+    /begin MEASUREMENT State "" SBYTE TabVerbMethod 0 0 -1 1 /end MEASUREMENT
+    /begin MEASUREMENT Raw "" ULONG NO_COMPU_METHOD 0 0 0 4294967295 /end MEASUREMENT
+    /begin MEASUREMENT Broken "" UBYTE MissingMethod 0 0 0 255 /end MEASUREMENT
+  /end MODULE""",
+)
+
+
+@pytest.mark.parametrize("db", [CONVERT_MANY_A2L], indirect=True, ids=["convert_many"])
+@pytest.mark.parametrize("workers", [1, 4])
+def test_module_convert_many(db, workers):
+    rng = np.random.default_rng(7)
+    signals = {
+        "State": np.array([-1, 0, 1, 5], dtype="int8"),
+        "Speed": rng.integers(0, 65535, 1000).astype("uint16"),
+        "Voltage": rng.integers(0, 65535, (10, 20)).astype("uint16"),
+        "Torque": rng.integers(-32768, 32767, 100).astype("int16"),
+        "Ratio": [1, 2, 3],
+        "Raw": np.arange(5, dtype="uint32"),
+    }
+    module = Module(db.session)
+    physical = module.convert_many(signals, workers=workers)
+    assert list(physical) == list(signals)
+    for name, values in signals.items():
+        expected = Measurement.get(db.session, name).compuMethod.int_to_physical(np.asarray(values))
+        assert np.array_equal(physical[name], expected)
+        assert physical[name].shape == np.shape(values)
+    assert physical["State"].tolist() == ["Error", "Off", "On", "Unknown"]
+
+    CompuMethod.configure_dense_luts(enabled=True)
+    try:
+        with_luts = module.convert_many(signals, workers=workers)
+    finally:
+        CompuMethod.configure_dense_luts(enabled=False)
+    assert all(np.array_equal(with_luts[name], physical[name]) for name in signals)
+    assert (
+        CachedBase.cache_stats(db.session)[DENSE_LUT_CACHE].entries == 3
+    )  # UWORD / SWORD LINEAR, SBYTE TAB_VERB; "Ratio" is int64.
+
+    internal = module.convert_many(
+        {name: physical[name] for name in ("Speed", "Voltage", "Raw")}, "physical_to_int", workers=workers
+    )
+    assert all(np.allclose(internal[name], signals[name]) for name in internal)
+
+    with pytest.raises(KeyError):
+        module.convert_many({"Speed": [1], "NoSuchSignal": [1]})
+    with pytest.raises(ValueError):
+        module.convert_many({"Broken": [1]})
+    with pytest.raises(ValueError):
+        module.convert_many({"Speed": [1]}, direction="sideways")
+
+
+ELEMENT_TABLE_A2L = """
+ASAP2_VERSION 1 71
+/begin PROJECT TestProject ""
+  /begin MODULE TestModule ""
+    /begin MEASUREMENT Speed "Vehicle speed" UWORD CM 1 0.5 0 250
+        ECU_ADDRESS 0x1000
+        BIT_MASK 0x0FFF
+        BYTE_ORDER MSB_FIRST
+        FORMAT "%6.1"
+        PHYS_UNIT "km/h"
+    /end MEASUREMENT
+    /begin MEASUREMENT Temp "" SBYTE NO_COMPU_METHOD 0 0 -40 80
+        ECU_ADDRESS_EXTENSION 2
+        ARRAY_SIZE 4
+    /end MEASUREMENT
+    /begin MEASUREMENT Flag "" UBYTE NO_COMPU_METHOD 0 0 0 1 ECU_ADDRESS 0xFFFFFFF0 /end MEASUREMENT
+    /begin CHARACTERISTIC Gain "" VALUE 0x2000 RL 0.1 CM 0 10 BIT_MASK 0xFF /end CHARACTERISTIC
+    /begin CHARACTERISTIC Curve "A curve" ASCII 0x3000 RL 0 NO_COMPU_METHOD 0 255 NUMBER 16 /end CHARACTERISTIC
+  /end MODULE
+/end PROJECT
+"""
+
+
+@pytest.mark.parametrize("db", [ELEMENT_TABLE_A2L], indirect=True, ids=["element_table"])
+def test_module_element_tables(db):
+    module = Module(db.session)
+
+    def check(table, objects, row_getter):
+        assert list(table["name"]) == [obj.name for obj in objects]
+        for name, column in table.items():
+            assert len(column) == len(objects)
+            for value, obj in zip(column.tolist() if np.ma.isMaskedArray(column) else column, objects):
+                assert value == row_getter(obj, name), (obj.name, name)
+
+    def measurement_value(obj, name):
+        return obj._conversionRef if name == "conversion" else getattr(obj, name)
+
+    measurements = [Measurement.get(db.session, name) for name in ("Speed", "Temp", "Flag")]
+    table = module.measurement_table()
+    check(table, measurements, measurement_value)
+    assert table["ecuAddress"].dtype == np.uint64 and table["ecuAddress"].mask.tolist() == [False, True, False]
+    assert table["ecuAddressExtension"].tolist() == [0, 2, 0]
+    assert table["lowerLimit"].dtype == np.float64 and table["name"].dtype == object
+
+    def characteristic_value(obj, name):
+        if name in ("conversion", "deposit"):
+            return getattr(obj.characteristic, name)
+        return getattr(obj, name)
+
+    characteristics = [Characteristic.get(db.session, name) for name in ("Gain", "Curve")]
+    table = module.characteristic_table()
+    check(table, characteristics, characteristic_value)
+    assert table["number"].tolist() == [None, 16]
+
+    subset = module.measurement_table(["ecuAddress", "name"])
+    assert list(subset) == ["ecuAddress", "name"]
+    assert subset["name"].tolist() == ["Speed", "Temp", "Flag"]
+    with pytest.raises(ValueError):
+        module.measurement_table(["name", "noSuchColumn"])
+
+
 MOD_COMMON_A2L = """
 ASAP2_VERSION 1 71
 /begin PROJECT TestProject ""
@@ -559,6 +749,37 @@ def test_axis_pts(db):
     assert "axis_pts" in axis.record_layout_components["position"][0][0]
 
 
+@pytest.mark.parametrize(
+    "db, klass, name",
+    [
+        (MEASUREMENT_FULL_A2L, Measurement, "N"),
+        (CHARACTERISTIC_A2L, Characteristic, "Char1"),
+        (AXIS_PTS_A2L, AxisPts, "Axis1"),
+    ],
+    indirect=["db"],
+    ids=["measurement", "characteristic", "axis_pts"],
+)
+def test_lazy_attributes(db, klass, name):
+    eager = klass(db.session, name)
+    lazy = klass(db.session, name, lazy=True)
+    assert set(klass._attribute_loaders) <= vars(eager).keys()
+    assert not set(klass._attribute_loaders) & vars(lazy).keys()
+    assert lazy.format == eager.format
+    assert set(klass._attribute_loaders) & vars(lazy).keys() == {"format"}
+    assert lazy == eager  # Compares (and thereby loads) all fields.
+    assert set(klass._attribute_loaders) <= vars(lazy).keys()
+    with pytest.raises(AttributeError):
+        lazy.noSuchAttribute
+
+    previous = klass.configure_lazy(True)
+    try:
+        instance = klass.get(db.session, name, no_cache=True)
+    finally:
+        klass.configure_lazy(previous)
+    assert "if_data" not in vars(instance)
+    assert instance.if_data == eager.if_data
+
+
 FUNCTION_A2L = """
 ASAP2_VERSION 1 71
 /begin PROJECT TestProject ""
@@ -768,6 +989,120 @@ def test_filtered_list():
         db.close()
 
 
+LOADER_PROFILE_A2L = (
+    """
+ASAP2_VERSION 1 71
+/begin PROJECT Project1 ""
+  /begin MODULE Module1 ""
+    /begin RECORD_LAYOUT RL1
+        FNC_VALUES 1 UWORD COLUMN_DIR DIRECT
+    /end RECORD_LAYOUT
+"""
+    + "".join(f"""
+    /begin CHARACTERISTIC CH{idx} "Characteristic {idx}" VALUE 0x{0x1000 + 2 * idx:X} RL1 0 NO_COMPU_METHOD 0 1000
+        BIT_MASK 0x{idx + 1:X}
+        DISPLAY_IDENTIFIER DI_{idx}
+        EXTENDED_LIMITS -10 {idx + 1010}
+        FORMAT "%{idx % 8 + 2}.1"
+        /begin ANNOTATION ANNOTATION_LABEL "label {idx}" /end ANNOTATION
+    /end CHARACTERISTIC
+    /begin MEASUREMENT M{idx} "Measurement {idx}" UWORD NO_COMPU_METHOD 0 0 0 65535
+        ECU_ADDRESS 0x{0x2000 + 2 * idx:X}
+        DISPLAY_IDENTIFIER DI_M{idx}
+        MATRIX_DIM 2 3
+    /end MEASUREMENT""" for idx in range(40))
+    + """
+  /end MODULE
+/end PROJECT
+"""
+)
+
+
+def _snapshot(obj):
+    return tuple(
+        repr(getattr(obj, name, None))
+        for name in ("name", "displayIdentifier", "bitMask", "extendedLimits", "format", "annotations", "ecuAddress", "matrixDim")
+    )
+
+
+@pytest.mark.parametrize("db", [LOADER_PROFILE_A2L], indirect=True, ids=["loader_profile"])
+@pytest.mark.parametrize("klass, association", [(Characteristic, "characteristic"), (Measurement, "measurement")])
+def test_filtered_list_loader_profile(db, klass, association):
+    from sqlalchemy import event
+
+    from pya2l import model
+
+    session = db.session
+    engine = session.get_bind()
+    counts = []
+
+    def query_count(loader_paths):
+        session.expunge_all()
+        klass.clear_session(session)
+        module = session.query(model.Module).first()
+        statements = []
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            objects = list(
+                FilteredList(session, getattr(module, association), klass, loader_paths=loader_paths, batch_size=16).query()
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        counts.append(len(statements))
+        return [_snapshot(obj) for obj in objects]
+
+    assert query_count(()) == query_count(None)
+    lazy, eager = counts
+    assert eager < lazy // 3
+
+
+@pytest.mark.parametrize("db", [LOADER_PROFILE_A2L], indirect=True, ids=["loader_profile"])
+def test_filtered_list_sql_filters(db):
+    from pya2l import model
+    from pya2l.api.inspect import Module
+
+    session = db.session
+    session.expunge_all()
+    module = Module(session)
+
+    def names(items):
+        return sorted(item.name for item in items)
+
+    assert names(module.measurement.query(name="M1*")) == ["M1"] + [f"M{idx}" for idx in range(10, 20)]
+    # Only matching rows were loaded.
+    assert len([obj for obj in session.identity_map.values() if isinstance(obj, model.Measurement)]) == 11
+    assert names(module.measurement.query(regex=r"^M[23]$")) == ["M2", "M3"]
+    assert names(module.measurement.query(address=(0x2000, 0x2006))) == ["M0", "M1", "M2", "M3"]
+    assert len(list(module.measurement.query(datatype=("UWORD", "SLONG")))) == 40
+    assert list(module.measurement.query(datatype="SLONG")) == []
+    assert names(module.characteristic.query(model.Characteristic.address >= 0x1000 + 2 * 38)) == ["CH38", "CH39"]
+    assert names(module.characteristic.query(address=(0x1000, 0x1002), name="CH*")) == ["CH0", "CH1"]
+    assert names(module.characteristic.query(lambda row: row.name.endswith("7"))) == ["CH17", "CH27", "CH37", "CH7"]
+    with pytest.raises(ValueError, match="datatype"):
+        list(module.characteristic.query(datatype="UBYTE"))
+
+    # Plain collections of a database object can be filtered in SQL as well.
+    module_row = session.query(model.Module).first()
+    assert names(FilteredList(session, module_row.characteristic, Characteristic).query(name="CH3?")) == [
+        f"CH{idx}" for idx in range(30, 40)
+    ]
+    assert list(FilteredList(session, [], Characteristic).query(name="CH*")) == []
+
+
+@pytest.mark.parametrize("db", [LOADER_PROFILE_A2L], indirect=True, ids=["loader_profile"])
+def test_filtered_list_includes_unflushed_objects(db):
+    from pya2l.api.create import MeasurementCreator
+    from pya2l.api.inspect import Module
+
+    session = db.session
+    module = Module(session)
+    count = len(list(module.measurement.query()))
+    MeasurementCreator(session).create_measurement("M_NEW", "", "UBYTE", "NO_COMPU_METHOD", 0, 0, 0, 255, module_name=module.name)
+    assert len(list(module.measurement.query())) == count + 1
+    assert [item.name for item in module.measurement.query(name="M_NEW")] == ["M_NEW"]
+
+
 @pytest.mark.parametrize(
     "db",
     ["""
@@ -0,0 +1,267 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+
+from pya2l import _render_a2l, model
+from pya2l.a2lparser import A2LParser
+
+
+MIXED_A2L = """
+ASAP2_VERSION 1 71
+/begin PROJECT BulkProject "Bulk import test"
+  /begin MODULE BulkModule ""
+    /begin IF_DATA XCP MODLEVEL 1 /end IF_DATA
+    /begin MEASUREMENT Meas "Testsignal" UWORD CM 0 0 0 15
+      BIT_MASK 0x3C0
+      BYTE_ORDER MSB_LAST
+      ECU_ADDRESS 0x125438
+      FORMAT "%.3"
+      /begin IF_DATA CANAPE_EXT 100 LINK_MAP "wordCounter" 0x125438 0x0 0 0x0 1 0x8F 0x0 /end IF_DATA
+      /begin IF_DATA XCP 1 2 /end IF_DATA
+      /begin ANNOTATION ANNOTATION_LABEL "first" /begin ANNOTATION_TEXT "a" "b" /end ANNOTATION_TEXT /end ANNOTATION
+      /begin ANNOTATION ANNOTATION_LABEL "second" /end ANNOTATION
+      /begin FUNCTION_LIST F1 F2 /end FUNCTION_LIST
+      DISCRETE
+      /begin VIRTUAL A B /end VIRTUAL
+    /end MEASUREMENT
+    /begin CHARACTERISTIC Map "" MAP 0x1000 RL 0 CM 0 100
+      /begin AXIS_DESCR STD_AXIS Meas CM 4 0 100 /end AXIS_DESCR
+      /begin AXIS_DESCR STD_AXIS Meas CM 3 0 100 READ_ONLY /end AXIS_DESCR
+      MATRIX_DIM 4 3 1
+    /end CHARACTERISTIC
+    /begin RECORD_LAYOUT RL FNC_VALUES 1 UBYTE COLUMN_DIR DIRECT /end RECORD_LAYOUT
+    /begin COMPU_METHOD CM "" TAB_VERB "%6.3" "" COMPU_TAB_REF VerbTab /end COMPU_METHOD
+    /begin COMPU_TAB NumTab "" TAB_INTP 2 0 0 1 10 DEFAULT_VALUE_NUMERIC 5 /end COMPU_TAB
+    /begin COMPU_VTAB VerbTab "" TAB_VERB 2 0 "Off" 1 "On" DEFAULT_VALUE "Unknown" /end COMPU_VTAB
+    /begin COMPU_VTAB_RANGE VerbRange "" 2 0 10 "LOW" 11 20 "HIGH" /end COMPU_VTAB_RANGE
+    /begin VARIANT_CODING
+      /begin VAR_CRITERION Car "" Limousine Kombi /end VAR_CRITERION
+      /begin VAR_FORBIDDEN_COMB Car Kombi /end VAR_FORBIDDEN_COMB
+    /end VARIANT_CODING
+  /end MODULE
+/end PROJECT
+"""
+
+
+def _row_counts(db) -> dict[str, int]:
+    session = db.session
+    return {
+        table.name: session.execute(select(func.count()).select_from(table)).scalar() for table in model.Base.metadata.sorted_tables
+    }
+
+
+@pytest.fixture
+def a2l_file(tmp_path) -> Path:
+    result = tmp_path / "bulk.a2l"
+    result.write_text(MIXED_A2L, encoding="latin-1")
+    return result
+
+
+def _parse(file_name, engine, workers=1):
+    return A2LParser().parse(str(file_name), in_memory=True, progress_bar=False, loglevel="ERROR", engine=engine, workers=workers)
+
+
+def test_bulk_matches_orm(a2l_file):
+    orm_db = _parse(a2l_file, "orm")
+    bulk_db = _parse(a2l_file, "bulk")
+    try:
+        assert _row_counts(bulk_db) == _row_counts(orm_db)
+        assert _render_a2l(bulk_db.session, "latin-1") == _render_a2l(orm_db.session, "latin-1")
+    finally:
+        orm_db.close()
+        bulk_db.close()
+
+
+def test_stream_matches_orm(a2l_file):
+    orm_db = _parse(a2l_file, "orm")
+    stream_db = _parse(a2l_file, "stream")
+    try:
+        assert _row_counts(stream_db) == _row_counts(orm_db)
+        assert _render_a2l(stream_db.session, "latin-1") == _render_a2l(orm_db.session, "latin-1")
+    finally:
+        orm_db.close()
+        stream_db.close()
+
+
+def test_parse_stream_yields_module_children(a2l_file):
+    from pya2l.a2lparser_ext import parse_stream
+
+    chunks = []
+    _, tree, tables, _ = parse_stream(
+        str(a2l_file), "latin-1", "ERROR", lambda idx, chunk, t: chunks.append((idx, chunk.get_name(), len(t)))
+    )
+    assert chunks == [
+        (0, "IfData", 0),
+        (0, "Measurement", 0),
+        (0, "Characteristic", 0),
+        (0, "RecordLayout", 0),
+        (0, "CompuMethod", 0),
+        (0, "CompuTab", 1),
+        (0, "CompuVtab", 1),
+        (0, "CompuVtabRange", 1),
+        (0, "VariantCoding", 1),
+    ]
+    project = next(kw for kw in tree.get_keywords() if kw.get_name() == "Project")
+    module = next(kw for kw in project.get_keywords() if kw.get_name() == "Module")
+    assert module.get_keywords() == []
+    assert tables == []
+
+
+def test_bulk_relationships(a2l_file):
+    db = _parse(a2l_file, "bulk")
+    try:
+        session = db.session
+        module = session.query(model.Module).one()
+        assert [s.raw for s in module.if_data] == ["/begin IF_DATA XCP MODLEVEL 1 /end IF_DATA"]
+        meas = session.query(model.Measurement).filter_by(name="Meas").one()
+        assert meas.module is module
+        assert meas.bit_mask.mask == 0x3C0
+        assert meas.ecu_address.address == 0x125438
+        assert meas.discrete is True
+        assert meas.read_write is False
+        assert len(meas.if_data) == 2
+        assert [a.annotation_label.label for a in meas.annotation] == ["first", "second"]
+        assert list(meas.annotation[0].annotation_text.text) == ["a", "b"]
+        assert list(meas.function_list.name) == ["F1", "F2"]
+        assert list(meas.virtual.measuringChannel) == ["A", "B"]
+        char = session.query(model.Characteristic).filter_by(name="Map").one()
+        assert [a.maxAxisPoints for a in char.axis_descr] == [4, 3]
+        assert char.axis_descr[1].read_only is True
+        assert list(char.matrix_dim.numbers) == [4, 3, 1]
+        vtab = session.query(model.CompuVtab).filter_by(name="VerbTab").one()
+        assert vtab.numberValuePairs == 2
+        assert [(p.inVal, p.outVal) for p in vtab.pairs] == [(0.0, "Off"), (1.0, "On")]
+        vrange = session.query(model.CompuVtabRange).filter_by(name="VerbRange").one()
+        assert [(t.inValMin, t.inValMax, t.outVal) for t in vrange.triples] == [(0.0, 10.0, "LOW"), (11.0, 20.0, "HIGH")]
+        comb = session.query(model.VarForbiddenComb).one()
+        assert [(p.criterionName, p.criterionValue) for p in comb.pairs] == [("Car", "Kombi")]
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("engine", ["bulk", "stream"])
+def test_bulk_matches_orm_asap2_demo(engine):
+    source = Path(__file__).resolve().parents[2] / "examples" / "ASAP2_Demo_V161.a2l"
+    if not source.exists():
+        pytest.skip("ASAP2 demo file not available")
+    orm_db = _parse(source, "orm")
+    bulk_db = _parse(source, engine)
+    try:
+        assert _row_counts(bulk_db) == _row_counts(orm_db)
+        assert _render_a2l(bulk_db.session, "latin-1") == _render_a2l(orm_db.session, "latin-1")
+    finally:
+        orm_db.close()
+        bulk_db.close()
+
+
+def _multi_module_file(tmp_path):
+    """MIXED_A2L with three copies of its MODULE."""
+    begin = MIXED_A2L.index("  /begin MODULE")
+    end = MIXED_A2L.index("/end PROJECT")
+    module = MIXED_A2L[begin:end]
+    modules = ""
+    for idx in range(3):
+        text = module
+        # Value tables (COMPU_TAB, ...) are looked up by name, so keep them unique across modules.
+        for name in ("BulkModule", "NumTab", "VerbTab", "VerbRange"):
+            text = text.replace(name, f"{name}{idx}")
+        modules += text
+    result = tmp_path / "multi.a2l"
+    result.write_text(MIXED_A2L[:begin] + modules + MIXED_A2L[end:], encoding="latin-1")
+    return result
+
+
+def test_parse_stream_skips_other_modules(tmp_path):
+    from pya2l.a2lparser_ext import parse_stream
+
+    chunks = []
+    _, tree, _, _ = parse_stream(
+        str(_multi_module_file(tmp_path)), "latin-1", "ERROR", lambda idx, chunk, t: chunks.append(idx), module=1
+    )
+    assert chunks == [1] * 9
+    project = next(kw for kw in tree.get_keywords() if kw.get_name() == "Project")
+    modules = [kw for kw in project.get_keywords() if kw.get_name() == "Module"]
+    assert [module.get_parameters()[0] for module in modules] == ["BulkModule0", "BulkModule1", "BulkModule2"]
+    assert [module.get_keywords() for module in modules] == [[], [], []]
+
+
+@pytest.mark.parametrize("engine", ["bulk", "stream"])
+def test_parallel_matches_orm(tmp_path, engine):
+    a2l_file = _multi_module_file(tmp_path)
+    orm_db = _parse(a2l_file, "orm")
+    parallel_db = _parse(a2l_file, engine, workers=2)
+    try:
+        assert _row_counts(parallel_db) == _row_counts(orm_db)
+        assert _render_a2l(parallel_db.session, "latin-1") == _render_a2l(orm_db.session, "latin-1")
+        meas = [m.module.name for m in parallel_db.session.query(model.Measurement).order_by(model.Measurement.rid)]
+        assert meas == ["BulkModule0", "BulkModule1", "BulkModule2"]
+    finally:
+        orm_db.close()
+        parallel_db.close()
+
+
+def test_parallel_requires_bulk_engine(a2l_file):
+    with pytest.raises(ValueError, match="workers"):
+        _parse(a2l_file, "orm", workers=2)
+
+
+def test_unknown_engine(a2l_file):
+    with pytest.raises(ValueError, match="engine"):
+        _parse(a2l_file, "turbo")
+
+
+@pytest.mark.parametrize("vacuum", [False, True])
+@pytest.mark.parametrize("engine", ["orm", "bulk"])
+def test_memory_staging_matches_file(tmp_path, a2l_file, engine, vacuum):
+    reference = _parse(a2l_file, engine)
+    db = A2LParser().parse(
+        str(a2l_file), output_dir=tmp_path, progress_bar=False, loglevel="ERROR", engine=engine, staging="memory", vacuum=vacuum
+    )
+    try:
+        assert Path(db.dbname).exists()
+        assert _row_counts(db) == _row_counts(reference)
+        assert _render_a2l(db.session, "latin-1") == _render_a2l(reference.session, "latin-1")
+    finally:
+        reference.close()
+        db.close()
+
+
+def test_save_as(tmp_path, a2l_file):
+    db = _parse(a2l_file, "orm")
+    try:
+        for vacuum in (False, True):
+            target = tmp_path / f"copy_{vacuum}.a2ldb"
+            target.write_bytes(b"stale")  # Existing files are replaced.
+            db.save_as(str(target), vacuum=vacuum)
+            copy = model.A2LDatabase(str(target))
+            try:
+                assert _row_counts(copy) == _row_counts(db)
+            finally:
+                copy.close()
+        target = tmp_path / "copy_False.a2ldb"
+        valid = target.read_bytes()
+        db.session.connection().connection.driver_connection.execute("PRAGMA query_only = ON")
+        with pytest.raises(OperationalError):
+            db.save_as(str(target), vacuum=True)
+        db.session.connection().connection.driver_connection.execute("PRAGMA query_only = OFF")
+        assert target.read_bytes() == valid  # A failed copy leaves the existing file alone.
+        assert sorted(path.name for path in tmp_path.glob("copy_False*")) == ["copy_False.a2ldb"]
+    finally:
+        db.close()
+
+
+def test_save_as_rejects_own_file(tmp_path, a2l_file):
+    db = model.A2LDatabase(str(tmp_path / "own.a2ldb"))
+    try:
+        with pytest.raises(ValueError, match="onto itself"):
+            db.save_as(str(tmp_path / "own.a2ldb"))
+        assert (tmp_path / "own.a2ldb").exists()
+    finally:
+        db.close()
+
+
+def test_unknown_staging(a2l_file):
+    with pytest.raises(ValueError, match="staging"):
+        A2LParser().parse(str(a2l_file), progress_bar=False, loglevel="ERROR", staging="tape")
@@ -1,7 +1,11 @@
 import tempfile
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 from pya2l import DB
+from pya2l.api.cache import CacheLimits, estimate_size
 from pya2l.api.inspect import CachedBase, Project
 
 
@@ -60,6 +64,83 @@ def test_cached_base_no_cache_bypasses_cache():
     assert cached is cached_again
 
 
+class _OtherCached(_DummyCached):
+    pass
+
+
+@pytest.fixture
+def cache_limits():
+    CachedBase.clear()
+    saved = dict(CachedBase._cache_limits)
+    yield
+    CachedBase._cache_limits.clear()
+    CachedBase._cache_limits.update(saved)
+    CachedBase.clear()
+
+
+def test_cached_base_lru_eviction_and_stats(cache_limits):
+    _DummyCached.configure_cache(max_entries=2)
+    session = _DummySession()
+
+    a = _DummyCached.get(session, "a")
+    _DummyCached.get(session, "b")
+    assert _DummyCached.get(session, "a") is a  # "b" is now least recently used.
+    _DummyCached.get(session, "c")
+    assert _DummyCached.get(session, "a") is a
+    _DummyCached.get(session, "b")
+
+    stats = _DummyCached.cache_stats(session)["_DummyCached"]
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (2, 4, 2, 2)
+    assert stats.bytes == 0  # Sizes are only estimated under a byte limit.
+    assert stats.hit_rate == pytest.approx(1 / 3)
+    # Other classes keep the defaults.
+    for name in "abc":
+        _OtherCached.get(session, name)
+    other = CachedBase.cache_stats(session)["_OtherCached"]
+    assert (other.hits, other.misses, other.evictions, other.entries) == (0, 3, 0, 3)
+
+
+def test_cached_base_lfu_and_memory_limit(cache_limits):
+    session = _DummySession()
+    limits = _DummyCached.configure_cache(max_entries=3, policy="lfu")
+    assert limits == CacheLimits(max_entries=3, max_bytes=None, policy="lfu")
+
+    hot = _DummyCached.get(session, "hot")
+    for _ in range(3):
+        assert _DummyCached.get(session, "hot") is hot
+    for name in ("x", "y", "z"):
+        _DummyCached.get(session, name)
+    assert _DummyCached.get(session, "hot") is hot  # LRU would have evicted it.
+
+    _DummyCached.configure_cache(max_bytes=2**40)  # Estimates the sizes of the existing entries.
+    size = CachedBase.cache_stats()["_DummyCached"].bytes
+    assert size >= estimate_size(hot) > 0
+    _DummyCached.configure_cache(max_bytes=size - 1)  # Shrinks the existing cache.
+    stats = CachedBase.cache_stats()["_DummyCached"]
+    assert stats.entries == 2 and stats.bytes < size
+    assert _DummyCached.get(session, "hot") is hot
+
+    with pytest.raises(ValueError, match="policy"):
+        CachedBase.configure_cache(policy="fifo")
+
+
+def test_estimate_size_follows_nested_values():
+    class Holder:
+        def __init__(self, **kws):
+            self.__dict__.update(kws)
+
+    empty = estimate_size(Holder(values=[]))
+    array = np.zeros(100_000)
+    assert estimate_size(Holder(values=array)) - empty >= array.nbytes
+    assert estimate_size(Holder(values=[array[:50_000]])) - empty >= array.nbytes // 2  # Views count their data.
+    assert estimate_size(Holder(values=[[0.5] * 1000 for _ in range(100)])) - empty >= 100 * 1000 * 8
+    rows = {f"key{idx}": f"value {idx}" * 10 for idx in range(10_000)}
+    assert estimate_size(Holder(rows=rows)) > sum(len(key) + len(value) for key, value in rows.items())
+    assert estimate_size(Holder(session=Holder(big=array))) < array.nbytes  # Shared state isn't counted.
+    shared = [1.5] * 1000
+    assert estimate_size(Holder(a=shared, b=shared)) < 2 * estimate_size(Holder(a=shared))  # Counted once.
+
+
 def test_project_cache_isolation_between_different_a2l_files():
     """Regression test for issue #93: Cache should not leak between different A2L imports.
 
@@ -1,11 +1,14 @@
 import math
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pytest
 
-from pya2l.functions import _COMPUTE_AVAILABLE, Formula
+from pya2l.formula import NUMEXPR_AVAILABLE, compile_formula
+from pya2l.functions import Formula
 
 
-requires_compute = pytest.mark.skipif(not _COMPUTE_AVAILABLE, reason="requires pya2ldb[compute]")
+BACKENDS = ["numpy", pytest.param("numexpr", marks=pytest.mark.skipif(not NUMEXPR_AVAILABLE, reason="requires numexpr"))]
 
 
 def _approx(a, b, eps=1e-12):
@@ -14,8 +17,6 @@ def _approx(a, b, eps=1e-12):
     return abs(a - b) <= eps
 
 
-@pytest.mark.skip
-@requires_compute
 def test_current_mode_logical_tokens_and_bitwise():
     # current: &&, ||, ! are logical
     f = Formula("(X1 > 0) && (X2 < 0)")
@@ -34,13 +35,11 @@ def test_current_mode_logical_tokens_and_bitwise():
     assert f.int_to_physical(0x55AA, 0x2222) == (0x55AA ^ 0x2222)
 
 
-@requires_compute
 def test_current_mode_disallows_XOR_keyword():
     with pytest.raises(ValueError):
         Formula("X1 XOR X2")
 
 
-@requires_compute
 def test_current_mode_function_names_short_and_long():
     # accept short names and long numpy-style names equally
     f1 = Formula("asin(X1)")
@@ -58,7 +57,6 @@ def test_current_mode_function_names_short_and_long():
     assert _approx(f1.int_to_physical(0.5), f2.int_to_physical(0.5))
 
 
-@requires_compute
 def test_legacy_mode_logical_and_power_and_xor():
     # legacy: &, |, ~ are logical
     f = Formula("(X1 > 0) & (X2 < 0)", legacy=True)
@@ -81,14 +79,12 @@ def test_legacy_mode_logical_and_power_and_xor():
     assert f.int_to_physical(1, 0) == (1 ^ 0)
 
 
-@requires_compute
 def test_legacy_mode_disallows_current_tokens():
     for expr in ("X1 && X2", "X1 || X2", "!X1"):
         with pytest.raises(ValueError):
             Formula(expr, legacy=True)
 
 
-@requires_compute
 def test_legacy_mode_function_name_aliases():
     # arcos -> acos (eval) / arccos (numexpr); arcsin/arctan should be accepted
     f = Formula("arcos(X1)", legacy=True)
@@ -102,7 +98,6 @@ def test_legacy_mode_function_name_aliases():
     assert _approx(f.int_to_physical(0.5), math.atan(0.5))
 
 
-@requires_compute
 def test_pow_and_sysc_expansion_current_and_legacy():
     sysc = {"A": 2, "B": 5}
     f = Formula("pow(X1, X2) + sysc(A)", system_constants=sysc)
@@ -112,14 +107,19 @@ def test_pow_and_sysc_expansion_current_and_legacy():
     assert f.int_to_physical(2, 3) == (2**3) + 5
 
 
-@requires_compute
 def test_missing_inverse_raises():
     f = Formula("X1 + 1")
     with pytest.raises(NotImplementedError):
         f.physical_to_int(1)
 
 
-@requires_compute
+def test_unsupported_formula_is_reported_at_evaluation(caplog):
+    f = Formula("floor(X1)", inverse_formula="where(X1 > 0, X1, 0)")
+    assert f.int_to_physical(1.5).size == 0
+    assert f.physical_to_int(1.5).size == 0
+    assert "Unknown function 'floor'" in caplog.text
+
+
 def test_inverse_formula_works_current_and_legacy():
     # linear invertible example: y = 2*x + 3; x = (y - 3)/2
     f = Formula("2*X + 3", inverse_formula="(X - 3)/2")
@@ -140,7 +140,6 @@ def test_inverse_formula_works_current_and_legacy():
     assert f.physical_to_int(23) == 10
 
 
-@requires_compute
 def test_x_alias_and_spacing_pow_sysc():
     # X aliases X1
     f = Formula("pow( X , 2 ) + sysc( A )", system_constants={"A": 4})
@@ -149,3 +148,56 @@ def test_x_alias_and_spacing_pow_sysc():
     # legacy with carets-as-power
     f = Formula(" X ^ 3  + sysc( A )", legacy=True, system_constants={"A": 1})
     assert f.int_to_physical(2) == 8 + 1
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_compiled_formula(backend):
+    sysc = {"OFFSET": -3, "GAIN": 0.5}
+    f = compile_formula("pow(pow(X1, 2), 0.5) * GAIN + sysc(OFFSET) + 0x10", system_constants=sysc, backend=backend)
+    assert f.backend == backend and f.arity == 1
+    assert compile_formula("pow(pow(X1, 2), 0.5) * GAIN + sysc(OFFSET) + 0x10", system_constants=dict(sysc), backend=backend) is f
+    xs = np.arange(-100, 100, dtype="int16")
+    assert np.allclose(f(xs), np.abs(xs) * 0.5 - 3 + 16)
+    assert f(-4) == 15.0
+    assert compile_formula("X1 + sysc(OFFSET)", {"OFFSET": 1}, backend=backend)(1) == 2
+    assert compile_formula("X1 + sysc(OFFSET)", {"OFFSET": 2}, backend=backend)(1) == 3
+    assert compile_formula("X1 != 0 && X2 >= 1", backend=backend)(1, 1) is True
+    assert compile_formula("X1 && X2 || 0", backend=backend)(1, 2) is True  # Logical, not bitwise (1 & 2 == 0).
+    assert compile_formula("!X1", backend=backend)(1) is False  # Logical, not bitwise (~1 == -2).
+    assert compile_formula("!X1", backend=backend)(0) is True
+    assert compile_formula("!0", backend=backend)(5) is True
+    assert compile_formula("X1 && !X2", backend=backend)(1, 1) is False
+    assert compile_formula("X1 && !X2", backend=backend)(1, 0) is True
+    assert compile_formula("!X1 + 1", backend=backend)(0) == 2  # "!" binds tighter than "+".
+    assert compile_formula("!!X1 == 1 && X1 != !sin(X1)", backend=backend)(3) is True
+    assert list(compile_formula("!X1", backend=backend)(np.array([0, 2, -1]))) == [True, False, False]
+    assert compile_formula("X2", backend=backend).arity == 2
+    for invalid in ("X1 +", "__import__('os')", "X1.real", "Y1 + 1", "sin(X1, X2)", "sysc(MISSING)", "'abc'"):
+        with pytest.raises(ValueError):
+            compile_formula(invalid, backend=backend)
+
+
+def test_compiled_formula_backends_agree():
+    if not NUMEXPR_AVAILABLE:
+        pytest.skip("requires numexpr")
+    xs = np.linspace(0.1, 10.0, 1000)
+    for text in ("sqrt(X1) * log(X1) - exp(-X1)", "atan(X1) + acos(X1 / 20)", "pow(X1, 2) > 4 && X1 < 8 || !(X1 > 0)"):
+        by_numpy = compile_formula(text, backend="numpy")(xs)
+        assert np.allclose(compile_formula(text, backend="numexpr")(xs), by_numpy)
+
+
+def test_formula_thread_safety():
+    formulas = [Formula(f"X1 * {k} + X2", inverse_formula=f"(X1 - X2) / {k}") for k in range(1, 9)]
+    xs = np.arange(10_000, dtype="float64")
+
+    def convert(k):
+        formula = formulas[k % len(formulas)]
+        factor = k % len(formulas) + 1
+        for _ in range(50):
+            ys = formula.int_to_physical(xs, k)
+            if not (np.array_equal(ys, xs * factor + k) and np.allclose(formula.physical_to_int(ys, k), xs)):
+                return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(convert, range(64)))
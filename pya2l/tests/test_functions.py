@@ -794,14 +794,42 @@ def test_tab_verb_ranges_with_default_negative_vectorized():
     assert np.array_equal(tvr.int_to_physical(xs), ys)
 
 
-@requires_compute
+@pytest.mark.parametrize("dtype", [int, float])
+def test_lookup_tables_vectorized_match_scalar(dtype):
+    rng = np.random.default_rng(4711)
+    xs = rng.integers(-20, 120, 1000).astype(dtype)
+    if dtype is float:
+        xs = np.concatenate([xs + 0.5, [np.nan, 99.0, 100.0]])
+    tv = functions.LookupTable([(k, f"v{k}") for k in range(0, 100, 3)], default="none")
+    tvr = functions.LookupTableWithRanges([(0, 1, "a"), (2, 3, "b"), (18, 99, "c"), (100, 100, "d")], dtype=dtype)
+    tab = functions.LookupTable([(k, k * 0.5) for k in range(50, -1, -5)], default=-1)
+    for table in (tv, tvr, tab):
+        result = table.int_to_physical(xs)
+        assert isinstance(result, np.ndarray) and result.shape == xs.shape
+        assert list(result) == [table.int_to_physical(x) for x in xs]
+    texts = ["v3", "v99", "unknown", "v0"]
+    assert list(tv.physical_to_int(texts)) == [3, 99, None, 0]
+    assert list(tv.physical_to_int(t for t in texts)) == [3, 99, None, 0]
+    assert tv.physical_to_int(texts[:2]).dtype.kind == "i"
+    assert list(tvr.physical_to_int(["c", "x", "a"])) == [18, None, 0]
+    assert list(tab.physical_to_int([0.0, 12.5, 1.0])) == [0, 25, None]
+
+
+def test_linear_inv_vectorized():
+    rf = functions.Linear(Coeffs(4, -3, 0, 0, 0, 0))
+    ps = np.linspace(-1000.0, 1000.0, 101)
+    assert np.allclose(rf.physical_to_int(ps), (ps + 3) / 4)
+    assert np.allclose(rf.int_to_physical(rf.physical_to_int(list(ps))), ps)
+    with pytest.raises(exceptions.MathError):
+        functions.Linear(Coeffs(0, 1, 0, 0, 0, 0)).physical_to_int(ps)
+
+
 def test_formula_with_no_parameters_raises():
     form = functions.Formula("sin(X1)")
     result = form.int_to_physical()
     assert result.size == 0
 
 
-@requires_compute
 def test_formula_for_required_operations():
     form = functions.Formula("X1 + X2")
     assert form.int_to_physical(23.0, 42.0) == 65.0
@@ -833,7 +861,6 @@ def test_formula_for_required_operations():
 #    assert form(1, 0) == 0
 
 
-@requires_compute
 def test_formula_for_required_functions():
     form = functions.Formula("sin(X1)")
     assert form.int_to_physical(0.5) == 0.479425538604203
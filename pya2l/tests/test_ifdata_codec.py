@@ -0,0 +1,69 @@
+import pickle
+
+import pytest
+
+from pya2l import model
+from pya2l.a2lparser import A2LParser, store_parsed_ifdata
+from pya2l.aml import ifdata_codec
+from pya2l.tests.test_a2l_parser import XCP_ON_CAN_A2L
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        None,
+        {"XCP": [{"XCP_ON_CAN": [[0x0104, {"BAUDRATE": 500000, "MAX_DLC_REQUIRED": True, "SJW": -2}]]}]},
+        [1.5, -0.0, "Ä€", b"\x00\xff", False, [], [[2**70, -(2**70)]]],
+    ],
+)
+def test_roundtrip(value):
+    assert ifdata_codec.decode(ifdata_codec.encode(value)) == value
+
+
+def test_reject_foreign_data():
+    assert not ifdata_codec.is_encoded(b"")
+    assert not ifdata_codec.is_encoded(pickle.dumps({}))
+    with pytest.raises(ifdata_codec.IfDataCodecError):
+        ifdata_codec.decode(pickle.dumps({}))
+    with pytest.raises(ifdata_codec.IfDataCodecError):
+        ifdata_codec.decode(ifdata_codec.encode("truncated")[:-2])
+    with pytest.raises(TypeError):
+        ifdata_codec.encode({1, 2})
+
+
+def test_import_stores_parsed_ifdata(tmp_path):
+    a2l_file = tmp_path / "xcp_can.a2l"
+    a2l_file.write_text(XCP_ON_CAN_A2L, encoding="latin-1")
+    db = A2LParser().parse(str(a2l_file), in_memory=True, progress_bar=False, loglevel="ERROR")
+    stored_db = A2LParser().parse(str(a2l_file), in_memory=True, progress_bar=False, loglevel="ERROR", parse_ifdata=True)
+    try:
+        db.session.setup_ifdata_parser(loglevel="ERROR")
+        expected = db.session.parse_ifdata(db.session.query(model.Module).first().if_data)
+        assert expected and "XCP" in expected[0]
+
+        session = stored_db.session  # No IF_DATA parser set up: values must come from the database.
+        sections = session.query(model.Module).first().if_data
+        assert all(ifdata_codec.is_encoded(section.parsed) for section in sections)
+        assert [section.value for section in sections] == expected
+        assert session.parse_ifdata(sections) == expected
+    finally:
+        db.close()
+        stored_db.close()
+
+
+def test_store_parsed_ifdata_in_batches(tmp_path):
+    a2l_file = tmp_path / "xcp_can.a2l"
+    a2l_file.write_text(XCP_ON_CAN_A2L, encoding="latin-1")
+    db = A2LParser().parse(str(a2l_file), in_memory=True, progress_bar=False, loglevel="ERROR")
+    try:
+        session = db.session
+        session.add(model.IfData(raw=session.query(model.IfData).first().raw))  # At least two pages.
+        session.flush()
+        sections = session.query(model.IfData).order_by(model.IfData.rid).all()
+        assert len(sections) > 1
+        assert store_parsed_ifdata(session, "ERROR", batch_size=1) == len(sections)
+        session.expire_all()
+        assert all(ifdata_codec.is_encoded(section.parsed) for section in sections)
+    finally:
+        db.close()
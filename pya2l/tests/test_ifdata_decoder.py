@@ -0,0 +1,94 @@
+from pathlib import Path
+
+import pytest
+
+from pya2l import model
+from pya2l.a2lparser import A2LParser
+from pya2l.aml.ifdata_parser import IfDataParser, NativeIfDataParser, ParsingError
+from pya2l.tests.test_a2l_parser import XCP_ON_CAN_A2L
+
+
+EXAMPLES = Path(__file__).resolve().parents[2] / "examples"
+
+
+def _import(path):
+    return A2LParser().parse(str(path), in_memory=True, progress_bar=False, loglevel="ERROR")
+
+
+@pytest.fixture
+def xcp_can_db(tmp_path):
+    a2l_file = tmp_path / "xcp_can.a2l"
+    a2l_file.write_text(XCP_ON_CAN_A2L, encoding="latin-1")
+    db = _import(a2l_file)
+    yield db
+    db.close()
+
+
+@pytest.mark.parametrize("name", ["ASAP2_Demo_V161.a2l", "example-a2l-file.a2l", "vxcc0_etk.a2l"])
+def test_native_matches_python(name):
+    path = EXAMPLES / name
+    if not path.exists():
+        pytest.skip(f"{name} not available")
+    db = _import(path)
+    try:
+        python_parser = IfDataParser(db.session, "ERROR")
+        native_parser = NativeIfDataParser(db.session, "ERROR")
+        assert native_parser.root and python_parser.root
+        sections = [raw for (raw,) in db.session.query(model.IfData.raw)]
+        assert sections
+        expected = [python_parser.parse(section) for section in sections]
+        assert [native_parser.parse(section) for section in sections] == expected
+        assert native_parser.parse_many(sections) == expected
+    finally:
+        db.close()
+
+
+def test_native_session_parser(xcp_can_db):
+    session = xcp_can_db.session
+    sections = session.query(model.Module).first().if_data
+    session.setup_ifdata_parser(loglevel="ERROR", native=False)
+    expected = session.parse_ifdata(sections)
+    session.setup_ifdata_parser(loglevel="ERROR")
+    assert isinstance(session._ifdata_parser, NativeIfDataParser)
+    assert expected and session.parse_ifdata(sections) == expected
+
+
+def test_native_edge_cases(xcp_can_db):
+    parser = NativeIfDataParser(xcp_can_db.session, "CRITICAL")
+    reference = IfDataParser(xcp_can_db.session, "CRITICAL")
+    for section in (
+        "/begin IF_DATA /end IF_DATA",
+        "/begin IF_DATA XCP /end IF_DATA",
+        "/begin IF_DATA UNKNOWN 1 2 3 /end IF_DATA",
+        "/begin IF_DATA XCP /begin XCP_ON_CAN 0x0104 /* comment */ BAUDRATE 500000 /end XCP_ON_CAN /end IF_DATA",
+        "/begin IF_DATA XCP /begin XCP_ON_CAN 0x0104 BAUDRATE 1.5e3 ",
+    ):
+        try:
+            expected = reference.parse(section)
+        except ParsingError:
+            with pytest.raises(ParsingError):
+                parser.parse(section)
+            assert parser.parse_many([section]) == [None]
+        else:
+            assert parser.parse(section) == expected
+            assert parser.parse_many([section]) == [expected]
+    assert parser.parse_many([None, "/begin IF_DATA /end IF_DATA"]) == [None, {}]
+
+
+@pytest.mark.parametrize("workers, executor", [(1, "thread"), (3, "thread"), (2, "process")])
+def test_parse_ifdata_many(xcp_can_db, workers, executor):
+    session = xcp_can_db.session
+    session.setup_ifdata_parser(loglevel="ERROR", native=False)
+    sections = session.query(model.IfData).all() * 5
+    expected = [session.parse_ifdata([section]) or [None] for section in sections]
+    session.setup_ifdata_parser(loglevel="ERROR")
+    assert session.parse_ifdata_many(sections, workers=workers, executor=executor) == [value for (value,) in expected]
+    assert session.parse_ifdata_many([]) == []
+
+
+def test_compiled_decoder_cache(xcp_can_db):
+    first = NativeIfDataParser(xcp_can_db.session, "ERROR")
+    second = NativeIfDataParser(xcp_can_db.session, "ERROR")
+    assert first.decoder is second.decoder
+    with pytest.raises(ValueError, match="executor"):
+        first.parse_many([], executor="fiber")
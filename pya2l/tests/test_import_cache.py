@@ -0,0 +1,108 @@
+import os
+import time
+
+import pytest
+
+from pya2l import import_a2l, model
+from pya2l.import_cache import CACHE_ENV_VAR, ImportCache, import_key
+
+
+MAIN_A2L = """
+ASAP2_VERSION 1 71
+/begin PROJECT CacheProject ""
+  /begin MODULE CacheModule ""
+    // /include "commented_out.a2l"
+    /begin MEASUREMENT Main "/include in a string" UBYTE NO_COMPU_METHOD 0 0 0 255 ECU_ADDRESS 0x1000 /end MEASUREMENT
+    /include "measurements.a2l"
+  /end MODULE
+/end PROJECT
+"""
+
+INCLUDED_A2L = """
+    /begin MEASUREMENT Included "" UWORD NO_COMPU_METHOD 0 0 0 65535 ECU_ADDRESS 0x2000 /end MEASUREMENT
+"""
+
+
+@pytest.fixture
+def a2l_file(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "measurements.a2l").write_text(INCLUDED_A2L, encoding="latin-1")
+    result = source / "main.a2l"
+    result.write_text(MAIN_A2L, encoding="latin-1")
+    return result
+
+
+@pytest.fixture
+def restores(monkeypatch):
+    """Results of `ImportCache.restore()`, True for cache hits."""
+    result = []
+    restore = ImportCache.restore
+
+    def spy(self, key, db_name):
+        db = restore(self, key, db_name)
+        result.append(db is not None)
+        return db
+
+    monkeypatch.setattr(ImportCache, "restore", spy)
+    return result
+
+
+def _import(a2l_file, **kws):
+    return import_a2l(str(a2l_file), progress_bar=False, loglevel="ERROR", force_overwrite=True, **kws)
+
+
+def _measurements(session):
+    names = sorted(name for (name,) in session.query(model.Measurement.name))
+    session.close()
+    session._a2l_db_owner.close()
+    return names
+
+
+def test_key_covers_includes(tmp_path, a2l_file):
+    key = import_key(a2l_file, "latin-1")
+    copy = tmp_path / "copy"
+    copy.mkdir()
+    for path in a2l_file.parent.iterdir():
+        (copy / path.name).write_bytes(path.read_bytes())
+    assert import_key(copy / "main.a2l", "latin-1") == key  # Location independent.
+    assert import_key(a2l_file, "utf-8") != key
+    assert import_key(a2l_file, "latin-1", parse_ifdata=True) != key
+    (copy / "measurements.a2l").write_text(INCLUDED_A2L.replace("0x2000", "0x2002"), encoding="latin-1")
+    assert import_key(copy / "main.a2l", "latin-1") != key
+
+
+def test_import_uses_cache(tmp_path, a2l_file, restores):
+    cache = ImportCache(tmp_path / "cache")
+    assert _measurements(_import(a2l_file, cache=cache)) == ["Included", "Main"]
+    assert _measurements(_import(a2l_file, cache=cache)) == ["Included", "Main"]
+    assert _measurements(_import(a2l_file, cache=cache, in_memory=True)) == ["Included", "Main"]
+    assert restores == [False, True, True]
+    assert len(list(cache.directory.glob("*.a2ldb"))) == 1
+    (a2l_file.parent / "measurements.a2l").write_text(INCLUDED_A2L.replace("Included", "Changed"), encoding="latin-1")
+    assert _measurements(_import(a2l_file, cache=cache)) == ["Changed", "Main"]
+    assert restores[-1] is False
+
+
+def test_cache_from_environment(tmp_path, a2l_file, restores, monkeypatch):
+    monkeypatch.setenv(CACHE_ENV_VAR, str(tmp_path / "cache"))
+    _measurements(_import(a2l_file))
+    _measurements(_import(a2l_file))
+    assert restores == [False, True]
+
+
+def test_evict(tmp_path):
+    cache = ImportCache(tmp_path)
+    now = time.time()
+    for age, name in enumerate("abcd"):
+        path = cache.entry(name)
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (now - age * 100, now - age * 100))
+    stale = tmp_path / "e.a2ldb.0123.tmp"
+    stale.write_bytes(b"")
+    os.utime(stale, (now - 7200, now - 7200))
+    cache.max_age = 250
+    assert {path.name for path in cache.evict()} == {"d.a2ldb", stale.name}
+    cache.max_size = 200
+    assert [path.name for path in cache.evict()] == ["c.a2ldb"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.a2ldb", "b.a2ldb"]
@@ -0,0 +1,46 @@
+import json
+import subprocess  # nosec B404
+import sys
+
+import pytest
+
+
+IMPORT_TIME_BUDGET = 0.3  # Seconds for `import pya2l` in a fresh interpreter (eager imports took > 1 s).
+HEAVY_MODULES = ("pya2l.model", "pya2l.imex.a2l_exporter", "pya2l.imex.json_exporter", "sqlalchemy", "mako", "rich.traceback")
+
+
+def _import(statement: str) -> tuple[float, set[str]]:
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(json.dumps([time.perf_counter() - start, sorted(sys.modules)]))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True).stdout  # nosec B603
+    elapsed, modules = json.loads(output.splitlines()[-1])
+    return elapsed, set(modules)
+
+
+@pytest.mark.parametrize("statement", ["import pya2l", "import pya2l.imex", "from pya2l import import_a2l, MathError"])
+def test_import_is_lazy(statement):
+    _, modules = _import(statement)
+    assert not modules.intersection(HEAVY_MODULES)
+
+
+def test_import_time_budget():
+    elapsed = min(_import("import pya2l")[0] for _ in range(3))
+    assert elapsed < IMPORT_TIME_BUDGET, f"`import pya2l` took {elapsed:.3f}s (budget {IMPORT_TIME_BUDGET}s)"
+
+
+def test_lazy_attributes():
+    import pya2l
+    import pya2l.imex
+
+    assert pya2l.model.A2LDatabase is not None
+    assert pya2l.open_a2l_database is pya2l.imex.open_a2l_database
+    assert "ASAP2_VERSION" in pya2l.A2L_TEMPLATE
+    assert {"model", "export_a2l_db", "A2L_TEMPLATE"} <= set(dir(pya2l))
+    with pytest.raises(AttributeError):
+        pya2l.no_such_attribute
+    with pytest.raises(AttributeError):
+        pya2l.imex.no_such_attribute
@@ -0,0 +1,81 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from pya2l import model
+from pya2l.a2lparser import A2LParser
+from pya2l.imex import parallel
+from pya2l.imex.json_exporter import open_database, project_to_dict, write_json
+
+
+EXAMPLE = Path(__file__).resolve().parents[2] / "examples" / "ASAP2_Demo_V161.a2l"
+
+
+@pytest.fixture(scope="module")
+def db():
+    if not EXAMPLE.exists():
+        pytest.skip("ASAP2 demo file not available")
+    result = A2LParser().parse(str(EXAMPLE), in_memory=True, progress_bar=False, loglevel="ERROR")
+    yield result
+    result.close()
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_streamed_document_matches_project_to_dict(db, pretty):
+    expected = project_to_dict(db)
+    out = io.StringIO()
+    count = write_json(db, out, pretty=pretty)
+    if pretty:
+        assert out.getvalue() == json.dumps(expected, ensure_ascii=False, indent=4)
+    else:
+        assert out.getvalue() == json.dumps(expected, ensure_ascii=False, separators=(",", ":"))
+    assert count + 1 == write_json(db, io.StringIO(), format="ndjson")  # Records: PROJECT + MODULE + elements.
+
+
+@pytest.mark.parametrize("format", ["array", "ndjson"])
+def test_records(db, format):
+    out = io.StringIO()
+    count = write_json(db, out, format=format)
+    if format == "array":
+        records = json.loads(out.getvalue())
+    else:
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(records) == count
+    expected = project_to_dict(db)
+    project = records[0]
+    assert project["keyword"] == "PROJECT"
+    assert project["data"]["name"] == expected["name"]
+    module = expected["modules"][0]
+    assert records[1] == {"keyword": "MODULE", "module": module["name"], "data": records[1]["data"]}
+    assert records[1]["data"]["mod_par"] == module["mod_par"]
+    for keyword in ("MEASUREMENT", "RECORD_LAYOUT"):
+        assert [record["data"] for record in records if record["keyword"] == keyword] == module[keyword.lower()]
+    assert "record_layout" not in records[1]["data"]
+    assert {record["module"] for record in records[1:]} == {module["name"]}
+
+
+def test_module_filter_and_unknown_format(db):
+    out = io.StringIO()
+    assert write_json(db, out, module_name="NoSuchModule") == 0
+    assert json.loads(out.getvalue())["modules"] == []
+    with pytest.raises(ValueError, match="format"):
+        write_json(db, io.StringIO(), format="xml")
+
+
+@pytest.mark.parametrize("format", ["json", "ndjson"])
+def test_parallel_matches_serial(db, tmp_path, monkeypatch, format):
+    db.save_as(str(tmp_path / "demo.a2ldb"))
+    monkeypatch.setattr(parallel, "CHUNK_SIZE", 10)
+    file_db = open_database(tmp_path / "demo.a2ldb", "ERROR")
+    try:
+        module = file_db.session.query(model.Module).one()
+        assert len(parallel.section_chunks(file_db.session, module, "measurement")) > 1
+        expected = io.StringIO()
+        count = write_json(file_db, expected, format=format)
+        out = io.StringIO()
+        assert write_json(file_db, out, format=format, workers=2) == count
+    finally:
+        file_db.close()
+    assert out.getvalue() == expected.getvalue()
@@ -7,6 +7,7 @@ These tests verify the migration chain in A2LDatabase:
 
 import warnings
 
+import pytest
 import sqlalchemy
 from sqlalchemy.orm import sessionmaker
 
@@ -14,6 +15,7 @@ import pya2l.model as model
 from pya2l.model import (
     _MIGRATIONS,
     CURRENT_SCHEMA_VERSION,
+    INDEX_PACK,
     A2LDatabase,
     MetaData,
     _register_migration,
@@ -25,6 +27,15 @@ from pya2l.model import (
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _restore_migrations():
+    """The tests below replace registered steps; put the real ones back afterwards."""
+    saved = dict(_MIGRATIONS)
+    yield
+    _MIGRATIONS.clear()
+    _MIGRATIONS.update(saved)
+
+
 def _make_db_at_version(path, version: int) -> None:
     """Create a minimal .a2ldb file at the given schema version."""
     engine = sqlalchemy.create_engine(f"sqlite:///{path}")
@@ -149,3 +160,41 @@ def test_existing_database_open_can_skip_metadata_initialization(tmp_path):
         assert db.session.query(MetaData).first() is None
     finally:
         db.close()
+
+
+def _index_names(path) -> set[str]:
+    engine = sqlalchemy.create_engine(f"sqlite:///{path}")
+    with engine.connect() as connection:
+        names = {row[0] for row in connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    engine.dispose()
+    return names
+
+
+def test_migration_10_to_11_adds_index_pack(tmp_path):
+    """Databases created without the index pack get it when opened."""
+    db_path = tmp_path / "v10.a2ldb"
+    _make_db_at_version(db_path, 10)
+    engine = sqlalchemy.create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as connection:
+        for index in INDEX_PACK:
+            index.drop(connection)
+    engine.dispose()
+    pack = {index.name for index in INDEX_PACK}
+    assert not pack & _index_names(db_path)
+
+    db = A2LDatabase(str(db_path))
+    assert db.session.query(MetaData).first().schema_version == CURRENT_SCHEMA_VERSION
+    db.close()
+    assert pack <= _index_names(db_path)
+    assert "ix_measurement__module_rid_name" in pack and "ix_ecu_address__measurement_rid" in pack
+
+
+def test_optimize(tmp_path):
+    db_path = tmp_path / "optimize.a2ldb"
+    db = A2LDatabase(str(db_path))
+    db.session.add(model.Module(name="M", longIdentifier=""))
+    db.session.commit()
+    db.optimize()
+    tables = db.session.connection().exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'")
+    assert "sqlite_stat1" in {name for (name,) in tables}
+    db.close()
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pytest
+
+from pya2l import _render_a2l
+from pya2l.a2lparser import A2LParser
+
+
+EXAMPLE = Path(__file__).resolve().parents[2] / "examples" / "ASAP2_Demo_V161.a2l"
+
+
+def _dump(node):
+    return (
+        node.get_name(),
+        tuple(str(p) for p in node.parameters),
+        tuple(node.if_data),
+        tuple(_dump(kw) for kw in node.get_keywords()),
+    )
+
+
+@pytest.fixture
+def example() -> Path:
+    if not EXAMPLE.exists():
+        pytest.skip("ASAP2 demo file not available")
+    return EXAMPLE
+
+
+@pytest.mark.parametrize("token_buffer", ["memory", "mmap"])
+def test_token_buffer_matches_file(example, token_buffer):
+    from pya2l.a2lparser_ext import parse
+
+    counter, tree, tables, aml = parse(str(example), "latin-1", "ERROR")
+    counter2, tree2, tables2, aml2 = parse(str(example), "latin-1", "ERROR", token_buffer=token_buffer)
+    assert counter2 == counter
+    assert _dump(tree2) == _dump(tree)
+    assert tables2 == tables
+    assert aml2.text == aml.text
+    assert aml2.parsed == aml.parsed
+
+
+@pytest.mark.parametrize("engine", ["orm", "stream"])
+def test_import_memory_token_buffer(example, engine):
+    reference = A2LParser().parse(str(example), in_memory=True, progress_bar=False, loglevel="ERROR")
+    db = A2LParser().parse(str(example), in_memory=True, progress_bar=False, loglevel="ERROR", engine=engine, token_buffer="memory")
+    try:
+        assert _render_a2l(db.session, "latin-1") == _render_a2l(reference.session, "latin-1")
+    finally:
+        reference.close()
+        db.close()
+
+
+def test_unknown_token_buffer(example):
+    with pytest.raises(ValueError, match="token_buffer"):
+        A2LParser().parse(str(example), in_memory=True, progress_bar=False, loglevel="ERROR", token_buffer="tape")
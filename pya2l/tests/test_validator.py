@@ -2,11 +2,20 @@
 
 import gc
 import hashlib
+import time
 
 import pytest
 
 from pya2l.a2lparser import A2LParser
-from pya2l.api.validate import Category, Diagnostics, Level, Message, Validator
+from pya2l.api.validate import (
+    Category,
+    Diagnostics,
+    Level,
+    MemoryRange,
+    Message,
+    Validator,
+    memory_overlaps,
+)
 
 
 def _parse(tmp_path, a2l_content: str):
@@ -568,3 +577,93 @@ def test_measurement_with_ecu_address_is_valid(parsed_db):
     db = parsed_db(a2l)
     codes = _diag_codes(Validator(db.session)())
     assert Diagnostics.MISSING_ECU_ADDRESS not in codes
+
+
+# ---------------------------------------------------------------------------
+# OVERLAPPING_MEMORY checks
+# ---------------------------------------------------------------------------
+
+MEMORY_SNIPPET = """
+/begin MOD_PAR ""
+  /begin MEMORY_SEGMENT DataRam "" DATA RAM INTERN 0x1000 0x1000 -1 -1 -1 -1 -1
+  /end MEMORY_SEGMENT
+/end MOD_PAR
+/begin RECORD_LAYOUT RL_MAP_UWORD
+  NO_AXIS_PTS_X 1 UBYTE
+  NO_AXIS_PTS_Y 2 UBYTE
+  AXIS_PTS_X 3 UWORD INDEX_INCR DIRECT
+  AXIS_PTS_Y 4 UWORD INDEX_INCR DIRECT
+  FNC_VALUES 5 UWORD ROW_DIR DIRECT
+/end RECORD_LAYOUT
+"""
+
+
+def _measurement(name, address, datatype="UWORD", *keywords):
+    return "\n".join(
+        [f'/begin MEASUREMENT {name} "" {datatype} CM_LINEAR 0 0 0 100', f"ECU_ADDRESS {address:#x}", *keywords, "/end MEASUREMENT"]
+    )
+
+
+def _overlap_messages(parsed_db, *snippets):
+    db = parsed_db(_full_a2l(COMPU_METHOD_SNIPPET, RECORD_LAYOUT_SNIPPET, MEMORY_SNIPPET, *snippets))
+    return [m for m in Validator(db.session)() if m.diag_code == Diagnostics.OVERLAPPING_MEMORY]
+
+
+def test_overlapping_measurements(parsed_db):
+    msgs = _overlap_messages(parsed_db, _measurement("M1", 0x1000, "ULONG"), _measurement("M2", 0x1002), _measurement("M3", 0x1004))
+    assert len(msgs) == 1
+    assert msgs[0].type == Level.ERROR
+    assert msgs[0].category == Category.DUPLICATE
+    assert "MEASUREMENT 'M2' [0x1002, 0x1004) overlaps MEASUREMENT 'M1' [0x1000, 0x1004)" in msgs[0].text
+    assert "MEMORY_SEGMENT 'DataRam'" in msgs[0].text
+
+
+def test_overlap_sizes_from_matrix_dim_and_record_layout(parsed_db):
+    msgs = _overlap_messages(
+        parsed_db,
+        _measurement("ARR", 0x1000, "UWORD", "MATRIX_DIM 2 3"),  # 12 bytes
+        _measurement("AFTER_ARR", 0x100C),
+        """
+/begin CHARACTERISTIC MAP1 "" MAP 0x1100 RL_MAP_UWORD 0 CM_LINEAR 0 100
+  /begin AXIS_DESCR STD_AXIS NO_INPUT_QUANTITY CM_LINEAR 3 0 100 /end AXIS_DESCR
+  /begin AXIS_DESCR STD_AXIS NO_INPUT_QUANTITY CM_LINEAR 2 0 100 /end AXIS_DESCR
+/end CHARACTERISTIC
+""",  # 2 * UBYTE + 3 * UWORD + 2 * UWORD + 3 * 2 * UWORD = 24 bytes
+        _measurement("IN_MAP", 0x1116),
+        _measurement("AFTER_MAP", 0x1118),
+    )
+    assert [m.text.split(" overlaps ")[0].split(": ")[1] for m in msgs] == ["MEASUREMENT 'IN_MAP' [0x1116, 0x1118)"]
+
+
+def test_overlap_separated_by_extension_and_bit_mask(parsed_db):
+    msgs = _overlap_messages(
+        parsed_db,
+        _measurement("M1", 0x1000),
+        _measurement("M2", 0x1000, "UWORD", "ECU_ADDRESS_EXTENSION 1"),
+        _measurement("B1", 0x1010, "UWORD", "BIT_MASK 0x00FF"),
+        _measurement("B2", 0x1010, "UWORD", "BIT_MASK 0xFF00"),
+        _measurement("V1", 0x1000, "UWORD", "/begin VIRTUAL M1 /end VIRTUAL"),
+    )
+    assert msgs == []
+
+
+def test_memory_overlaps_behind_disjoint_bit_mask():
+    ranges = [
+        MemoryRange(0x100, 0x101, "MEASUREMENT", "A", bit_mask=1),
+        MemoryRange(0x100, 0x101, "MEASUREMENT", "B", bit_mask=2),
+        MemoryRange(0x100, 0x101, "MEASUREMENT", "C", bit_mask=2),
+        MemoryRange(0x100, 0x101, "MEASUREMENT", "D", bit_mask=4),
+    ]
+    assert [(first.name, second.name) for first, second in memory_overlaps(ranges)] == [("B", "C")]
+
+
+def test_memory_overlaps_sweep():
+    ranges = [MemoryRange(address * 4, address * 4 + 4, "MEASUREMENT", f"M{address}") for address in range(200_000)]
+    ranges.append(MemoryRange(0, 800_000, "BLOB", "WHOLE"))
+    ranges.append(MemoryRange(0, 800_000, "BLOB", "OTHER_SEGMENT", segment="ROM"))
+    start = time.perf_counter()
+    overlaps = memory_overlaps(reversed(ranges))
+    elapsed = time.perf_counter() - start
+    assert len(overlaps) == 200_000
+    assert all("WHOLE" in (first.name, second.name) for first, second in overlaps)
+    assert elapsed < 5.0